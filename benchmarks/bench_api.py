@@ -0,0 +1,265 @@
+"""
+Load test of the navigation read API on synthetic cycles of increasing size.
+
+For each ``--scale``, a synthetic cycle (see ``benchmarks.synthetic``) is loaded into a fresh scratch database the
+way ``promote_arinc_file`` loads it: parsed, fix references resolved, distances backfilled. Then every list, detail,
+custom and spatial action of ``navigation.views`` is driven through the Django test client, ``--concurrency``
+requests at a time, each on random records of the cycle. The streaming export, which reads the whole cycle, is
+left out. Each scale runs in a fresh process, so nothing cached by one is served to the next.
+
+For every endpoint, the latency percentiles, throughput and database queries per request are printed and, with
+``--output``, written as JSON to compare runs across releases. Response caching is disabled unless ``--cache`` is
+given, so the figures measure the views; ``--snapshots`` writes the cycle's snapshot and serves lookups from it.
+
+Usage:
+    python -m benchmarks.bench_api [--scales small regional] [--requests 300] [--concurrency 8] [--cache]
+        [--snapshots] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import django
+import numpy as np
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from benchmarks.synthetic import SCALES, write_cycle  # noqa: E402
+from data_processor.parsers import BulkARINCParser  # noqa: E402
+from data_processor.postprocess import backfill_geodesy, resolve_fix_references  # noqa: E402
+from data_processor.readers import iter_records  # noqa: E402
+from navigation.geodesy import CoordinateTable  # noqa: E402
+from navigation.models import Airport, Airway, AirwaySegment, DataCycle, Navaid, Procedure, Waypoint  # noqa: E402
+from navigation.snapshots import write_snapshot  # noqa: E402
+
+
+def seed(path: str) -> DataCycle:
+    """Load a synthetic cycle file the way ``promote_arinc_file`` does."""
+    cycle = DataCycle.objects.create(
+        cycle_id="2601", effective_date="2026-01-22", expiry_date="2026-02-19", source="SYNTHETIC", status="READY"
+    )
+    BulkARINCParser(cycle, batch_size=settings.ARINC_BULK_BATCH_SIZE).parse_records(iter_records(path))
+    resolve_fix_references(cycle)
+    backfill_geodesy(cycle, CoordinateTable.for_cycle(cycle))
+    return cycle
+
+
+def workload(cycle: DataCycle, count: int, rng: np.random.Generator) -> dict[str, list[tuple]]:
+    """Return ``count`` requests per endpoint, as ``(method, path, query or body)``, on random records."""
+
+    def sample(queryset, field="pk"):
+        values = list(queryset.values_list(field, flat=True))
+        return [values[index] for index in rng.integers(0, len(values), count)]
+
+    airports = Airport.objects.filter(cycle=cycle)
+    waypoints = list(Waypoint.objects.filter(cycle=cycle).values_list("waypoint_id", "latitude", "longitude"))
+    points = [waypoints[index] for index in rng.integers(0, len(waypoints), count)]
+    airways = list(
+        AirwaySegment.objects.filter(airway__cycle=cycle)
+        .order_by("airway_id", "sequence_number")
+        .values_list("airway_id", "fix_identifier", "next_fix_identifier")
+    )
+    # First and last fix of each airway: a route always exists between them.
+    ends = {}
+    for airway_id, fix, next_fix in airways:
+        ends.setdefault(airway_id, [fix, next_fix])[1] = next_fix
+    ends = list(ends.values())
+
+    requests = {}
+    for prefix, queryset in [
+        ("airports", airports),
+        ("navaids", Navaid.objects.filter(cycle=cycle)),
+        ("waypoints", Waypoint.objects.filter(cycle=cycle)),
+        ("procedures", Procedure.objects.filter(cycle=cycle)),
+        ("airways", Airway.objects.filter(cycle=cycle)),
+    ]:
+        requests[f"{prefix} list"] = [("get", f"/navigation/{prefix}/", {})] * count
+        requests[f"{prefix} detail"] = [("get", f"/navigation/{prefix}/{pk}/", {}) for pk in sample(queryset)]
+    requests["airports procedures"] = [
+        ("get", f"/navigation/airports/{pk}/procedures/", {})
+        for pk in sample(Procedure.objects.filter(cycle=cycle), "airport_id")
+    ]
+    requests["procedures legs"] = [
+        ("get", f"/navigation/procedures/{pk}/legs/", {}) for pk in sample(Procedure.objects.filter(cycle=cycle))
+    ]
+    requests["airways segments"] = [
+        ("get", f"/navigation/airways/{pk}/segments/", {}) for pk in sample(Airway.objects.filter(cycle=cycle))
+    ]
+    for prefix in ("airports", "navaids", "waypoints"):
+        requests[f"{prefix} nearest"] = [
+            ("get", f"/navigation/{prefix}/nearest/", {"lat": lat, "lon": lon, "radius": 50, "limit": 10})
+            for _, lat, lon in points
+        ]
+        requests[f"{prefix} bbox"] = [
+            (
+                "get",
+                f"/navigation/{prefix}/bbox/",
+                {
+                    "min_lat": max(lat - 1, -90),
+                    "min_lon": max(lon - 1, -180),
+                    "max_lat": min(lat + 1, 90),
+                    "max_lon": min(lon + 1, 180),
+                },
+            )
+            for _, lat, lon in points
+        ]
+    requests["route"] = [
+        ("get", "/navigation/route/", dict(zip(("origin", "destination"), ends[index], strict=True)))
+        for index in rng.integers(0, len(ends), count)
+    ]
+    requests["resolve"] = [
+        (
+            "post",
+            "/navigation/resolve/",
+            {"fixes": [waypoints[index][0] for index in rng.integers(0, len(waypoints), 20)]},
+        )
+        for _ in range(count)
+    ]
+    return requests
+
+
+def drive(requests: list[tuple], concurrency: int) -> dict:
+    """Send the requests from ``concurrency`` threads; return their latency, throughput and query figures."""
+    local = threading.local()
+
+    def send(request: tuple) -> tuple[float, int, int]:
+        method, path, data = request
+        if not hasattr(local, "client"):
+            local.client = Client()
+        queries = 0
+
+        def count(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            start = time.perf_counter()
+            if method == "post":
+                response = local.client.post(path, data, content_type="application/json")
+            else:
+                response = local.client.get(path, data)
+            elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200, f"{path} {data}: {response.status_code} {response.content[:200]!r}"
+        return elapsed, queries, len(response.content)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(send, requests))
+        elapsed = time.perf_counter() - start
+    latencies, queries, sizes = (np.array(values) for values in zip(*results, strict=True))
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        "requests": len(requests),
+        "throughput_rps": round(len(requests) / elapsed, 1),
+        "p50_ms": round(p50, 2),
+        "p95_ms": round(p95, 2),
+        "p99_ms": round(p99, 2),
+        "queries_mean": round(queries.mean(), 2),
+        "queries_max": int(queries.max()),
+        "bytes_mean": int(sizes.mean()),
+    }
+
+
+def run(scale: str, database: str, directory: str, args: argparse.Namespace) -> dict:
+    """Seed a cycle of the scale and drive every endpoint; called in a fresh process."""
+    connection.settings_dict["NAME"] = database
+    logging.disable(logging.INFO)
+    if not args.cache:
+        settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+    path = os.path.join(directory, f"{scale}.xml")
+    write_cycle(path, SCALES[scale], seed=args.seed)
+    cycle = seed(path)
+    if args.snapshots:
+        settings.NAVIGATION_SNAPSHOT_DIR = os.path.join(directory, "snapshots")
+        write_snapshot(cycle)
+
+    rng = np.random.default_rng(args.seed)
+    endpoints = {}
+    for name, requests in workload(cycle, args.requests, rng).items():
+        drive(requests[: args.concurrency * 2], args.concurrency)  # Warm up: encoders, the graph, the snapshot.
+        endpoints[name] = drive(requests, args.concurrency)
+    return {"scale": scale, "records": SCALES[scale].records, "endpoints": endpoints}
+
+
+def commit() -> str | None:
+    """Return the short hash of the checked out commit, or ``None`` outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Run the load test for each scale and print, and optionally write, the figures of every endpoint."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=["small", "regional"], help="Cycle sizes.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic cycles and of the workload.")
+    parser.add_argument("--requests", type=int, default=300, help="Requests sent to each endpoint.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight.")
+    parser.add_argument("--cache", action="store_true", help="Keep response caching enabled.")
+    parser.add_argument("--snapshots", action="store_true", help="Serve lookups from the cycle's snapshot.")
+    parser.add_argument("--output", type=Path, help="JSON file the results are written to.")
+    args = parser.parse_args()
+
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in args.scales:
+            # A file database: every thread serving requests opens its own connection to it.
+            connection.settings_dict["TEST"]["NAME"] = os.path.join(directory, f"{scale}.sqlite3")
+            old_name = connection.creation.create_test_db(verbosity=0)
+            try:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    result = pool.submit(run, scale, connection.settings_dict["NAME"], directory, args).result()
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+            runs.append(result)
+
+            print(f"{scale} cycle, {result['records']:,} records, {args.concurrency} concurrent requests")
+            print(f"{'endpoint':<22}{'req/sec':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'bytes':>9}")
+            for name, figures in result["endpoints"].items():
+                print(
+                    f"{name:<22}{figures['throughput_rps']:>9,.0f}{figures['p50_ms']:>9.1f}{figures['p95_ms']:>9.1f}"
+                    f"{figures['p99_ms']:>9.1f}{figures['queries_mean']:>9.1f}{figures['bytes_mean']:>9,}"
+                )
+
+    if args.output:
+        report = {
+            "commit": commit(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "cache": args.cache,
+            "snapshots": args.snapshots,
+            "runs": runs,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Load test of the navigation read endpoints, served by the WSGI and the ASGI application.
+
+Loads a synthetic cycle into a scratch database, then drives the same mix of detail, list and nearest requests
+through ``navdb_manager.wsgi`` to the DRF viewsets (one thread per concurrent request, as a threaded WSGI server
+runs them) and through ``navdb_manager.asgi`` to the async views of ``navigation.async_views`` (concurrent requests
+as tasks on one event loop). Both run in process, so the figures compare request handling, not HTTP servers.
+``--latency`` adds a delay to every database query, to model a database across the network. Response caching
+is disabled.
+
+Django 5.2 still runs the async ORM through ``sync_to_async``, so the async views hold a thread while they wait
+on the database too; compare the threads used by both paths as well as their throughput.
+
+Usage:
+    python -m benchmarks.bench_asgi [--records 20000] [--requests 2000] [--concurrency 50] [--threads 8]
+        [--latency 2]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+
+import django
+import numpy as np
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.asgi import get_asgi_application  # noqa: E402
+from django.core.wsgi import get_wsgi_application  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.backends.signals import connection_created  # noqa: E402
+
+from navigation.models import Airport, DataCycle, Navaid, Waypoint  # noqa: E402
+
+# Record types loaded: (URL prefix, model, natural identifier, constant field values).
+RECORDS = [
+    (
+        "airports",
+        Airport,
+        "airport_id",
+        {
+            "icao_code": "LFPG",
+            "name": "AIRPORT",
+            "city": "CITY",
+            "country": "FR",
+            "elevation": 100,
+            "magnetic_variation": "1E",
+        },
+    ),
+    ("navaids", Navaid, "navaid_id", {"name": "NAVAID", "navaid_type": "VOR", "frequency": Decimal("115.90")}),
+    ("waypoints", Waypoint, "waypoint_id", {"name": "WAYPOINT", "waypoint_type": "ENROUTE"}),
+]
+
+
+def load_cycle(records: int, rng: np.random.Generator) -> dict[str, list[int]]:
+    """Create a cycle with ``records`` airports, navaids and waypoints over Europe; return their ids."""
+    cycle = DataCycle.objects.create(
+        cycle_id="2601",
+        effective_date=date(2026, 1, 22),
+        expiry_date=date(2026, 2, 19),
+        source="bench",
+        status="READY",
+    )
+    ids = {}
+    for prefix, model, identifier, values in RECORDS:
+        latitudes = rng.uniform(35, 60, records)
+        longitudes = rng.uniform(-10, 30, records)
+        objects = []
+        for index, (latitude, longitude) in enumerate(zip(latitudes, longitudes, strict=True)):
+            record = model(
+                cycle=cycle,
+                latitude=Decimal(f"{latitude:.8f}"),
+                longitude=Decimal(f"{longitude:.8f}"),
+                **{identifier: f"{prefix[0].upper()}{index:06d}"},
+                **values,
+            )
+            record.update_grid_cell()
+            objects.append(record)
+        model.objects.bulk_create(objects, batch_size=2000)
+        ids[prefix] = list(model.objects.values_list("id", flat=True))
+    return ids
+
+
+def workload(ids: dict[str, list[int]], count: int, rng: np.random.Generator) -> list[tuple[str, str]]:
+    """Return ``(path, query string)`` pairs, relative to the API root: 60% detail, 20% list, 20% nearest."""
+    requests = []
+    for kind, prefix in zip(rng.choice(3, count, p=[0.6, 0.2, 0.2]), rng.choice(list(ids), count), strict=True):
+        if kind == 0:
+            requests.append((f"{prefix}/{rng.choice(ids[prefix])}/", ""))
+        elif kind == 1:
+            requests.append((f"{prefix}/", "page_size=50"))
+        else:
+            latitude, longitude = rng.uniform(36, 59), rng.uniform(-9, 29)
+            requests.append((f"{prefix}/nearest/", f"lat={latitude:.4f}&lon={longitude:.4f}&radius=30&limit=10"))
+    return requests
+
+
+def run_wsgi(requests: list[tuple[str, str]], threads: int) -> list[float]:
+    """Send the requests to the WSGI application from a pool of ``threads`` threads; return latencies in ms."""
+    application = get_wsgi_application()
+
+    def send(request: tuple[str, str]) -> float:
+        path, query = request
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": f"/navigation/{path}",
+            "QUERY_STRING": query,
+            "SERVER_NAME": "testserver",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "testserver",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": BytesIO(),
+        }
+        statuses = []
+        start = time.perf_counter()
+        body = b"".join(application(environ, lambda status, headers: statuses.append(status)))
+        elapsed = (time.perf_counter() - start) * 1000
+        assert statuses[0].startswith("200"), f"{path}?{query}: {statuses[0]} {body[:200]!r}"
+        return elapsed
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(send, requests))
+
+
+def run_asgi(requests: list[tuple[str, str]], concurrency: int) -> list[float]:
+    """Send the requests to the async views of the ASGI application, ``concurrency`` at a time; return ms."""
+    application = get_asgi_application()
+
+    async def send(path: str, query: str) -> float:
+        disconnected = asyncio.Event()
+        received = []
+
+        async def receive():
+            if not received:
+                received.append(True)
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # The client never disconnects; Django cancels this wait once the response is sent.
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        messages = []
+
+        async def send_message(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/navigation/async/{path}",
+            "raw_path": f"/navigation/async/{path}".encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", b"testserver")],
+            "server": ("testserver", 80),
+            "client": ("127.0.0.1", 0),
+        }
+        start = time.perf_counter()
+        await application(scope, receive, send_message)
+        elapsed = (time.perf_counter() - start) * 1000
+        status = messages[0]["status"]
+        assert status == 200, f"{path}?{query}: {status}"
+        return elapsed
+
+    async def main() -> list[float]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(request):
+            async with semaphore:
+                return await send(*request)
+
+        return await asyncio.gather(*(limited(request) for request in requests))
+
+    return asyncio.run(main())
+
+
+def add_latency(delay_ms: float):
+    """Return a ``connection_created`` receiver delaying every query of new connections by ``delay_ms``."""
+
+    def delay(execute, sql, params, many, context):
+        time.sleep(delay_ms / 1000)
+        return execute(sql, params, many, context)
+
+    def on_connection_created(sender, connection, **kwargs):
+        # A thread's connection is reopened for every request, keeping its wrappers.
+        if delay not in connection.execute_wrappers:
+            connection.execute_wrappers.append(delay)
+
+    return on_connection_created
+
+
+def measure(run) -> tuple[list[float], float, int]:
+    """Call ``run``; return its latencies, the elapsed seconds and the peak number of threads meanwhile."""
+    peak = threading.active_count()
+    stop = threading.Event()
+
+    def watch():
+        nonlocal peak
+        while not stop.wait(0.005):
+            peak = max(peak, threading.active_count())
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    start = time.perf_counter()
+    latencies = run()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    watcher.join()
+    # Not counting the main thread and the watcher.
+    return latencies, elapsed, peak - 2
+
+
+def main() -> None:
+    """Run the load test and print throughput, latency percentiles and threads used by both paths."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20_000, help="Airports, navaids and waypoints each.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests sent to each application.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight on the ASGI path.")
+    parser.add_argument("--threads", type=int, default=8, help="Worker threads of the WSGI path.")
+    parser.add_argument("--latency", type=float, default=2.0, help="Milliseconds added to every database query.")
+    args = parser.parse_args()
+
+    settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+    receiver = add_latency(args.latency)
+    with tempfile.TemporaryDirectory() as directory:
+        # A file database: every thread serving a request opens its own connection to it.
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(directory, "bench.sqlite3")
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            rng = np.random.default_rng(0)
+            requests = workload(load_cycle(args.records, rng), args.requests, rng)
+            if args.latency > 0:
+                connection_created.connect(receiver, weak=False)
+                connection.close()
+
+            print(f"{args.requests:,} requests, {args.latency:g} ms per query")
+            print(f"{'path':<26}{'req/sec':>10}{'p50 ms':>9}{'p99 ms':>9}{'threads':>9}")
+            for name, run in [
+                (f"WSGI, {args.threads} threads", lambda batch: run_wsgi(batch, args.threads)),
+                (f"ASGI, {args.concurrency} in flight", lambda batch: run_asgi(batch, args.concurrency)),
+            ]:
+                run(requests[:100])  # Warm up: URL resolution, encoders, the active cycle.
+                latencies, elapsed, threads = measure(lambda run=run: run(requests))
+                p50, p99 = np.percentile(latencies, [50, 99])
+                print(f"{name:<26}{len(latencies) / elapsed:>10,.0f}{p50:>9.1f}{p99:>9.1f}{threads:>9}")
+        finally:
+            connection_created.disconnect(receiver)
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
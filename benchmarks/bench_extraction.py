@@ -0,0 +1,79 @@
+"""
+Micro-benchmark of ARINC record field extraction.
+
+Compares the per-field ``Element.find`` lookups the parser used to run against the compiled
+single-pass ``RecordSchema`` plans, on the sample records from ``data_processor/tests/test_data.py``
+replicated to the requested number of records.
+
+Usage:
+    python -m benchmarks.bench_extraction [--records 100000]
+"""
+
+import argparse
+import copy
+import time
+import xml.etree.ElementTree as ET
+
+from data_processor.extraction import (
+    AIRPORT_SCHEMA,
+    AIRWAY_SCHEMA,
+    NAVAID_SCHEMA,
+    PROCEDURE_SCHEMA,
+    WAYPOINT_SCHEMA,
+    RecordSchema,
+)
+from data_processor.tests.test_data import cycle_xml, valid_airport_xml
+
+SCHEMAS = {
+    "AIRPORT": AIRPORT_SCHEMA,
+    "NAVAID": NAVAID_SCHEMA,
+    "WAYPOINT": WAYPOINT_SCHEMA,
+    "AIRWAY": AIRWAY_SCHEMA,
+    "APPROACH": PROCEDURE_SCHEMA,
+}
+
+
+def find_extract(schema: RecordSchema, element: ET.Element) -> dict:
+    """Extract a record the way ``ARINCParser`` did before compiled plans: one ``find`` per field."""
+    fields = {}
+    for name, path, converter in zip(schema.names, schema._paths, schema._converters, strict=True):
+        found = element.find(path)
+        text = found.text.strip() if found is not None and found.text else None
+        fields[name] = converter(text) if text is not None else None
+    return fields
+
+
+def sample_records(tag: str, count: int) -> list[ET.Element]:
+    """Replicate the sample records of one type from the test data to ``count`` elements."""
+    if tag == "AIRPORT":
+        samples = valid_airport_xml.findall(tag)
+    else:
+        samples = ET.fromstring(cycle_xml).findall(f".//{tag}")
+    return [copy.deepcopy(samples[i % len(samples)]) for i in range(count)]
+
+
+def timed(extract, schema: RecordSchema, records: list[ET.Element]) -> float:
+    """Return the wall time in seconds taken to extract every record."""
+    start = time.perf_counter()
+    for record in records:
+        extract(schema, record)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print records/sec for both extraction strategies."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000, help="Records per record type.")
+    args = parser.parse_args()
+
+    print(f"{'record':<10}{'find/sec':>14}{'compiled/sec':>16}{'speedup':>10}")
+    for tag, schema in SCHEMAS.items():
+        records = sample_records(tag, args.records)
+        assert find_extract(schema, records[0]) == schema.extract(records[0])
+        old = timed(find_extract, schema, records)
+        new = timed(lambda schema, record: schema.extract(record), schema, records)
+        print(f"{tag:<10}{args.records / old:>14,.0f}{args.records / new:>16,.0f}{old / new:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
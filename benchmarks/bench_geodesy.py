@@ -0,0 +1,113 @@
+"""
+Micro-benchmark of great-circle distance and course computation, and of writing the backfilled values.
+
+Compares a Python loop over ``navigation.spatial.great_circle_distance`` and ``math``-based initial bearings
+against the vectorized ``navigation.geodesy`` functions, on random pairs of points. Then writes a distance and
+course to each of ``--write-pairs`` airway segments of a scratch database, as ``backfill_geodesy`` does, with
+``bulk_update`` and with the ``executemany`` of ``data_processor.postprocess``.
+
+Usage:
+    python -m benchmarks.bench_geodesy [--pairs 1000000] [--write-pairs 20000]
+"""
+
+import argparse
+import math
+import os
+import time
+
+import django
+import numpy as np
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from data_processor.postprocess import UPDATE_BATCH_SIZE, _update  # noqa: E402
+from navigation.geodesy import haversine, initial_bearing  # noqa: E402
+from navigation.models import Airway, AirwaySegment, DataCycle  # noqa: E402
+from navigation.spatial import great_circle_distance  # noqa: E402
+
+
+def loop_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial true course of one pair of points, computed with ``math``."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_lambda = math.radians(lon2 - lon1)
+    y = math.sin(d_lambda) * math.cos(phi2)
+    x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(d_lambda)
+    return math.degrees(math.atan2(y, x)) % 360
+
+
+def write_segments(count: int, rng: np.random.Generator) -> tuple[float, float]:
+    """Return the seconds taken to write a distance and course to ``count`` segments, per write strategy."""
+    cycle = DataCycle.objects.create(
+        cycle_id="2601", effective_date="2026-01-22", expiry_date="2026-02-19", source="SYNTHETIC"
+    )
+    airway = Airway.objects.create(cycle=cycle, airway_id="J1", route_type="JETWAY")
+    AirwaySegment.objects.bulk_create(
+        (
+            AirwaySegment(airway=airway, sequence_number=index, fix_identifier="FIX", fix_type="WAYPOINT")
+            for index in range(count)
+        ),
+        batch_size=UPDATE_BATCH_SIZE,
+    )
+    result = {
+        "pks": np.fromiter(AirwaySegment.objects.order_by("pk").values_list("pk", flat=True), dtype=np.int64),
+        "distance": rng.uniform(1, 500, count).round(),
+        "course": rng.uniform(0, 359, count).round(),
+    }
+    expected = list(zip(result["distance"].astype(int).tolist(), result["course"].astype(int).tolist(), strict=True))
+
+    start = time.perf_counter()
+    segments = [
+        AirwaySegment(pk=pk, route_distance=distance, magnetic_course=course)
+        for pk, (distance, course) in zip(result["pks"].tolist(), expected, strict=True)
+    ]
+    AirwaySegment.objects.bulk_update(segments, ["route_distance", "magnetic_course"], batch_size=UPDATE_BATCH_SIZE)
+    old = time.perf_counter() - start
+    AirwaySegment.objects.update(route_distance=None, magnetic_course=None)
+
+    start = time.perf_counter()
+    _update(AirwaySegment, "route_distance", "magnetic_course", result, distance_decimals=0)
+    new = time.perf_counter() - start
+    assert list(AirwaySegment.objects.order_by("pk").values_list("route_distance", "magnetic_course")) == expected
+    return old, new
+
+
+def main() -> None:
+    """Run the benchmark and print pairs/sec for both strategies, computing and writing."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=1_000_000, help="Number of point pairs.")
+    parser.add_argument("--write-pairs", type=int, default=20_000, help="Number of segments written.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    lat1, lat2 = rng.uniform(-90, 90, (2, args.pairs))
+    lon1, lon2 = rng.uniform(-180, 180, (2, args.pairs))
+    points = list(zip(lat1.tolist(), lon1.tolist(), lat2.tolist(), lon2.tolist(), strict=True))
+
+    print(f"{'function':<18}{'loop pairs/sec':>16}{'numpy pairs/sec':>18}{'speedup':>10}")
+    for name, scalar, vectorized in (
+        ("distance", great_circle_distance, haversine),
+        ("initial bearing", loop_bearing, initial_bearing),
+    ):
+        start = time.perf_counter()
+        expected = [scalar(*point) for point in points]
+        old = time.perf_counter() - start
+        start = time.perf_counter()
+        result = vectorized(lat1, lon1, lat2, lon2)
+        new = time.perf_counter() - start
+        np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-6)
+        print(f"{name:<18}{args.pairs / old:>16,.0f}{args.pairs / new:>18,.0f}{old / new:>9.1f}x")
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        old, new = write_segments(args.write_pairs, rng)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    print(f"\n{'write':<18}{'bulk_update pairs/sec':>22}{'executemany pairs/sec':>23}{'speedup':>10}")
+    print(f"{connection.vendor:<18}{args.write_pairs / old:>22,.0f}{args.write_pairs / new:>23,.0f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
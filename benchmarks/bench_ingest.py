@@ -0,0 +1,179 @@
+"""
+Benchmark of ARINC ingestion on a synthetic cycle (see ``benchmarks.synthetic``).
+
+Three runs, each in a fresh process and database so that its peak memory and timings are its own:
+
+- ``extract``: streaming and field extraction of each section, as the staging tasks do, without the database;
+- ``parse``: ``BulkARINCParser.parse_records`` over the whole file, per section and for the final write;
+- ``ingest``: the ``process_arinc_file`` pipeline end to end, with the Celery tasks run eagerly.
+
+Every stage is measured by ``data_processor.profiling.IngestProfiler``: wall time, records/sec, queries, rows
+written and peak RSS. ``--save-baseline`` stores the results as JSON. Otherwise they are compared with the stored
+baseline, and a stage is flagged as a regression when its records/sec drop or its peak memory grows by more than
+``--tolerance``, or when it runs more queries; the exit status is then 1.
+
+Usage:
+    python -m benchmarks.bench_ingest [--scale small|regional|worldwide] [--runs extract parse ingest]
+        [--baseline benchmarks/baselines/ingest-<scale>.json] [--save-baseline] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from benchmarks.synthetic import SCALES, write_cycle  # noqa: E402
+from data_processor.extraction import RECORD_SCHEMAS  # noqa: E402
+from data_processor.models import ArincFile  # noqa: E402
+from data_processor.parsers import BulkARINCParser  # noqa: E402
+from data_processor.profiling import IngestProfiler  # noqa: E402
+from data_processor.readers import SECTION_RECORDS, iter_records  # noqa: E402
+from data_processor.tasks import process_arinc_file  # noqa: E402
+from navigation.models import DataCycle  # noqa: E402
+
+RUNS = ("extract", "parse", "ingest")
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+# Rates of stages shorter than this vary by a third from run to run, and are not compared.
+MIN_COMPARED_SECONDS = 0.5
+
+
+def extract(path: str) -> list[dict]:
+    """Stream and extract the records of each section, without writing them."""
+    profiler = IngestProfiler()
+    for section in SECTION_RECORDS:
+        with profiler.stage(f"extract {section}") as stage:
+            for record in stage.timed(iter_records(path, sections=[section]), "xml_parsing"):
+                RECORD_SCHEMAS[record.tag].extract_values(record)
+                stage.count()
+    return profiler.stages
+
+
+def parse(path: str) -> list[dict]:
+    """Parse the whole file in this process with ``BulkARINCParser``."""
+    cycle = DataCycle.objects.create(
+        cycle_id="2601", effective_date="2026-01-22", expiry_date="2026-02-19", source="SYNTHETIC"
+    )
+    profiler = IngestProfiler()
+    BulkARINCParser(cycle, batch_size=settings.ARINC_BULK_BATCH_SIZE, profiler=profiler).parse_records(
+        iter_records(path)
+    )
+    return profiler.stages
+
+
+def ingest(path: str) -> list[dict]:
+    """Run the ingestion pipeline on the file, with Celery tasks run eagerly."""
+    from navdb_manager.celery import celery
+
+    celery.conf.update(task_always_eager=True, task_eager_propagates=True)
+    settings.MEDIA_ROOT = os.path.dirname(path)
+    arinc_file = ArincFile.objects.create(file=os.path.basename(path))
+    process_arinc_file(arinc_file.id)
+    arinc_file.refresh_from_db()
+    if arinc_file.status != "COMPLETED":
+        raise RuntimeError(f"Ingestion failed: {arinc_file.processing_errors}")
+    for kind, report in arinc_file.cycle.validation_report["references"].items():
+        if report["unresolved"]:
+            print(f"warning: {report['unresolved']} unresolved {kind} references", file=sys.stderr)
+    return arinc_file.metrics["stages"]
+
+
+def run(kind: str, path: str, database: str) -> list[dict]:
+    """Run one benchmark against an already migrated database; called in a fresh process."""
+    connection.settings_dict["NAME"] = database
+    logging.disable(logging.INFO)
+    return {"extract": extract, "parse": parse, "ingest": ingest}[kind](path)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per stage that regressed against the baseline."""
+    regressions = []
+    for kind, stages in results.items():
+        previous = {stage["name"]: stage for stage in baseline.get(kind, [])}
+        for stage in stages:
+            before = previous.get(stage["name"])
+            if before is None:
+                continue
+            name = f"{kind}/{stage['name']}"
+            if stage["records"] and before["records_per_second"] and before["seconds"] >= MIN_COMPARED_SECONDS:
+                change = stage["records_per_second"] / before["records_per_second"] - 1
+                if change < -tolerance:
+                    regressions.append(
+                        f"{name}: {before['records_per_second']:,.0f} -> {stage['records_per_second']:,.0f} "
+                        f"records/sec ({change:+.0%})"
+                    )
+            change = stage["peak_rss_mb"] / before["peak_rss_mb"] - 1
+            if change > tolerance:
+                regressions.append(
+                    f"{name}: peak RSS {before['peak_rss_mb']:,.0f} -> {stage['peak_rss_mb']:,.0f} MB ({change:+.0%})"
+                )
+            if stage["queries"] > before["queries"]:
+                regressions.append(f"{name}: {before['queries']:,} -> {stage['queries']:,} queries")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmarks, print their stages and compare them with, or save them as, the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES, default="small", help="Size of the synthetic cycle.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic cycle.")
+    parser.add_argument("--runs", nargs="+", choices=RUNS, default=list(RUNS), help="Benchmarks to run.")
+    parser.add_argument("--baseline", type=Path, help="Baseline file; benchmarks/baselines/ingest-<scale>.json.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Relative change flagged as a regression.")
+    args = parser.parse_args()
+    baseline_path = args.baseline or BASELINE_DIR / f"ingest-{args.scale}.json"
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cycle.xml")
+        write_cycle(path, SCALES[args.scale], seed=args.seed)
+        print(f"{args.scale} cycle: {SCALES[args.scale].records:,} records, {os.path.getsize(path) / 1e6:,.1f} MB")
+
+        print(f"{'stage':<30}{'seconds':>9}{'records':>10}{'rec/sec':>11}{'queries':>9}{'rows':>10}{'peak MB':>9}")
+        for kind in args.runs:
+            connection.settings_dict["TEST"]["NAME"] = os.path.join(directory, f"{kind}.sqlite3")
+            old_name = connection.creation.create_test_db(verbosity=0)
+            try:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    results[kind] = pool.submit(run, kind, path, connection.settings_dict["NAME"]).result()
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+            for stage in results[kind]:
+                rate = f"{stage['records_per_second']:,.0f}" if stage["records"] else "-"
+                print(
+                    f"{kind + '/' + stage['name']:<30}{stage['seconds']:>9.2f}{stage['records']:>10,}{rate:>11}"
+                    f"{stage['queries']:>9,}{stage['rows_written']:>10,}{stage['peak_rss_mb']:>9,.0f}"
+                )
+            print(f"{kind + ' total':<30}{sum(stage['seconds'] for stage in results[kind]):>9.2f}")
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline saved to {baseline_path}")
+    elif baseline_path.exists():
+        regressions = compare(results, json.loads(baseline_path.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression against {baseline_path}")
+    else:
+        print(f"No baseline at {baseline_path}; store one with --save-baseline")
+
+
+if __name__ == "__main__":
+    main()
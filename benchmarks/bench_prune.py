@@ -0,0 +1,90 @@
+"""
+Benchmark of pruning an expired cycle while newer cycles stay in the database.
+
+``--cycles`` synthetic cycles (see ``benchmarks.synthetic``) are loaded into a scratch database the way
+``promote_arinc_file`` loads them, then the oldest is pruned table by table, children first, as ``prune_cycle``
+does. Deleting a fix makes the database check the segments and legs of every cycle that could reference it, so
+the time of each table shows whether those checks are index lookups or scans of the other cycles' records.
+
+Usage:
+    python -m benchmarks.bench_prune [--scale small|regional|worldwide] [--cycles 4] [--chunk-size 2000]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from benchmarks.synthetic import SCALES, write_cycle  # noqa: E402
+from data_processor.parsers import BulkARINCParser  # noqa: E402
+from data_processor.postprocess import resolve_fix_references  # noqa: E402
+from data_processor.readers import iter_records  # noqa: E402
+from navigation.models import DataCycle  # noqa: E402
+from navigation.retention import PRUNE_ORDER, _delete_in_chunks  # noqa: E402
+
+
+def load(path: str, cycle_id: str, effective_date: date) -> DataCycle:
+    """Load a synthetic cycle file and resolve its fix references, as ``promote_arinc_file`` does."""
+    cycle = DataCycle.objects.create(
+        cycle_id=cycle_id,
+        effective_date=effective_date,
+        expiry_date=effective_date + timedelta(days=28),
+        source="SYNTHETIC",
+    )
+    BulkARINCParser(cycle, batch_size=settings.ARINC_BULK_BATCH_SIZE).parse_records(iter_records(path))
+    resolve_fix_references(cycle)
+    return cycle
+
+
+def main() -> None:
+    """Load the cycles, prune the oldest and print the time spent on each table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES, default="small", help="Size of each synthetic cycle.")
+    parser.add_argument("--cycles", type=int, default=4, help="Cycles loaded, the pruned one included.")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Rows deleted per statement.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as directory:
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(directory, "prune.sqlite3")
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            path = os.path.join(directory, "cycle.xml")
+            cycles = []
+            start = time.perf_counter()
+            for index in range(args.cycles):
+                write_cycle(path, SCALES[args.scale], seed=index)
+                cycles.append(load(path, f"26{index + 1:02d}", date(2026, 1, 22) + timedelta(days=28 * index)))
+            print(
+                f"{args.cycles} {args.scale} cycles, {SCALES[args.scale].records:,} records each, "
+                f"loaded in {time.perf_counter() - start:.1f}s"
+            )
+
+            total = 0.0
+            print(f"{'table':<22}{'rows':>9}{'seconds':>9}{'rows/sec':>11}")
+            for model, lookup in PRUNE_ORDER:
+                start = time.perf_counter()
+                deleted = _delete_in_chunks(model, lookup, cycles[0], args.chunk_size)
+                elapsed = time.perf_counter() - start
+                total += elapsed
+                print(f"{model.__name__:<22}{deleted:>9,}{elapsed:>9.2f}{deleted / elapsed:>11,.0f}")
+            # Deleting the cycle clears its primary key.
+            name = str(cycles[0])
+            cycles[0].delete()
+            print(f"pruned cycle {name} in {total:.2f}s")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
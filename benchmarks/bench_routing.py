@@ -0,0 +1,81 @@
+"""
+Benchmark of airway route queries on a synthetic network.
+
+Builds a lattice of fixes covering a region of the globe, with an airway between neighbouring fixes and a share
+of the segments restricted to low or high altitudes, and times ``AirwayGraph.find_route`` between random fixes.
+
+Usage:
+    python -m benchmarks.bench_routing [--side 300] [--queries 200]
+"""
+
+import argparse
+import os
+import time
+
+import django
+import numpy as np
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from navigation.routing import NO_MAXIMUM_ALTITUDE, ROUTE_TYPES, AirwayGraph  # noqa: E402
+
+
+def lattice_graph(side: int, rng: np.random.Generator) -> AirwayGraph:
+    """Return a ``side`` x ``side`` lattice of fixes spread over 60 degrees of latitude and longitude."""
+    rows, columns = np.divmod(np.arange(side * side), side)
+    latitudes = -30 + 60 * rows / side + rng.uniform(-0.05, 0.05, side * side)
+    longitudes = -30 + 60 * columns / side + rng.uniform(-0.05, 0.05, side * side)
+    nodes = np.arange(side * side).reshape(side, side)
+    # Neighbours along rows, columns and both diagonals: real airway networks detour a few percent from the
+    # great circle, a plain grid would detour up to 41% and make every search explore far more fixes.
+    sources = np.concatenate(
+        (nodes[:, :-1].ravel(), nodes[:-1, :].ravel(), nodes[:-1, :-1].ravel(), nodes[:-1, 1:].ravel())
+    )
+    targets = np.concatenate(
+        (nodes[:, 1:].ravel(), nodes[1:, :].ravel(), nodes[1:, 1:].ravel(), nodes[1:, :-1].ravel())
+    )
+    count = len(sources)
+    minimums = np.where(rng.random(count) < 0.1, 18000, 0)
+    maximums = np.where(rng.random(count) < 0.1, 17999, NO_MAXIMUM_ALTITUDE)
+    route_types = rng.integers(0, len(ROUTE_TYPES), count)
+    airways = rng.integers(0, 1000, count)
+    return AirwayGraph(
+        "BENCH",
+        [("WAYPOINT", f"F{node}") for node in range(side * side)],
+        latitudes,
+        longitudes,
+        np.concatenate((sources, targets)),
+        np.concatenate((targets, sources)),
+        np.concatenate((minimums, minimums)),
+        np.concatenate((maximums, maximums)),
+        np.concatenate((route_types, route_types)),
+        np.concatenate((airways, airways)),
+        [f"A{airway}" for airway in range(1000)],
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print route query latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--side", type=int, default=300, help="Fixes per side of the lattice.")
+    parser.add_argument("--queries", type=int, default=200, help="Number of random route queries.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    graph = lattice_graph(args.side, rng)
+    print(f"graph: {len(graph.keys):,} fixes, {graph.edge_count:,} edges, built in {time.perf_counter() - start:.2f}s")
+    graph.find_route("F0", "F1")  # Warm the search lists.
+
+    timings, found = [], 0
+    for origin, destination in rng.integers(0, len(graph.keys), (args.queries, 2)):
+        start = time.perf_counter()
+        found += graph.find_route(f"F{origin}", f"F{destination}", altitude=35000) is not None
+        timings.append((time.perf_counter() - start) * 1000)
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    print(f"{args.queries} queries, {found} routed: p50 {p50:.1f} ms, p95 {p95:.1f} ms, p99 {p99:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark of the list serialization paths of the navigation API.
+
+Renders the same rows through the DRF ``ModelSerializer`` and ``JSONRenderer``, as the API did, and through the
+``navigation.encoders.RowEncoder`` fast path, checks the bytes are identical and reports rows/sec for each.
+Rows are built in memory, so only serialization is measured, not the database.
+
+Usage:
+    python -m benchmarks.bench_serializers [--rows 100000]
+"""
+
+import argparse
+import os
+import time
+from decimal import Decimal
+
+import django
+import numpy as np
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "navdb_manager.settings")
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from navigation.encoders import RowEncoder  # noqa: E402
+from navigation.models import Airport, Navaid, ProcedureLeg, Waypoint  # noqa: E402
+from navigation.serializers import (  # noqa: E402
+    AirportSerializer,
+    NavaidSerializer,
+    ProcedureLegSerializer,
+    WaypointSerializer,
+)
+
+
+def coordinates(rng: np.random.Generator, count: int) -> list[tuple[Decimal, Decimal]]:
+    """Return ``count`` random positions as the decimals the database would return."""
+    latitudes = rng.uniform(-90, 90, count).round(8)
+    longitudes = rng.uniform(-180, 180, count).round(8)
+    return [(Decimal(f"{lat:.8f}"), Decimal(f"{lon:.8f}")) for lat, lon in zip(latitudes, longitudes, strict=True)]
+
+
+def make_records(count: int) -> dict:
+    """Build unsaved records of each benchmarked model, with the decimal values the database would return."""
+    rng = np.random.default_rng(0)
+    airports = [
+        Airport(
+            id=i + 1,
+            cycle_id="2501",
+            airport_id=f"K{i:05d}",
+            icao_code=f"K{i % 1000:03d}",
+            name=f"AIRPORT {i}",
+            city="CITY",
+            state="NY" if i % 2 else None,
+            country="US",
+            latitude=lat,
+            longitude=lon,
+            elevation=i % 5000,
+            magnetic_variation="13W",
+            transition_altitude=18000 if i % 3 else None,
+        )
+        for i, (lat, lon) in enumerate(coordinates(rng, count))
+    ]
+    navaids = [
+        Navaid(
+            id=i + 1,
+            cycle_id="2501",
+            navaid_id=f"N{i:05d}",
+            name=f"NAVAID {i}",
+            navaid_type="VOR/DME",
+            latitude=lat,
+            longitude=lon,
+            frequency=Decimal("115.90"),
+            elevation=12,
+            magnetic_variation="13W",
+            dme_latitude=lat,
+            dme_longitude=lon,
+        )
+        for i, (lat, lon) in enumerate(coordinates(rng, count))
+    ]
+    waypoints = [
+        Waypoint(
+            id=i + 1,
+            cycle_id="2501",
+            waypoint_id=f"W{i:05d}",
+            name=f"WAYPOINT {i}",
+            waypoint_type="ENROUTE",
+            latitude=lat,
+            longitude=lon,
+        )
+        for i, (lat, lon) in enumerate(coordinates(rng, count))
+    ]
+    legs = [
+        ProcedureLeg(
+            sequence_number=i,
+            waypoint_identifier=f"W{i:05d}",
+            waypoint_type="IAF",
+            latitude=lat,
+            longitude=lon,
+            altitude_constraint="3000A",
+            course=i % 360,
+            distance=Decimal("12.50"),
+        )
+        for i, (lat, lon) in enumerate(coordinates(rng, count))
+    ]
+    return {
+        "airports": (AirportSerializer, airports),
+        "navaids": (NavaidSerializer, navaids),
+        "waypoints": (WaypointSerializer, waypoints),
+        "procedure legs": (ProcedureLegSerializer, legs),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print rows/sec for both serialization paths."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per response.")
+    args = parser.parse_args()
+
+    renderer = JSONRenderer()
+    print(f"{'serializer':<16}{'DRF rows/sec':>14}{'encoder rows/sec':>18}{'speedup':>10}")
+    for name, (serializer_class, records) in make_records(args.rows).items():
+        encoder = RowEncoder(serializer_class)
+        # values_list() rows: the serializer's sources read off each record, foreign keys as their id.
+        rows = [tuple(record.serializable_value(source) for source in encoder.columns) for record in records]
+
+        start = time.perf_counter()
+        expected = renderer.render(serializer_class(records, many=True).data)
+        old = time.perf_counter() - start
+        start = time.perf_counter()
+        encoded = encoder.encode(rows)
+        new = time.perf_counter() - start
+        assert encoded == expected, f"{name}: encoder output differs from the serializer's"
+        print(f"{name:<16}{args.rows / old:>14,.0f}{args.rows / new:>18,.0f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
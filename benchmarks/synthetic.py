@@ -0,0 +1,265 @@
+"""
+Deterministic generator of synthetic ARINC 424 XML cycles, from a few hundred records up to worldwide scale.
+
+Airports, navaids and waypoints are spread over the inhabited latitudes. Fixes are ordered in strips of one degree
+of longitude, by latitude, so consecutive fixes are close together: each airway runs along a stretch of that
+ordering, and the procedures of an airport follow the fixes next to it. Every airway and procedure references fixes
+that exist in the file, half of the segments carry a route distance (the rest is left to ``backfill_geodesy``), and
+the same arguments always write the same bytes.
+
+Usage:
+    python -m benchmarks.synthetic cycle.xml [--scale small|regional|worldwide] [--seed 0]
+"""
+
+import argparse
+import math
+import os
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+# Procedures of each airport with procedures, as (record tag, procedure identifier).
+PROCEDURES = (("SID", "DEP1"), ("STAR", "ARR1"), ("APPROACH", "I01"), ("APPROACH", "R19"))
+TRANSITIONS_PER_PROCEDURE = 2
+LEGS_PER_TRANSITION = 5
+SEGMENTS_PER_AIRWAY = (5, 25)
+NAVAID_TYPES = ("VOR", "VOR/DME", "VORTAC", "NDB", "DME")
+ROUTE_TYPES = ("JETWAY", "VICTOR", "RNAV")
+
+
+@dataclass(frozen=True)
+class CycleSize:
+    """Number of records of each type; procedures are generated for the first ``procedure_airports`` airports."""
+
+    airports: int
+    navaids: int
+    waypoints: int
+    airways: int
+    procedure_airports: int
+
+    @property
+    def records(self) -> int:
+        """Expected number of records written, counting one per airway segment and procedure leg."""
+        segments = self.airways * sum(SEGMENTS_PER_AIRWAY) // 2
+        legs = self.procedure_airports * len(PROCEDURES) * TRANSITIONS_PER_PROCEDURE * LEGS_PER_TRANSITION
+        return self.airports + self.navaids + self.waypoints + segments + legs
+
+
+SCALES = {
+    "small": CycleSize(airports=400, navaids=150, waypoints=3_000, airways=100, procedure_airports=100),
+    "regional": CycleSize(airports=4_000, navaids=1_200, waypoints=30_000, airways=1_000, procedure_airports=1_000),
+    "worldwide": CycleSize(
+        airports=40_000, navaids=12_000, waypoints=300_000, airways=10_000, procedure_airports=10_000
+    ),
+}
+
+
+def identifier(index: int, length: int) -> str:
+    """Return the ``index``-th identifier of ``length`` capital letters: AAAA, AAAB, ..."""
+    letters = []
+    for _ in range(length):
+        index, letter = divmod(index, 26)
+        letters.append(chr(65 + letter))
+    return "".join(reversed(letters))
+
+
+def variation(degrees: float) -> str:
+    """Format a magnetic variation in whole degrees, e.g. ``3E`` or ``12W``."""
+    return f"{abs(round(degrees))}{'E' if degrees >= 0 else 'W'}"
+
+
+def distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two positions, in nautical miles."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 3440.065 * math.asin(math.sqrt(a))
+
+
+def write_cycle(
+    path: str | os.PathLike,
+    size: CycleSize,
+    seed: int = 0,
+    cycle: str = "2601",
+    effective_date: str = "2026-01-22",
+) -> None:
+    """
+    Write a synthetic cycle.
+
+    Args:
+        path (str | PathLike): File to write.
+        size (CycleSize): Number of records of each type, e.g. ``SCALES["worldwide"]``.
+        seed (int): Seed of the random generator; the same seed writes the same file.
+        cycle (str): Cycle identifier of the header.
+        effective_date (str): Effective date of the header, ``YYYY-MM-DD``.
+    """
+    rng = np.random.default_rng(seed)
+
+    def positions(count: int) -> tuple[np.ndarray, np.ndarray]:
+        # Uniform over the sphere between 56S and 72N.
+        latitudes = np.degrees(np.arcsin(rng.uniform(math.sin(math.radians(-56)), math.sin(math.radians(72)), count)))
+        return latitudes.round(6).tolist(), rng.uniform(-180, 180, count).round(6).tolist()
+
+    airports = (
+        [identifier(index, 4) for index in range(size.airports)],
+        *positions(size.airports),
+        rng.uniform(-20, 20, size.airports).tolist(),
+    )
+    navaids = (
+        [identifier(index, 3) for index in range(size.navaids)],
+        *positions(size.navaids),
+        rng.uniform(-20, 20, size.navaids).tolist(),
+    )
+    waypoints = ([identifier(index, 5) for index in range(size.waypoints)], *positions(size.waypoints))
+
+    # Navaids and waypoints in strips of one degree of longitude, south to north.
+    fix_types = np.array(["NAVAID"] * size.navaids + ["WAYPOINT"] * size.waypoints)
+    fix_ids = np.array(navaids[0] + waypoints[0])
+    fix_lats = np.concatenate([navaids[1], waypoints[1]])
+    fix_lons = np.concatenate([navaids[2], waypoints[2]])
+    strip_keys = np.floor(fix_lons) * 1000 + fix_lats
+    order = np.argsort(strip_keys, kind="stable")
+    strip_keys = strip_keys[order]
+    fixes = tuple(values[order].tolist() for values in (fix_types, fix_ids, fix_lats, fix_lons))
+
+    with open(path, "w", encoding="utf-8", newline="\n") as output:
+        write = output.write
+        write(f'<ARINC424 cycle="{cycle}" effective_date="{effective_date}">\n')
+        write("  <HEADER>\n    <DATA_SOURCE>SYNTHETIC</DATA_SOURCE>\n  </HEADER>\n")
+        _write_airports(write, airports)
+        _write_navaids(write, navaids)
+        _write_waypoints(write, waypoints)
+        _write_airways(write, rng, size.airways, fixes)
+        _write_procedures(write, airports, size.procedure_airports, fixes, strip_keys)
+        write("</ARINC424>\n")
+
+
+def _write_airports(write, airports: tuple) -> None:
+    """Write the AIRPORTS section from the identifiers, positions and magnetic variations of the airports."""
+    write("  <AIRPORTS>\n")
+    for index, (airport_id, latitude, longitude, magnetic) in enumerate(zip(*airports, strict=True)):
+        write(
+            f"    <AIRPORT><AIRPORT_IDENTIFIER>{airport_id}</AIRPORT_IDENTIFIER><ICAO_CODE>{airport_id}</ICAO_CODE>"
+            f"<AIRPORT_NAME>AIRPORT {airport_id}</AIRPORT_NAME><CITY_NAME>CITY {airport_id}</CITY_NAME>"
+            f"<COUNTRY_CODE>{airport_id[:2]}</COUNTRY_CODE>"
+            f"<POSITION><LATITUDE>{latitude:.6f}</LATITUDE><LONGITUDE>{longitude:.6f}</LONGITUDE></POSITION>"
+            f"<ELEVATION>{index % 5000}</ELEVATION><MAGNETIC_VARIATION>{variation(magnetic)}</MAGNETIC_VARIATION>"
+            f"<TRANSITION_ALTITUDE>{5000 + index % 4 * 1000}</TRANSITION_ALTITUDE>"
+            f"<LONGEST_RUNWAY>{3000 + index % 10000}</LONGEST_RUNWAY></AIRPORT>\n"
+        )
+    write("  </AIRPORTS>\n")
+
+
+def _write_navaids(write, navaids: tuple) -> None:
+    """Write the NAVAIDS section from the identifiers, positions and magnetic variations of the navaids."""
+    write("  <NAVAIDS>\n")
+    for index, (navaid_id, latitude, longitude, magnetic) in enumerate(zip(*navaids, strict=True)):
+        navaid_type = NAVAID_TYPES[index % len(NAVAID_TYPES)]
+        frequency = 190 + index % 345 if navaid_type == "NDB" else 108 + index % 200 * 0.05
+        dme = ""
+        if "DME" in navaid_type or navaid_type == "VORTAC":
+            dme = (
+                f"<DME_POSITION><LATITUDE>{latitude:.6f}</LATITUDE><LONGITUDE>{longitude:.6f}</LONGITUDE>"
+                f"<ELEVATION>{index % 3000}</ELEVATION></DME_POSITION>"
+            )
+        write(
+            f"    <NAVAID><NAVAID_IDENTIFIER>{navaid_id}</NAVAID_IDENTIFIER>"
+            f"<NAVAID_NAME>NAVAID {navaid_id}</NAVAID_NAME><NAVAID_TYPE>{escape(navaid_type)}</NAVAID_TYPE>"
+            f"<NAVAID_FREQUENCY>{frequency:.2f}</NAVAID_FREQUENCY>"
+            f"<POSITION><LATITUDE>{latitude:.6f}</LATITUDE><LONGITUDE>{longitude:.6f}</LONGITUDE></POSITION>"
+            f"<ELEVATION>{index % 3000}</ELEVATION><MAGNETIC_VARIATION>{variation(magnetic)}</MAGNETIC_VARIATION>"
+            f"{dme}</NAVAID>\n"
+        )
+    write("  </NAVAIDS>\n")
+
+
+def _write_waypoints(write, waypoints: tuple) -> None:
+    """Write the WAYPOINTS section from the identifiers and positions of the waypoints."""
+    write("  <WAYPOINTS>\n")
+    for index, (waypoint_id, latitude, longitude) in enumerate(zip(*waypoints, strict=True)):
+        write(
+            f"    <WAYPOINT><WAYPOINT_IDENTIFIER>{waypoint_id}</WAYPOINT_IDENTIFIER>"
+            f"<WAYPOINT_NAME>{waypoint_id}</WAYPOINT_NAME>"
+            f"<WAYPOINT_TYPE>{'TERMINAL' if index % 4 == 0 else 'ENROUTE'}</WAYPOINT_TYPE>"
+            f"<POSITION><LATITUDE>{latitude:.6f}</LATITUDE><LONGITUDE>{longitude:.6f}</LONGITUDE></POSITION>"
+            f"</WAYPOINT>\n"
+        )
+    write("  </WAYPOINTS>\n")
+
+
+def _write_airways(write, rng: np.random.Generator, count: int, fixes: tuple) -> None:
+    """Write the AIRWAYS section: ``count`` airways along random stretches of the fix ordering."""
+    fix_types, fix_ids, fix_lats, fix_lons = fixes
+    write("  <AIRWAYS>\n")
+    lengths = rng.integers(SEGMENTS_PER_AIRWAY[0], SEGMENTS_PER_AIRWAY[1] + 1, count)
+    starts = rng.integers(0, len(fix_ids) - SEGMENTS_PER_AIRWAY[1] - 1, count)
+    for index, (start, length) in enumerate(zip(starts.tolist(), lengths.tolist(), strict=True)):
+        route_type = ROUTE_TYPES[index % len(ROUTE_TYPES)]
+        airway_id = f"{route_type[0]}{index + 1}"
+        minimum, maximum = (18000, 45000) if route_type == "JETWAY" else (2000, 17500)
+        for sequence, fix in enumerate(range(start, start + length), 1):
+            distance = ""
+            if fix % 2:
+                route_distance = distance_nm(fix_lats[fix], fix_lons[fix], fix_lats[fix + 1], fix_lons[fix + 1])
+                distance = f"<ROUTE_DISTANCE>{round(route_distance)}</ROUTE_DISTANCE>"
+            write(
+                f"    <AIRWAY><ROUTE_IDENTIFIER>{airway_id}</ROUTE_IDENTIFIER><ROUTE_TYPE>{route_type}</ROUTE_TYPE>"
+                f"<SEQUENCE_NUMBER>{sequence * 10}</SEQUENCE_NUMBER>"
+                f"<FIX_IDENTIFIER>{fix_ids[fix]}</FIX_IDENTIFIER><FIX_TYPE>{fix_types[fix]}</FIX_TYPE>"
+                f"<NEXT_FIX_IDENTIFIER>{fix_ids[fix + 1]}</NEXT_FIX_IDENTIFIER>"
+                f"<NEXT_FIX_TYPE>{fix_types[fix + 1]}</NEXT_FIX_TYPE>{distance}"
+                f"<MINIMUM_ALTITUDE>{minimum}</MINIMUM_ALTITUDE><MAXIMUM_ALTITUDE>{maximum}</MAXIMUM_ALTITUDE>"
+                f"</AIRWAY>\n"
+            )
+    write("  </AIRWAYS>\n")
+
+
+def _write_procedures(write, airports: tuple, procedure_airports: int, fixes: tuple, strip_keys: np.ndarray) -> None:
+    """Write the PROCEDURES section of the first ``procedure_airports`` airports, along the fixes next to each."""
+    fix_types, fix_ids, fix_lats, fix_lons = fixes
+    write("  <PROCEDURES>\n")
+    legs = TRANSITIONS_PER_PROCEDURE * LEGS_PER_TRANSITION
+    airport_ids, airport_lats, airport_lons, _ = airports
+    for airport in range(procedure_airports):
+        airport_id = airport_ids[airport]
+        # The fixes following the airport in the strip ordering.
+        nearest = np.searchsorted(strip_keys, math.floor(airport_lons[airport]) * 1000 + airport_lats[airport])
+        first = min(int(nearest), len(fix_ids) - legs)
+        for tag, procedure_id in PROCEDURES:
+            for transition in range(TRANSITIONS_PER_PROCEDURE):
+                transition_id = "ALL" if transition == 0 else f"RW{(airport + transition) % 36 + 1:02d}"
+                for leg in range(LEGS_PER_TRANSITION):
+                    fix = first + transition * LEGS_PER_TRANSITION + leg
+                    waypoint_type = "NAVAID" if fix_types[fix] == "NAVAID" else "WAYPOINT"
+                    if tag == "APPROACH":
+                        waypoint_type = ("IAF", "IF", "FAF", "MAP", "WAYPOINT")[leg]
+                    write(
+                        f"    <{tag}><AIRPORT_IDENTIFIER>{airport_id}</AIRPORT_IDENTIFIER>"
+                        f"<PROCEDURE_IDENTIFIER>{procedure_id}</PROCEDURE_IDENTIFIER>"
+                        f"<TRANSITION_IDENTIFIER>{transition_id}</TRANSITION_IDENTIFIER>"
+                        f"<SEQUENCE_NUMBER>{(leg + 1) * 10}</SEQUENCE_NUMBER>"
+                        f"<WAYPOINT_IDENTIFIER>{fix_ids[fix]}</WAYPOINT_IDENTIFIER>"
+                        f"<WAYPOINT_TYPE>{waypoint_type}</WAYPOINT_TYPE>"
+                        f"<POSITION><LATITUDE>{fix_lats[fix]:.6f}</LATITUDE>"
+                        f"<LONGITUDE>{fix_lons[fix]:.6f}</LONGITUDE></POSITION>"
+                        f"<ALTITUDE_CONSTRAINT>{(LEGS_PER_TRANSITION - leg) * 1000}A</ALTITUDE_CONSTRAINT>"
+                        f"</{tag}>\n"
+                    )
+    write("  </PROCEDURES>\n")
+
+
+def main() -> None:
+    """Write a synthetic cycle and print its size."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="File to write.")
+    parser.add_argument("--scale", choices=SCALES, default="small", help="Number of records of each type.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    size = SCALES[args.scale]
+    write_cycle(args.path, size, seed=args.seed)
+    print(f"{args.path}: {size.records:,} records, {os.path.getsize(args.path) / 1e6:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import logging
+from collections.abc import Callable
+from xml.etree.ElementTree import Element
+
+logger = logging.getLogger(__name__)
+
+# Converter name used in "Invalid ... value" warnings.
+CONVERTER_NAMES = {float: "float", int: "integer"}
+
+_MISSING = object()
+
+
+class RecordSchema:
+    """
+    Declarative, precompiled field-extraction plan for one ARINC 424 record type.
+
+    Each field maps to a tag path and a typed converter. Paths follow ``Element.find`` syntax
+    for the forms used in ARINC files: ``TAG``, ``PARENT/TAG``, ``.//TAG`` and ``.//PARENT/TAG``.
+    The paths are compiled into tag lookup tables once, so extracting a record walks its
+    children in a single pass instead of running one ``find`` per field.
+
+    Attributes:
+        names (tuple[str, ...]): Field names, in the order values are returned by ``extract_values``.
+    """
+
+    def __init__(self, fields: dict[str, tuple[str, Callable[[str], object]]]) -> None:
+        self.names = tuple(fields)
+        self._paths = tuple(path for path, _ in fields.values())
+        self._converters = tuple(converter for _, converter in fields.values())
+        # Slots matched by tag for direct children, by tag below them, and by (parent tag, tag)
+        # pairs for grandchildren and deeper descendants.
+        self._top = {}
+        self._deep = {}
+        self._top_pairs = {}
+        self._deep_pairs = {}
+
+        for slot, path in enumerate(self._paths):
+            anywhere = path.startswith(".//")
+            parts = tuple(path.removeprefix(".//").split("/"))
+            if len(parts) == 1:
+                tables = (self._top, self._deep) if anywhere else (self._top,)
+                key = parts[0]
+            elif len(parts) == 2:
+                tables = (self._top_pairs, self._deep_pairs) if anywhere else (self._top_pairs,)
+                key = parts
+            else:
+                raise ValueError(f"Unsupported extraction path '{path}'")
+            for table in tables:
+                table.setdefault(key, []).append(slot)
+
+    def extract(self, element: Element) -> dict:
+        """Extract all fields of a record into a dict keyed by field name."""
+        return dict(zip(self.names, self.extract_values(element), strict=True))
+
+    def extract_values(self, element: Element) -> tuple:
+        """Extract all fields of a record into a tuple ordered like ``names``; missing fields are None."""
+        texts = [_MISSING] * len(self.names)
+        top = self._top
+        nested = self._top_pairs or self._deep
+        for child in element:
+            slots = top.get(child.tag)
+            if slots is not None:
+                for slot in slots:
+                    if texts[slot] is _MISSING:
+                        texts[slot] = child.text
+            if nested and len(child):
+                self._walk(child, self._top_pairs, texts)
+
+        values = []
+        for slot, text in enumerate(texts):
+            if text is _MISSING or text is None:
+                values.append(None)
+                continue
+            text = text.strip()
+            converter = self._converters[slot]
+            if converter is str:
+                values.append(text)
+                continue
+            try:
+                values.append(converter(text))
+            except ValueError:
+                name = CONVERTER_NAMES.get(converter, converter.__name__)
+                logger.warning(f"Invalid {name} value for tag '{self._paths[slot]}'")
+                values.append(None)
+        return tuple(values)
+
+    def _walk(self, parent: Element, pairs: dict, texts: list) -> None:
+        """Match the descendants of a record's child against the compiled paths; the first match wins."""
+        deep = self._deep
+        parent_tag = parent.tag
+        for child in parent:
+            for slots in (deep.get(child.tag), pairs.get((parent_tag, child.tag))):
+                if slots is not None:
+                    for slot in slots:
+                        if texts[slot] is _MISSING:
+                            texts[slot] = child.text
+            if len(child):
+                self._walk(child, self._deep_pairs, texts)
+
+
+AIRPORT_SCHEMA = RecordSchema(
+    {
+        "airport_id": ("AIRPORT_IDENTIFIER", str),
+        "icao_code": ("ICAO_CODE", str),
+        "name": ("AIRPORT_NAME", str),
+        "city": ("CITY_NAME", str),
+        "state": ("STATE_CODE", str),
+        "country": ("COUNTRY_CODE", str),
+        "latitude": (".//LATITUDE", float),
+        "longitude": (".//LONGITUDE", float),
+        "elevation": ("ELEVATION", int),
+        "magnetic_variation": ("MAGNETIC_VARIATION", str),
+        "transition_altitude": ("TRANSITION_ALTITUDE", int),
+        "transition_level": ("TRANSITION_LEVEL", int),
+        "longest_runway": ("LONGEST_RUNWAY", int),
+    }
+)
+
+NAVAID_SCHEMA = RecordSchema(
+    {
+        "navaid_id": ("NAVAID_IDENTIFIER", str),
+        "name": ("NAVAID_NAME", str),
+        "navaid_type": ("NAVAID_TYPE", str),
+        "frequency": ("NAVAID_FREQUENCY", float),
+        "latitude": (".//LATITUDE", float),
+        "longitude": (".//LONGITUDE", float),
+        "elevation": ("ELEVATION", int),
+        "magnetic_variation": ("MAGNETIC_VARIATION", str),
+        "dme_latitude": (".//DME_POSITION/LATITUDE", float),
+        "dme_longitude": (".//DME_POSITION/LONGITUDE", float),
+        "dme_elevation": (".//DME_POSITION/ELEVATION", int),
+        "service_volume": ("SERVICE_VOLUME", str),
+    }
+)
+
+WAYPOINT_SCHEMA = RecordSchema(
+    {
+        "waypoint_id": ("WAYPOINT_IDENTIFIER", str),
+        "name": ("WAYPOINT_NAME", str),
+        "waypoint_type": ("WAYPOINT_TYPE", str),
+        "latitude": (".//LATITUDE", float),
+        "longitude": (".//LONGITUDE", float),
+        "airspace_classification": ("AIRSPACE_CLASSIFICATION", str),
+    }
+)
+
+AIRWAY_SCHEMA = RecordSchema(
+    {
+        "airway_id": ("ROUTE_IDENTIFIER", str),
+        "route_type": ("ROUTE_TYPE", str),
+        "sequence_number": ("SEQUENCE_NUMBER", int),
+        "fix_identifier": ("FIX_IDENTIFIER", str),
+        "fix_type": ("FIX_TYPE", str),
+        "next_fix_identifier": ("NEXT_FIX_IDENTIFIER", str),
+        "next_fix_type": ("NEXT_FIX_TYPE", str),
+        "route_distance": ("ROUTE_DISTANCE", int),
+        "minimum_altitude": ("MINIMUM_ALTITUDE", int),
+        "maximum_altitude": ("MAXIMUM_ALTITUDE", int),
+        "magnetic_course": ("MAGNETIC_COURSE", int),
+        "reverse_magnetic_course": ("REVERSE_MAGNETIC_COURSE", int),
+    }
+)
+
+PROCEDURE_SCHEMA = RecordSchema(
+    {
+        "airport_id": ("AIRPORT_IDENTIFIER", str),
+        "procedure_id": ("PROCEDURE_IDENTIFIER", str),
+        "transition_id": ("TRANSITION_IDENTIFIER", str),
+        "sequence_number": ("SEQUENCE_NUMBER", int),
+        "waypoint_identifier": ("WAYPOINT_IDENTIFIER", str),
+        "waypoint_type": ("WAYPOINT_TYPE", str),
+        "latitude": (".//POSITION/LATITUDE", float),
+        "longitude": (".//POSITION/LONGITUDE", float),
+        "altitude_constraint": ("ALTITUDE_CONSTRAINT", str),
+        "speed_constraint": ("SPEED_CONSTRAINT", str),
+        "course": ("COURSE", int),
+        "distance": ("DISTANCE", float),
+    }
+)
+
+# Schema used to extract each record tag streamed by ``data_processor.readers.iter_records``.
+RECORD_SCHEMAS = {
+    "AIRPORT": AIRPORT_SCHEMA,
+    "NAVAID": NAVAID_SCHEMA,
+    "WAYPOINT": WAYPOINT_SCHEMA,
+    "AIRWAY": AIRWAY_SCHEMA,
+    "APPROACH": PROCEDURE_SCHEMA,
+    "SID": PROCEDURE_SCHEMA,
+    "STAR": PROCEDURE_SCHEMA,
+}
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('navigation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArincFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(upload_to='uploads/')),
+                ('uploaded_at', models.DateTimeField(auto_now_add=True)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PROCESSING', 'Processing'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('processing_errors', models.TextField(blank=True, null=True)),
+                ('checkpoint', models.JSONField(blank=True, default=dict, help_text='Staging progress per section: records and chunks staged, and whether the section is complete.')),
+                ('cycle', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='files', to='navigation.datacycle')),
+            ],
+            options={
+                'ordering': ['-uploaded_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StagedChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(max_length=20)),
+                ('index', models.IntegerField()),
+                ('rows', models.JSONField(help_text='[record tag, extracted values] pairs, in document order.')),
+                ('arinc_file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='staged_chunks', to='data_processor.arincfile')),
+            ],
+            options={
+                'ordering': ['arinc_file', 'section', 'index'],
+                'constraints': [models.UniqueConstraint(fields=('arinc_file', 'section', 'index'), name='unique_staged_chunk')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_processor', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arincfile',
+            name='metrics',
+            field=models.JSONField(blank=True, default=dict, help_text='Measurements of each ingestion stage: wall time, records, queries, rows written and peak memory.'),
+        ),
+    ]
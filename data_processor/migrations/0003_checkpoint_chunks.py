@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_processor', '0002_metrics'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='arincfile',
+            name='checkpoint',
+            field=models.JSONField(blank=True, default=dict, help_text='Staging plan: byte range and record count of every chunk of the file, and whether it is staged.'),
+        ),
+    ]
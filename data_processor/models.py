@@ -21,9 +21,37 @@ class ArincFile(models.Model):
         blank=True,
         related_name="files",
     )
+    checkpoint = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Staging plan: byte range and record count of every chunk of the file, and whether it is staged.",
+    )
+    metrics = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Measurements of each ingestion stage: wall time, records, queries, rows written and peak memory.",
+    )
 
     class Meta:
         ordering = ["-uploaded_at"]
 
     def __str__(self):
         return f"{self.file.name} - {self.status} - cycle {self.cycle}"
+
+
+class StagedChunk(models.Model):
+    """A chunk of extracted records of one section, staged until the file is promoted into ``navigation``."""
+
+    arinc_file = models.ForeignKey(ArincFile, on_delete=models.CASCADE, related_name="staged_chunks")
+    section = models.CharField(max_length=20)
+    index = models.IntegerField()
+    rows = models.JSONField(help_text="[record tag, extracted values] pairs, in document order.")
+
+    class Meta:
+        ordering = ["arinc_file", "section", "index"]
+        constraints = [
+            models.UniqueConstraint(fields=["arinc_file", "section", "index"], name="unique_staged_chunk"),
+        ]
+
+    def __str__(self):
+        return f"{self.arinc_file_id} - {self.section} - chunk {self.index}"
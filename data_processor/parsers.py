@@ -1,20 +1,48 @@
+import hashlib
 import logging
+from collections.abc import Iterable, Sequence
+from itertools import groupby
 from xml.etree.ElementTree import Element
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import transaction
+from django.db import connection, transaction
 
 from navigation.models import (
     Airport,
     Airway,
     AirwaySegment,
     DataCycle,
+    GridIndexed,
     Navaid,
     Procedure,
     Waypoint,
     ProcedureTransition,
     ProcedureLeg,
 )
+from .extraction import (
+    AIRPORT_SCHEMA,
+    AIRWAY_SCHEMA,
+    NAVAID_SCHEMA,
+    PROCEDURE_SCHEMA,
+    RECORD_SCHEMAS,
+    WAYPOINT_SCHEMA,
+)
+from .profiling import IngestProfiler
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Log label of the section each streamed record tag belongs to. The procedures of an airport are listed together,
+# so approaches, SIDs and STARs alternate within their section.
+RECORD_SECTIONS = {
+    "AIRPORT": "airports",
+    "NAVAID": "navaids",
+    "WAYPOINT": "waypoints",
+    "AIRWAY": "airways",
+    "APPROACH": "procedures",
+    "SID": "procedures",
+    "STAR": "procedures",
+}
 
 
 class ARINCParser:
@@ -24,11 +52,13 @@ class ARINCParser:
     Attributes:
         data_cycle (DataCycle): The current data cycle to associate parsed objects with.
         logger (logging.Logger): Logger instance for logging parsing activities.
+        profiler (IngestProfiler): Profiler measuring each section of ``parse_rows`` as a stage, and the final write.
     """
 
-    def __init__(self, data_cycle: DataCycle) -> None:
+    def __init__(self, data_cycle: DataCycle, profiler: IngestProfiler | None = None) -> None:
         self.data_cycle = data_cycle
         self.logger = logging.getLogger(__name__)
+        self.profiler = profiler if profiler is not None else IngestProfiler()
 
     def parse_file(self, root: Element) -> None:
         """
@@ -46,32 +76,67 @@ class ARINCParser:
                 self._parse_waypoints(root.find("WAYPOINTS"))
                 self._parse_airways(root.find("AIRWAYS"))
                 self._parse_procedures(root.find("PROCEDURES"))
+                self._flush()
             except Exception as e:
                 self.logger.error("Parsing failed — rolling back transaction.")
                 raise  # Re-raise to trigger rollback
 
-    def _get_text(self, parent: Element, tag: str) -> str | None:
-        """Extract text from an XML element's child tag, if available."""
-        element = parent.find(tag)
-        return element.text.strip() if element is not None and element.text else None
+    def parse_records(self, records: Iterable[Element]) -> None:
+        """
+        Parse a stream of ARINC 424 records within a DB transaction.
 
-    def _get_float(self, parent: Element, tag: str) -> str | None:
-        """Extract a float from an XML tag, if available."""
-        try:
-            text = self._get_text(parent, tag)
-            return float(text) if text is not None else None
-        except ValueError:
-            self.logger.warning(f"Invalid float value for tag '{tag}'")
-            return None
-
-    def _get_int(self, parent: Element, tag: str) -> str | None:
-        """Extract an int from an XML tag, if available."""
-        try:
-            text = self._get_text(parent, tag)
-            return int(text) if text is not None else None
-        except ValueError:
-            self.logger.warning(f"Invalid integer value for tag '{tag}'")
-            return None
+        Records are handed to the per-record handlers one at a time, so the caller decides how much
+        of the file is held in memory (see ``data_processor.readers.iter_records``).
+        Rolls back the whole parsing operation if any step fails.
+
+        Args:
+            records (Iterable[Element]): AIRPORT, NAVAID, WAYPOINT, AIRWAY, APPROACH, SID and STAR elements.
+        """
+        self.parse_rows((record.tag, RECORD_SCHEMAS[record.tag].extract_values(record)) for record in records)
+
+    def parse_rows(self, rows: Iterable[tuple[str, Sequence]]) -> None:
+        """
+        Parse already extracted ARINC 424 records within a DB transaction.
+
+        Rolls back the whole parsing operation if any step fails.
+
+        Args:
+            rows (Iterable[tuple[str, Sequence]]): ``(record tag, values)`` pairs, with values ordered like the
+                ``names`` of the tag's schema in ``RECORD_SCHEMAS``.
+        """
+        with transaction.atomic():
+            try:
+                for section, section_rows in groupby(rows, key=lambda row: RECORD_SECTIONS[row[0]]):
+                    self.logger.info(f"Parsing {section}...")
+                    with self.profiler.stage(f"parse {section}") as stage:
+                        for tag, values in section_rows:
+                            self._load_record(tag, dict(zip(RECORD_SCHEMAS[tag].names, values, strict=True)))
+                            stage.count()
+                    metrics = self.profiler.stages[-1]
+                    self.logger.info(
+                        f"Finished parsing {section}: {metrics['records']} records in {metrics['seconds']:.2f}s"
+                    )
+                with self.profiler.stage("flush"):
+                    self._flush()
+            except Exception:
+                self.logger.error("Parsing failed — rolling back transaction.")
+                raise  # Re-raise to trigger rollback
+
+    def _load_record(self, tag: str, fields: dict) -> None:
+        """Store the extracted fields of one AIRPORT, NAVAID, WAYPOINT, AIRWAY, APPROACH, SID or STAR record."""
+        if tag == "AIRPORT":
+            self._load_airport(fields)
+        elif tag == "NAVAID":
+            self._load_navaid(fields)
+        elif tag == "WAYPOINT":
+            self._load_waypoint(fields)
+        elif tag == "AIRWAY":
+            self._load_airway(fields)
+        else:
+            self._load_procedure(fields, tag)
+
+    def _flush(self) -> None:
+        """Write any buffered records. Records are saved as they are parsed, so there is nothing to do."""
 
     def _parse_airports(self, airports_element: Element | None) -> None:
         if airports_element is None:
@@ -80,34 +145,23 @@ class ARINCParser:
 
         self.logger.info("Parsing airports...")
         for airport_elem in airports_element.findall("AIRPORT"):
-            airport_id = self._get_text(airport_elem, "AIRPORT_IDENTIFIER")
-            if not airport_id:
-                continue
-
-            try:
-                Airport.objects.get_or_create(
-                    cycle=self.data_cycle,
-                    airport_id=airport_id,
-                    defaults={
-                        "icao_code": self._get_text(airport_elem, "ICAO_CODE"),
-                        "name": self._get_text(airport_elem, "AIRPORT_NAME"),
-                        "city": self._get_text(airport_elem, "CITY_NAME"),
-                        "state": self._get_text(airport_elem, "STATE_CODE"),
-                        "country": self._get_text(airport_elem, "COUNTRY_CODE"),
-                        "latitude": self._get_float(airport_elem, ".//LATITUDE"),
-                        "longitude": self._get_float(airport_elem, ".//LONGITUDE"),
-                        "elevation": self._get_int(airport_elem, "ELEVATION"),
-                        "magnetic_variation": self._get_text(airport_elem, "MAGNETIC_VARIATION"),
-                        "transition_altitude": self._get_int(airport_elem, "TRANSITION_ALTITUDE"),
-                        "transition_level": self._get_int(airport_elem, "TRANSITION_LEVEL"),
-                        "longest_runway": self._get_int(airport_elem, "LONGEST_RUNWAY"),
-                    },
-                )
-            except Exception as e:
-                self.logger.error(f"Failed to parse airport '{airport_id}': {e}")
-                raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+            self._load_airport(AIRPORT_SCHEMA.extract(airport_elem))
         self.logger.info("Finished parsing airports")
 
+    def _load_airport(self, fields: dict) -> None:
+        airport_id = fields.pop("airport_id")
+        if not airport_id:
+            return
+
+        try:
+            self._save_airport(airport_id, fields)
+        except Exception as e:
+            self.logger.error(f"Failed to parse airport '{airport_id}': {e}")
+            raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+
+    def _save_airport(self, airport_id: str, fields: dict) -> None:
+        Airport.objects.get_or_create(cycle=self.data_cycle, airport_id=airport_id, defaults=fields)
+
     def _parse_navaids(self, navaids_element: Element | None) -> None:
         if navaids_element is None:
             self.logger.warning("No navaids element found")
@@ -115,33 +169,23 @@ class ARINCParser:
 
         self.logger.info("Parsing navaids...")
         for navaid_elem in navaids_element.findall("NAVAID"):
-            navaid_id = self._get_text(navaid_elem, "NAVAID_IDENTIFIER")
-            if not navaid_id:
-                continue
-
-            try:
-                Navaid.objects.get_or_create(
-                    cycle=self.data_cycle,
-                    navaid_id=navaid_id,
-                    defaults={
-                        "name": self._get_text(navaid_elem, "NAVAID_NAME"),
-                        "navaid_type": self._get_text(navaid_elem, "NAVAID_TYPE"),
-                        "frequency": self._get_float(navaid_elem, "NAVAID_FREQUENCY"),
-                        "latitude": self._get_float(navaid_elem, ".//LATITUDE"),
-                        "longitude": self._get_float(navaid_elem, ".//LONGITUDE"),
-                        "elevation": self._get_int(navaid_elem, "ELEVATION"),
-                        "magnetic_variation": self._get_text(navaid_elem, "MAGNETIC_VARIATION"),
-                        "dme_latitude": self._get_float(navaid_elem, ".//DME_POSITION/LATITUDE"),
-                        "dme_longitude": self._get_float(navaid_elem, ".//DME_POSITION/LONGITUDE"),
-                        "dme_elevation": self._get_int(navaid_elem, ".//DME_POSITION/ELEVATION"),
-                        "service_volume": self._get_text(navaid_elem, "SERVICE_VOLUME"),
-                    },
-                )
-            except Exception as e:
-                self.logger.error(f"Failed to parse navaid '{navaid_id}': {e}")
-                raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+            self._load_navaid(NAVAID_SCHEMA.extract(navaid_elem))
         self.logger.info("Finished parsing navaids")
 
+    def _load_navaid(self, fields: dict) -> None:
+        navaid_id = fields.pop("navaid_id")
+        if not navaid_id:
+            return
+
+        try:
+            self._save_navaid(navaid_id, fields)
+        except Exception as e:
+            self.logger.error(f"Failed to parse navaid '{navaid_id}': {e}")
+            raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+
+    def _save_navaid(self, navaid_id: str, fields: dict) -> None:
+        Navaid.objects.get_or_create(cycle=self.data_cycle, navaid_id=navaid_id, defaults=fields)
+
     def _parse_waypoints(self, waypoints_element: Element | None) -> None:
         if waypoints_element is None:
             self.logger.warning("No waypoints element found")
@@ -149,27 +193,23 @@ class ARINCParser:
 
         self.logger.info("Parsing waypoints...")
         for waypoint_elem in waypoints_element.findall("WAYPOINT"):
-            waypoint_id = self._get_text(waypoint_elem, "WAYPOINT_IDENTIFIER")
-            if not waypoint_id:
-                continue
-
-            try:
-                Waypoint.objects.get_or_create(
-                    cycle=self.data_cycle,
-                    waypoint_id=waypoint_id,
-                    defaults={
-                        "name": self._get_text(waypoint_elem, "WAYPOINT_NAME"),
-                        "waypoint_type": self._get_text(waypoint_elem, "WAYPOINT_TYPE"),
-                        "latitude": self._get_float(waypoint_elem, ".//LATITUDE"),
-                        "longitude": self._get_float(waypoint_elem, ".//LONGITUDE"),
-                        "airspace_classification": self._get_text(waypoint_elem, "AIRSPACE_CLASSIFICATION"),
-                    },
-                )
-            except Exception as e:
-                self.logger.error(f"Failed to parse waypoint '{waypoint_id}': {e}")
-                raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+            self._load_waypoint(WAYPOINT_SCHEMA.extract(waypoint_elem))
         self.logger.info("Finished parsing waypoints")
 
+    def _load_waypoint(self, fields: dict) -> None:
+        waypoint_id = fields.pop("waypoint_id")
+        if not waypoint_id:
+            return
+
+        try:
+            self._save_waypoint(waypoint_id, fields)
+        except Exception as e:
+            self.logger.error(f"Failed to parse waypoint '{waypoint_id}': {e}")
+            raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+
+    def _save_waypoint(self, waypoint_id: str, fields: dict) -> None:
+        Waypoint.objects.get_or_create(cycle=self.data_cycle, waypoint_id=waypoint_id, defaults=fields)
+
     def _parse_airways(self, airways_element: Element | None) -> None:
         if airways_element is None:
             self.logger.warning("No airways element found")
@@ -177,38 +217,30 @@ class ARINCParser:
 
         self.logger.info("Parsing airways...")
         for airway_elem in airways_element.findall("AIRWAY"):
-            airway_id = self._get_text(airway_elem, "ROUTE_IDENTIFIER")
-            if not airway_id:
-                continue
+            self._load_airway(AIRWAY_SCHEMA.extract(airway_elem))
+        self.logger.info("Finished parsing airways")
 
-            try:
-                airway = Airway.objects.get_or_create(
-                    cycle=self.data_cycle,
-                    airway_id=airway_id,
-                    defaults={"route_type": self._get_text(airway_elem, "ROUTE_TYPE")},
-                )
+    def _load_airway(self, fields: dict) -> None:
+        airway_id = fields.pop("airway_id")
+        if not airway_id:
+            return
 
-                sequence_number = self._get_int(airway_elem, "SEQUENCE_NUMBER")
-                if sequence_number is not None:
-                    AirwaySegment.objects.get_or_create(
-                        airway=airway,
-                        sequence_number=sequence_number,
-                        defaults={
-                            "fix_identifier": self._get_text(airway_elem, "FIX_IDENTIFIER"),
-                            "fix_type": self._get_text(airway_elem, "FIX_TYPE"),
-                            "next_fix_identifier": self._get_text(airway_elem, "NEXT_FIX_IDENTIFIER"),
-                            "next_fix_type": self._get_text(airway_elem, "NEXT_FIX_TYPE"),
-                            "route_distance": self._get_int(airway_elem, "ROUTE_DISTANCE"),
-                            "minimum_altitude": self._get_int(airway_elem, "MINIMUM_ALTITUDE"),
-                            "maximum_altitude": self._get_int(airway_elem, "MAXIMUM_ALTITUDE"),
-                            "magnetic_course": self._get_int(airway_elem, "MAGNETIC_COURSE"),
-                            "reverse_magnetic_course": self._get_int(airway_elem, "REVERSE_MAGNETIC_COURSE"),
-                        },
-                    )
-            except Exception as e:
-                self.logger.error(f"Failed to parse airway '{airway_id}': {e}")
-                raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
-        self.logger.info("Finished parsing airways")
+        try:
+            self._save_airway(airway_id, {"route_type": fields.pop("route_type")})
+
+            sequence_number = fields.pop("sequence_number")
+            if sequence_number is not None:
+                self._save_airway_segment(airway_id, sequence_number, fields)
+        except Exception as e:
+            self.logger.error(f"Failed to parse airway '{airway_id}': {e}")
+            raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+
+    def _save_airway(self, airway_id: str, fields: dict) -> None:
+        Airway.objects.get_or_create(cycle=self.data_cycle, airway_id=airway_id, defaults=fields)
+
+    def _save_airway_segment(self, airway_id: str, sequence_number: int, fields: dict) -> None:
+        airway = Airway.objects.get(cycle=self.data_cycle, airway_id=airway_id)
+        AirwaySegment.objects.get_or_create(airway=airway, sequence_number=sequence_number, defaults=fields)
 
     def _parse_procedures(self, procedures_element: Element | None) -> None:
         if procedures_element is None:
@@ -223,45 +255,487 @@ class ARINCParser:
         """Parse procedures of a specific type: APPROACH, SID, STAR."""
         self.logger.info(f"Parsing {tag_name}s...")
         for proc_elem in parent_element.findall(tag_name):
-            airport_id = self._get_text(proc_elem, "AIRPORT_IDENTIFIER")
-            procedure_id = self._get_text(proc_elem, "PROCEDURE_IDENTIFIER")
-            if not airport_id or not procedure_id:
-                continue
+            self._load_procedure(PROCEDURE_SCHEMA.extract(proc_elem), tag_name)
+        self.logger.info(f"Finished parsing {tag_name}s")
 
-            try:
-                airport = Airport.objects.get(cycle=self.data_cycle, airport_id=airport_id)
+    def _load_procedure(self, leg: dict, tag_name: str) -> None:
+        airport_id = leg.pop("airport_id")
+        procedure_id = leg.pop("procedure_id")
+        if not airport_id or not procedure_id:
+            return
 
-                procedure = Procedure.objects.get_or_create(
-                    cycle=self.data_cycle,
-                    airport=airport,
-                    procedure_id=procedure_id,
-                    defaults={"procedure_type": tag_name},
-                )
+        try:
+            transition_id = leg.pop("transition_id")
+            sequence_number = leg.pop("sequence_number")
+            if sequence_number is None or not leg["waypoint_identifier"]:
+                leg = None
+            self._save_procedure(airport_id, procedure_id, tag_name, transition_id, sequence_number, leg)
+        except ObjectDoesNotExist:
+            self.logger.error(f"{tag_name}: Airport '{airport_id}' not found.")
+        except Exception as e:
+            self.logger.error(f"Failed to parse {tag_name} for airport '{airport_id}': {e}")
+            raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
+
+    def _save_procedure(
+        self,
+        airport_id: str,
+        procedure_id: str,
+        procedure_type: str,
+        transition_id: str | None,
+        sequence_number: int | None,
+        leg: dict | None,
+    ) -> None:
+        """Store one procedure row: the procedure, its transition and (optionally) one leg."""
+        airport = Airport.objects.get(cycle=self.data_cycle, airport_id=airport_id)
+
+        procedure, _ = Procedure.objects.get_or_create(
+            cycle=self.data_cycle,
+            airport=airport,
+            procedure_id=procedure_id,
+            defaults={"procedure_type": procedure_type},
+        )
+        transition, _ = ProcedureTransition.objects.get_or_create(procedure=procedure, transition_id=transition_id)
+
+        if leg is not None:
+            ProcedureLeg.objects.get_or_create(transition=transition, sequence_number=sequence_number, defaults=leg)
+
+
+class BulkARINCParser(ARINCParser):
+    """
+    Parse ARINC 424 XML data into Django models using batched ``bulk_create``.
 
-                transition_id = self._get_text(proc_elem, "TRANSITION_IDENTIFIER")
-                transition = ProcedureTransition.objects.get_or_create(procedure=procedure, transition_id=transition_id)
-
-                sequence_number = self._get_int(proc_elem, "SEQUENCE_NUMBER")
-                waypoint_identifier = self._get_text(proc_elem, "WAYPOINT_IDENTIFIER")
-
-                if sequence_number is not None and waypoint_identifier:
-                    ProcedureLeg.objects.get_or_create(
-                        transition=transition,
-                        sequence_number=sequence_number,
-                        defaults={
-                            "waypoint_identifier": waypoint_identifier,
-                            "waypoint_type": self._get_text(proc_elem, "WAYPOINT_TYPE"),
-                            "latitude": self._get_float(proc_elem, ".//POSITION/LATITUDE"),
-                            "longitude": self._get_float(proc_elem, ".//POSITION/LONGITUDE"),
-                            "altitude_constraint": self._get_text(proc_elem, "ALTITUDE_CONSTRAINT"),
-                            "speed_constraint": self._get_text(proc_elem, "SPEED_CONSTRAINT"),
-                            "course": self._get_int(proc_elem, "COURSE"),
-                            "distance": self._get_float(proc_elem, "DISTANCE"),
-                        },
-                    )
-            except ObjectDoesNotExist:
-                self.logger.error(f"{tag_name}: Airport '{airport_id}' not found.")
-            except Exception as e:
-                self.logger.error(f"Failed to parse {tag_name} for airport '{airport_id}': {e}")
-                raise Exception(f"{type(e).__name__} occurred during parsing: {e}")
-        self.logger.info(f"Finished parsing {tag_name}s")
+    Parsed records are buffered per model and deduplicated in memory on the same natural keys
+    ``ARINCParser`` passes to ``get_or_create``. The buffers are written in dependency order
+    every time ``batch_size`` records are pending and once more at the end of ``parse_file``.
+    Foreign keys are resolved from in-memory id maps, so nothing is re-queried per record.
+
+    Attributes:
+        batch_size (int): Maximum number of buffered records and rows per ``bulk_create`` call.
+    """
+
+    # (model, parent model, foreign key attribute), in the order buffers are written.
+    WRITE_ORDER = (
+        (Airport, None, None),
+        (Navaid, None, None),
+        (Waypoint, None, None),
+        (Airway, None, None),
+        (AirwaySegment, Airway, "airway_id"),
+        (Procedure, Airport, "airport_id"),
+        (ProcedureTransition, Procedure, "procedure_id"),
+        (ProcedureLeg, ProcedureTransition, "transition_id"),
+    )
+
+    # Lookups used to load the natural keys of rows already stored for the cycle.
+    NATURAL_KEYS = {
+        Airport: ("cycle", ("airport_id",)),
+        Navaid: ("cycle", ("navaid_id",)),
+        Waypoint: ("cycle", ("waypoint_id",)),
+        Airway: ("cycle", ("airway_id",)),
+        AirwaySegment: ("airway__cycle", ("airway__airway_id", "sequence_number")),
+        Procedure: ("cycle", ("airport__airport_id", "procedure_id")),
+        ProcedureTransition: (
+            "procedure__cycle",
+            ("procedure__airport__airport_id", "procedure__procedure_id", "transition_id"),
+        ),
+        ProcedureLeg: (
+            "transition__procedure__cycle",
+            (
+                "transition__procedure__airport__airport_id",
+                "transition__procedure__procedure_id",
+                "transition__transition_id",
+                "sequence_number",
+            ),
+        ),
+    }
+
+    def __init__(
+        self, data_cycle: DataCycle, batch_size: int = DEFAULT_BATCH_SIZE, profiler: IngestProfiler | None = None
+    ) -> None:
+        super().__init__(data_cycle, profiler)
+        self.batch_size = batch_size
+        self._pending = {model: {} for model, _, _ in self.WRITE_ORDER}
+        self._pending_count = 0
+        self._ids = {}
+
+    def _get_ids(self, model) -> dict:
+        """Return the natural key -> primary key map of a model, loading stored rows on first use."""
+        if model not in self._ids:
+            cycle_lookup, key_fields = self.NATURAL_KEYS[model]
+            rows = model.objects.filter(**{cycle_lookup: self.data_cycle}).values_list(*key_fields, "pk")
+            self._ids[model] = {tuple(row[:-1]): row[-1] for row in rows}
+        return self._ids[model]
+
+    def _buffer(self, model, key: tuple, parent_key: tuple | None = None, **fields) -> None:
+        """Buffer a new record unless a record with the same natural key was already seen."""
+        pending = self._pending[model]
+        if key in pending or key in self._get_ids(model):
+            return
+
+        pending[key] = (parent_key, model(**fields))
+        self._pending_count += 1
+        if self._pending_count >= self.batch_size:
+            self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        """Write the buffers once ``batch_size`` records are pending."""
+        self._flush()
+
+    def _flush(self) -> None:
+        """Write all buffered records, parents first."""
+        for model, parent_model, fk_attname in self.WRITE_ORDER:
+            self._write(model, parent_model, fk_attname)
+        self._pending_count = 0
+
+    def _write(self, model, parent_model, fk_attname: str | None) -> None:
+        """Write the buffered records of one model, resolving their foreign key from the parent's id map."""
+        pending = self._pending[model]
+        if not pending:
+            return
+
+        parent_ids = self._get_ids(parent_model) if parent_model is not None else None
+        keys, objs = [], []
+        for key, (parent_key, obj) in pending.items():
+            if parent_ids is not None:
+                parent_id = parent_ids.get(parent_key)
+                if parent_id is None:
+                    if model is Procedure:
+                        self.logger.error(f"{obj.procedure_type}: Airport '{parent_key[0]}' not found.")
+                    continue
+                setattr(obj, fk_attname, parent_id)
+            keys.append(key)
+            objs.append(obj)
+        pending.clear()
+
+        if issubclass(model, GridIndexed):
+            for obj in objs:
+                obj.update_grid_cell()
+        created = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        if connection.features.can_return_rows_from_bulk_insert:
+            self._get_ids(model).update(zip(keys, (obj.pk for obj in created), strict=True))
+        else:
+            del self._ids[model]
+
+    def _save_airport(self, airport_id: str, fields: dict) -> None:
+        self._buffer(Airport, (airport_id,), cycle=self.data_cycle, airport_id=airport_id, **fields)
+
+    def _save_navaid(self, navaid_id: str, fields: dict) -> None:
+        self._buffer(Navaid, (navaid_id,), cycle=self.data_cycle, navaid_id=navaid_id, **fields)
+
+    def _save_waypoint(self, waypoint_id: str, fields: dict) -> None:
+        self._buffer(Waypoint, (waypoint_id,), cycle=self.data_cycle, waypoint_id=waypoint_id, **fields)
+
+    def _save_airway(self, airway_id: str, fields: dict) -> None:
+        self._buffer(Airway, (airway_id,), cycle=self.data_cycle, airway_id=airway_id, **fields)
+
+    def _save_airway_segment(self, airway_id: str, sequence_number: int, fields: dict) -> None:
+        self._buffer(
+            AirwaySegment,
+            (airway_id, sequence_number),
+            parent_key=(airway_id,),
+            sequence_number=sequence_number,
+            **fields,
+        )
+
+    def _save_procedure(
+        self,
+        airport_id: str,
+        procedure_id: str,
+        procedure_type: str,
+        transition_id: str | None,
+        sequence_number: int | None,
+        leg: dict | None,
+    ) -> None:
+        procedure_key = (airport_id, procedure_id)
+        self._buffer(
+            Procedure,
+            procedure_key,
+            parent_key=(airport_id,),
+            cycle=self.data_cycle,
+            procedure_id=procedure_id,
+            procedure_type=procedure_type,
+        )
+
+        transition_key = (*procedure_key, transition_id)
+        self._buffer(ProcedureTransition, transition_key, parent_key=procedure_key, transition_id=transition_id)
+
+        if leg is not None:
+            self._buffer(
+                ProcedureLeg,
+                (*transition_key, sequence_number),
+                parent_key=transition_key,
+                sequence_number=sequence_number,
+                **leg,
+            )
+
+
+class DeltaARINCParser(BulkARINCParser):
+    """
+    Parse an ARINC 424 cycle as a delta against the previous cycle.
+
+    Airports, navaids, waypoints, airways and procedures get a fingerprint: a hash of their normalized
+    fields and, for airways and procedures, of their segments, transitions and legs. Records whose
+    fingerprint matches the previous cycle are copied forward inside the database with set-based
+    ``INSERT ... SELECT`` statements; only added and changed records are written through ``bulk_create``.
+    The counts of added, changed, unchanged and removed records are stored on ``DataCycle.change_summary``.
+
+    Unchanged records are copied, not shared between cycles: a delta load saves parsing and writing most
+    of a cycle, but each cycle still stores all of its rows (expired cycles are pruned, see
+    ``navigation.retention``).
+
+    An airway or procedure is fingerprinted once all of its rows are known. ARINC 424 files list the
+    segments of an airway and the legs of a procedure together, so every batch writes the groups that are
+    complete and only holds back the one still being read; the buffers stay bounded by ``batch_size``
+    plus one group. A group whose rows are split across the file is rejected with a ``ValueError``.
+
+    Attributes:
+        previous_cycle (DataCycle | None): Cycle to compare against; everything is added when None.
+    """
+
+    # Fields hashed into each model's own digest.
+    FINGERPRINT_FIELDS = {
+        Airport: tuple(AIRPORT_SCHEMA.names),
+        Navaid: tuple(NAVAID_SCHEMA.names),
+        Waypoint: tuple(WAYPOINT_SCHEMA.names),
+        Airway: ("airway_id", "route_type"),
+        AirwaySegment: tuple(name for name in AIRWAY_SCHEMA.names if name not in ("airway_id", "route_type")),
+        Procedure: ("procedure_id", "procedure_type"),
+        ProcedureTransition: ("transition_id",),
+        ProcedureLeg: tuple(
+            name for name in PROCEDURE_SCHEMA.names if name not in ("airport_id", "procedure_id", "transition_id")
+        ),
+    }
+    FLAT_MODELS = (Airport, Navaid, Waypoint)
+    # Fields filled in after the parse by ``resolve_fix_references``: copied rows are resolved again in the new cycle.
+    RESOLVED_FIELDS = {
+        AirwaySegment: (
+            "fix_latitude",
+            "fix_longitude",
+            "next_fix_latitude",
+            "next_fix_longitude",
+            "fix_airport",
+            "fix_navaid",
+            "fix_waypoint",
+            "next_fix_airport",
+            "next_fix_navaid",
+            "next_fix_waypoint",
+        ),
+        ProcedureLeg: ("fix_airport", "fix_navaid", "fix_waypoint"),
+    }
+    # Child models whose rows are part of a root model's fingerprint.
+    GROUPS = {Airway: (AirwaySegment,), Procedure: (ProcedureTransition, ProcedureLeg)}
+    COPY_CHUNK_SIZE = 500
+
+    def __init__(
+        self,
+        data_cycle: DataCycle,
+        previous_cycle: DataCycle | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        profiler: IngestProfiler | None = None,
+    ) -> None:
+        super().__init__(data_cycle, batch_size, profiler)
+        self.previous_cycle = previous_cycle
+        self._previous = {}
+        self._carried = {model: [] for model in self.GROUPS}
+        self._open_group = None
+        self._closed_groups = set()
+        self._summary = {
+            model.__name__: {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+            for model in (*self.FLAT_MODELS, *self.GROUPS)
+        }
+
+    def _buffer(self, model, key: tuple, parent_key: tuple | None = None, **fields) -> None:
+        if model in self.GROUPS and self._open_group != (model, key):
+            if (model, key) in self._closed_groups:
+                raise ValueError(f"The rows of {model.__name__} {' '.join(map(str, key))} are not contiguous.")
+            if self._open_group is not None:
+                self._closed_groups.add(self._open_group)
+            self._open_group = (model, key)
+        super()._buffer(model, key, parent_key, **fields)
+
+    def _flush_batch(self) -> None:
+        held = self._take_open_group()
+        for model, parent_model, fk_attname in self.WRITE_ORDER:
+            self._write(model, parent_model, fk_attname)
+        for model, rows in held.items():
+            self._pending[model].update(rows)
+        self._pending_count = 0
+
+    def _take_open_group(self) -> dict:
+        """Remove the buffered rows of the group still being read, and return them per model."""
+        if self._open_group is None or self._open_group[1] not in self._pending[self._open_group[0]]:
+            return {}
+        root, key = self._open_group
+        held = {root: {key: self._pending[root].pop(key)}}
+        parents = {key}
+        for child in self.GROUPS[root]:
+            pending = self._pending[child]
+            held[child] = {
+                child_key: pending.pop(child_key)
+                for child_key in [child_key for child_key, (parent_key, _) in pending.items() if parent_key in parents]
+            }
+            parents = set(held[child])
+        return held
+
+    def _flush(self) -> None:
+        super()._flush()
+        for model in (*self.FLAT_MODELS, *self.GROUPS):
+            counts = self._summary[model.__name__]
+            counts["removed"] = len(self._get_previous(model)) - counts["changed"] - counts["unchanged"]
+        self.data_cycle.change_summary = {
+            "previous_cycle": self.previous_cycle.pk if self.previous_cycle else None,
+            **self._summary,
+        }
+        DataCycle.objects.filter(pk=self.data_cycle.pk).update(change_summary=self.data_cycle.change_summary)
+
+    def _write(self, model, parent_model, fk_attname: str | None) -> None:
+        if model in self.FLAT_MODELS or model in self.GROUPS:
+            carried = self._fingerprint_pending(model)
+            super()._write(model, parent_model, fk_attname)
+            self._copy_forward(model, carried)
+        else:
+            super()._write(model, parent_model, fk_attname)
+            for root, children in self.GROUPS.items():
+                if model in children:
+                    self._copy_forward(model, self._carried[root])
+
+    def _get_previous(self, model) -> dict:
+        """Return the natural key -> (primary key, fingerprint) map of a model in the previous cycle."""
+        if model not in self._previous:
+            self._previous[model] = {}
+            if self.previous_cycle is not None:
+                _, key_fields = self.NATURAL_KEYS[model]
+                rows = model.objects.filter(cycle=self.previous_cycle).values_list(*key_fields, "pk", "fingerprint")
+                self._previous[model] = {tuple(row[:-2]): row[-2:] for row in rows}
+        return self._previous[model]
+
+    def _fingerprint_pending(self, model) -> list:
+        """
+        Fingerprint the buffered records of a model and drop the ones unchanged since the previous cycle.
+
+        Returns:
+            list: Primary keys, in the previous cycle, of the records to copy forward.
+        """
+        pending = self._pending[model]
+        children = [self._group_children(child) for child in self.GROUPS.get(model, ())]
+        previous = self._get_previous(model)
+        counts = self._summary[model.__name__]
+        carried = []
+        for key, (_, obj) in list(pending.items()):
+            digests = [self._digest(model, obj)]
+            if children:
+                digests += sorted(self._group_digest(key, children))
+            obj.fingerprint = self._hash(digests)
+
+            previous_pk, previous_fingerprint = previous.get(key, (None, None))
+            if previous_pk is None:
+                counts["added"] += 1
+            elif previous_fingerprint != obj.fingerprint:
+                counts["changed"] += 1
+            else:
+                counts["unchanged"] += 1
+                carried.append(previous_pk)
+                del pending[key]
+                self._drop_group(key, children)
+
+        if model in self._carried:
+            self._carried[model] = carried
+        return carried
+
+    def _group_children(self, model) -> dict:
+        """Index the buffered records of a child model by their parent's natural key."""
+        by_parent = {}
+        for key, (parent_key, obj) in self._pending[model].items():
+            by_parent.setdefault(parent_key, []).append((key, obj))
+        return {"model": model, "by_parent": by_parent}
+
+    def _group_digest(self, key: tuple, children: list) -> list[str]:
+        """Digest the child records of a group root; grandchildren are folded into their parent's digest."""
+        child, *rest = children
+        digests = []
+        for child_key, obj in child["by_parent"].get(key, ()):
+            nested = sorted(self._group_digest(child_key, rest)) if rest else []
+            digests.append(self._hash([self._digest(child["model"], obj), *nested]))
+        return digests
+
+    def _drop_group(self, key: tuple, children: list) -> None:
+        """Remove the buffered child records of a group root that is copied forward."""
+        if not children:
+            return
+        child, *rest = children
+        for child_key, _ in child["by_parent"].pop(key, ()):
+            del self._pending[child["model"]][child_key]
+            self._drop_group(child_key, rest)
+
+    def _digest(self, model, obj) -> str:
+        return self._hash(repr(getattr(obj, field)) for field in self.FINGERPRINT_FIELDS[model])
+
+    @staticmethod
+    def _hash(parts) -> str:
+        return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).hexdigest()
+
+    def _copy_forward(self, model, previous_pks: list) -> None:
+        """Copy rows of the previous cycle into the current one with ``INSERT ... SELECT`` statements."""
+        if not previous_pks:
+            return
+
+        qn = connection.ops.quote_name
+        table = {m: qn(m._meta.db_table) for m, _, _ in self.WRITE_ORDER}
+        cycle = self.data_cycle.pk
+        airport_joins = (
+            f"JOIN {table[Airport]} oa ON oa.id = op.airport_id "
+            f"JOIN {table[Airport]} na ON na.cycle_id = %s AND na.airport_id = oa.airport_id "
+        )
+        procedure_joins = airport_joins + (
+            f"JOIN {table[Procedure]} np "
+            "ON np.cycle_id = %s AND np.airport_id = na.id AND np.procedure_id = op.procedure_id "
+        )
+        if model is AirwaySegment:
+            replacements, params = {"airway_id": "na.id"}, [cycle]
+            joins = (
+                f"JOIN {table[Airway]} oa ON oa.id = src.airway_id "
+                f"JOIN {table[Airway]} na ON na.cycle_id = %s AND na.airway_id = oa.airway_id"
+            )
+            where = "oa.id"
+        elif model is Procedure:
+            replacements, params = {"cycle_id": "%s", "airport_id": "na.id"}, [cycle, cycle]
+            joins = f"JOIN {table[Procedure]} op ON op.id = src.id " + airport_joins
+            where = "src.id"
+        elif model is ProcedureTransition:
+            replacements, params = {"procedure_id": "np.id"}, [cycle, cycle]
+            joins = f"JOIN {table[Procedure]} op ON op.id = src.procedure_id " + procedure_joins
+            where = "op.id"
+        elif model is ProcedureLeg:
+            replacements, params = {"transition_id": "nt.id"}, [cycle, cycle]
+            joins = (
+                f"JOIN {table[ProcedureTransition]} ot ON ot.id = src.transition_id "
+                f"JOIN {table[Procedure]} op ON op.id = ot.procedure_id "
+                + procedure_joins
+                + f"JOIN {table[ProcedureTransition]} nt "
+                "ON nt.procedure_id = np.id AND nt.transition_id = ot.transition_id"
+            )
+            where = "op.id"
+        else:
+            replacements, params, joins, where = {"cycle_id": "%s"}, [cycle], "", "src.id"
+
+        for name in self.RESOLVED_FIELDS.get(model, ()):
+            replacements[model._meta.get_field(name).column] = "NULL"
+        columns = [field.column for field in model._meta.concrete_fields if not field.primary_key]
+        select = ", ".join(replacements.get(column, f"src.{qn(column)}") for column in columns)
+        with connection.cursor() as cursor:
+            for start in range(0, len(previous_pks), self.COPY_CHUNK_SIZE):
+                chunk = previous_pks[start : start + self.COPY_CHUNK_SIZE]
+                cursor.execute(
+                    f"INSERT INTO {table[model]} ({', '.join(qn(column) for column in columns)}) "
+                    f"SELECT {select} FROM {table[model]} src {joins} "
+                    f"WHERE {where} IN ({', '.join(['%s'] * len(chunk))})",
+                    [*params, *chunk],
+                )
+                if model in self.FLAT_MODELS:
+                    self._load_copied_ids(model, chunk)
+
+    def _load_copied_ids(self, model, previous_pks: list) -> None:
+        """Add the primary keys of copied rows to the id map; later records and procedures resolve against it."""
+        _, (key_field,) = self.NATURAL_KEYS[model]
+        identifiers = model.objects.filter(pk__in=previous_pks).values(key_field)
+        copied = model.objects.filter(cycle=self.data_cycle, **{f"{key_field}__in": identifiers})
+        self._get_ids(model).update(((identifier,), pk) for identifier, pk in copied.values_list(key_field, "pk"))
@@ -0,0 +1,376 @@
+import logging
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+
+from navigation.geodesy import CoordinateTable, haversine, initial_bearing, parse_variation, true_to_magnetic
+from navigation.models import (
+    Airport,
+    Airway,
+    AirwaySegment,
+    DataCycle,
+    Navaid,
+    Procedure,
+    ProcedureLeg,
+    ProcedureTransition,
+    Waypoint,
+)
+
+logger = logging.getLogger(__name__)
+
+# A stored distance or course is reported when it differs from the great-circle value by more than this.
+DISTANCE_TOLERANCE_NM = 2.0
+DISTANCE_TOLERANCE_RATIO = 0.05
+COURSE_TOLERANCE_DEGREES = 5.0
+# Mismatches listed by natural key in the report, per kind of record.
+REPORT_SAMPLES = 20
+UPDATE_BATCH_SIZE = 1000
+# Record types counted by ``validate_cycle``.
+VALIDATED_MODELS = [Airport, Navaid, Waypoint, Airway, Procedure]
+# Tables whose planner statistics are refreshed once a cycle is loaded.
+ANALYZED_MODELS = [Airport, Navaid, Waypoint, Airway, AirwaySegment, Procedure, ProcedureTransition, ProcedureLeg]
+
+
+class CycleValidationError(Exception):
+    """A loaded cycle failed the checks that make it servable."""
+
+    def __init__(self, report: dict) -> None:
+        super().__init__("; ".join(report["errors"]))
+        self.report = report
+
+
+def resolve_fix_references(cycle: DataCycle) -> dict:
+    """
+    Link the fix references of a cycle's airway segments and procedure legs to the fixes they name.
+
+    Each reference is resolved inside the database with one ``UPDATE`` per end and fix type, whatever the size of
+    the cycle. Segments reference a fix of a known type and get its foreign key and coordinates, so their geometry
+    is read without further queries. Legs carry their own coordinates and get the foreign key. A leg typed
+    ``NAVAID`` is looked up among navaids; any other leg is looked up among waypoints, then navaids, then airports.
+    The report is stored under ``"references"`` in ``DataCycle.validation_report``.
+
+    Args:
+        cycle (DataCycle): Cycle to process.
+
+    Returns:
+        dict: ``{"segments": {...}, "legs": {...}}`` with the number of references checked and unresolved, and
+            the most referenced unresolved fixes.
+    """
+    segments = AirwaySegment.objects.filter(airway__cycle=cycle)
+    for end in ("fix", "next_fix"):
+        for fix_type, model, identifier_field, _ in CoordinateTable.SOURCES:
+            fixes = model.objects.filter(cycle=cycle, **{identifier_field: OuterRef(f"{end}_identifier")})
+            segments.filter(**{f"{end}_type": fix_type}).update(
+                **{
+                    f"{end}_{fix_type.lower()}": Subquery(fixes.values("pk")),
+                    f"{end}_latitude": Subquery(fixes.values("latitude")),
+                    f"{end}_longitude": Subquery(fixes.values("longitude")),
+                }
+            )
+
+    legs = ProcedureLeg.objects.filter(transition__procedure__cycle=cycle)
+    sources = {fix_type: (model, identifier_field) for fix_type, model, identifier_field, _ in CoordinateTable.SOURCES}
+    for fix_type in ("WAYPOINT", "NAVAID", "AIRPORT"):
+        model, identifier_field = sources[fix_type]
+        fixes = model.objects.filter(cycle=cycle, **{identifier_field: OuterRef("waypoint_identifier")})
+        unresolved = legs.filter(_unresolved_q("fix"), Exists(fixes))
+        if fix_type != "NAVAID":
+            unresolved = unresolved.exclude(waypoint_type="NAVAID")
+        unresolved.update(**{f"fix_{fix_type.lower()}": Subquery(fixes.values("pk"))})
+
+    report = {
+        "segments": _reference_report(
+            segments, [("fix", "fix_type", "fix_identifier"), ("next_fix", "next_fix_type", "next_fix_identifier")]
+        ),
+        "legs": _reference_report(legs, [("fix", "waypoint_type", "waypoint_identifier")]),
+    }
+    cycle.validation_report["references"] = report
+    cycle.save(update_fields=["validation_report"])
+    for kind, counts in report.items():
+        logger.info(
+            f"Cycle {cycle.cycle_id}: {counts['unresolved']} of {counts['checked']} {kind} references unresolved"
+        )
+    return report
+
+
+def _unresolved_q(prefix: str) -> Q:
+    return Q(**{f"{prefix}_{fix_type.lower()}": None for fix_type, *_ in CoordinateTable.SOURCES})
+
+
+def _reference_report(queryset, ends) -> dict:
+    """
+    Count the resolved references of records and list the most referenced unresolved fixes.
+
+    Args:
+        queryset: Records holding the references.
+        ends (list[tuple[str, str, str]]): ``(foreign key prefix, type field, identifier field)`` of each reference.
+    """
+    counts = {"checked": 0, "unresolved": 0, "unresolved_fixes": []}
+    for prefix, type_field, identifier_field in ends:
+        references = queryset.filter(**{f"{identifier_field}__isnull": False})
+        unresolved = references.filter(_unresolved_q(prefix))
+        counts["checked"] += references.count()
+        counts["unresolved"] += unresolved.count()
+        counts["unresolved_fixes"] += [
+            {"fix": f"{fix_type}/{identifier}", "references": total}
+            for fix_type, identifier, total in unresolved.values_list(type_field, identifier_field)
+            .annotate(total=Count("pk"))
+            .order_by("-total", identifier_field)[:REPORT_SAMPLES]
+        ]
+    counts["unresolved_fixes"].sort(key=lambda fix: -fix["references"])
+    del counts["unresolved_fixes"][REPORT_SAMPLES:]
+    return counts
+
+
+def backfill_geodesy(cycle: DataCycle, table: CoordinateTable | None = None) -> dict:
+    """
+    Backfill and validate the distances and courses of a cycle's airway segments and procedure legs.
+
+    Missing ``AirwaySegment.route_distance``/``magnetic_course`` and ``ProcedureLeg.distance``/``course`` values
+    are filled in from the great-circle geometry; values supplied by the source are kept and only compared with it.
+    The report is stored under ``"geodesy"`` in ``DataCycle.validation_report``.
+
+    Args:
+        cycle (DataCycle): Cycle to process.
+        table (CoordinateTable | None): Positions of the cycle's fixes, loaded when not given.
+
+    Returns:
+        dict: ``{"segments": {...}, "legs": {...}}`` with the counts of checked, backfilled, mismatched and,
+            for segments, unresolved records, and a sample of the mismatches.
+    """
+    table = table if table is not None else CoordinateTable.for_cycle(cycle)
+    report = {"segments": _process_segments(cycle, table), "legs": _process_legs(cycle)}
+    cycle.validation_report["geodesy"] = report
+    cycle.save(update_fields=["validation_report"])
+    for kind, counts in report.items():
+        mismatches = counts["distance_mismatches"] + counts["course_mismatches"]
+        logger.info(
+            f"Cycle {cycle.cycle_id}: checked {counts['checked']} {kind}, backfilled "
+            f"{counts['backfilled_distance']} distances and {counts['backfilled_course']} courses, "
+            f"{mismatches} mismatches"
+        )
+    return report
+
+
+def validate_cycle(cycle: DataCycle, previous_cycle: DataCycle | None = None) -> dict:
+    """
+    Check that a loaded cycle is complete enough to be served.
+
+    A cycle that lost more than ``ARINC_MAX_RECORD_DROP`` of the records of a type compared with the previous
+    cycle is rejected: that points at a truncated or partial file rather than at an AIRAC amendment. The report
+    is stored under ``"readiness"`` in ``DataCycle.validation_report``.
+
+    Args:
+        cycle (DataCycle): Cycle to check.
+        previous_cycle (DataCycle | None): Cycle it replaces, if any.
+
+    Returns:
+        dict: ``{"records": {...}, "previous_records": {...}, "errors": []}`` with the records per model.
+
+    Raises:
+        CycleValidationError: When a check fails; its ``report`` lists the errors.
+    """
+    report = {"records": _record_counts(cycle), "previous_records": None, "errors": []}
+    if previous_cycle is not None:
+        report["previous_records"] = _record_counts(previous_cycle)
+        for name, previous in report["previous_records"].items():
+            count = report["records"][name]
+            if previous and count < previous * (1 - settings.ARINC_MAX_RECORD_DROP):
+                report["errors"].append(f"{name}: {count} records, down from {previous} in {previous_cycle.pk}.")
+    if report["errors"]:
+        raise CycleValidationError(report)
+    cycle.validation_report["readiness"] = report
+    cycle.save(update_fields=["validation_report"])
+    return report
+
+
+def refresh_planner_statistics() -> None:
+    """
+    Refresh the query planner's statistics of the ``navigation`` tables, after a cycle is loaded.
+
+    A cycle adds as many rows as the tables already hold; with stale statistics the first queries on it may be
+    planned as if it were empty.
+    """
+    if connection.vendor not in ("postgresql", "sqlite"):
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            # Sample the indexes instead of reading them whole.
+            cursor.execute("PRAGMA analysis_limit = 1000")
+        for model in ANALYZED_MODELS:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+
+def _record_counts(cycle: DataCycle) -> dict:
+    return {model.__name__: model.objects.filter(cycle=cycle).count() for model in VALIDATED_MODELS}
+
+
+def _process_segments(cycle: DataCycle, table: CoordinateTable) -> dict:
+    rows = list(
+        AirwaySegment.objects.filter(airway__cycle=cycle, next_fix_identifier__isnull=False).values_list(
+            "pk",
+            "airway__airway_id",
+            "sequence_number",
+            "fix_type",
+            "fix_identifier",
+            "next_fix_type",
+            "next_fix_identifier",
+            "route_distance",
+            "magnetic_course",
+        )
+    )
+    if not rows:
+        return {**_counts(0), "unresolved": 0}
+    pks, airway_ids, sequence_numbers, fix_types, fixes, next_fix_types, next_fixes, distances, courses = zip(
+        *rows, strict=True
+    )
+    start = table.locate(zip(fix_types, fixes, strict=True))
+    end = table.locate(zip(next_fix_types, next_fixes, strict=True))
+    resolved = (start >= 0) & (end >= 0)
+    start, end = start[resolved], end[resolved]
+
+    lat1, lon1 = table.latitudes[start], table.longitudes[start]
+    lat2, lon2 = table.latitudes[end], table.longitudes[end]
+    variation = table.variations[start]
+    variation = np.where(np.isnan(variation), table.variations[end], variation)
+    computed_distance = haversine(lat1, lon1, lat2, lon2)
+    computed_course = true_to_magnetic(initial_bearing(lat1, lon1, lat2, lon2), variation)
+
+    keys = [
+        f"{airway_id}/{sequence_number}"
+        for airway_id, sequence_number in zip(airway_ids, sequence_numbers, strict=True)
+    ]
+    result = _compare(
+        np.asarray(pks)[resolved],
+        np.asarray(keys)[resolved],
+        _floats(distances)[resolved],
+        _floats(courses)[resolved],
+        computed_distance,
+        computed_course,
+    )
+    _update(AirwaySegment, "route_distance", "magnetic_course", result, distance_decimals=0)
+    counts = result["counts"]
+    counts["unresolved"] = int((~resolved).sum())
+    return counts
+
+
+def _process_legs(cycle: DataCycle) -> dict:
+    rows = list(
+        ProcedureLeg.objects.filter(transition__procedure__cycle=cycle)
+        .order_by("transition_id", "sequence_number")
+        .values_list(
+            "pk",
+            "transition_id",
+            "transition__procedure__procedure_id",
+            "transition__transition_id",
+            "sequence_number",
+            "latitude",
+            "longitude",
+            "distance",
+            "course",
+            "transition__procedure__airport__magnetic_variation",
+        )
+    )
+    if len(rows) < 2:
+        return _counts(0)
+    pks, transitions, procedure_ids, transition_ids, sequence_numbers, lats, lons, distances, courses, variations = zip(
+        *rows, strict=True
+    )
+    latitudes, longitudes = _floats(lats), _floats(lons)
+    # Each leg runs from the previous leg of its transition; the first leg of a transition has no geometry.
+    follows = np.asarray(transitions[1:]) == np.asarray(transitions[:-1])
+    follows &= ~np.isnan(latitudes[1:]) & ~np.isnan(latitudes[:-1])
+    legs = np.flatnonzero(follows) + 1
+
+    lat1, lon1 = latitudes[legs - 1], longitudes[legs - 1]
+    lat2, lon2 = latitudes[legs], longitudes[legs]
+    variation = np.fromiter((parse_variation(variations[leg]) for leg in legs), dtype=np.float64, count=len(legs))
+    keys = np.asarray([f"{p}/{t}/{s}" for p, t, s in zip(procedure_ids, transition_ids, sequence_numbers, strict=True)])
+    result = _compare(
+        np.asarray(pks)[legs],
+        keys[legs],
+        _floats(distances)[legs],
+        _floats(courses)[legs],
+        haversine(lat1, lon1, lat2, lon2),
+        true_to_magnetic(initial_bearing(lat1, lon1, lat2, lon2), variation),
+    )
+    _update(ProcedureLeg, "distance", "course", result, distance_decimals=2)
+    return result["counts"]
+
+
+def _compare(pks, keys, distance, course, computed_distance, computed_course) -> dict:
+    """Split records into those to backfill and those whose stored values disagree with the computed ones."""
+    fill_distance = np.isnan(distance)
+    fill_course = np.isnan(course) & ~np.isnan(computed_course)
+    tolerance = np.maximum(DISTANCE_TOLERANCE_NM, DISTANCE_TOLERANCE_RATIO * computed_distance)
+    bad_distance = ~fill_distance & (np.abs(distance - computed_distance) > tolerance)
+    course_error = np.abs((course - computed_course + 180) % 360 - 180)
+    bad_course = ~np.isnan(course) & ~np.isnan(computed_course) & (course_error > COURSE_TOLERANCE_DEGREES)
+
+    counts = _counts(len(pks))
+    counts["backfilled_distance"] = int(fill_distance.sum())
+    counts["backfilled_course"] = int(fill_course.sum())
+    counts["distance_mismatches"] = int(bad_distance.sum())
+    counts["course_mismatches"] = int(bad_course.sum())
+    counts["mismatch_samples"] = [
+        {
+            "record": str(keys[row]),
+            "distance": None if np.isnan(distance[row]) else float(distance[row]),
+            "computed_distance": round(float(computed_distance[row]), 2),
+            "course": None if np.isnan(course[row]) else float(course[row]),
+            "computed_course": None if np.isnan(computed_course[row]) else round(float(computed_course[row]), 1),
+        }
+        for row in np.flatnonzero(bad_distance | bad_course)[:REPORT_SAMPLES]
+    ]
+
+    update = fill_distance | fill_course
+    return {
+        "counts": counts,
+        "pks": pks[update],
+        "distance": np.where(fill_distance, computed_distance, distance)[update],
+        "course": np.where(fill_course, computed_course, course)[update],
+    }
+
+
+def _update(model, distance_field: str, course_field: str, result: dict, distance_decimals: int) -> None:
+    """Write the backfilled values with one ``UPDATE ... WHERE id = %s`` statement, executed for every record."""
+    quote = connection.ops.quote_name
+    distance_column, course_column = model._meta.get_field(distance_field), model._meta.get_field(course_field)
+    sql = (
+        f"UPDATE {quote(model._meta.db_table)} SET {quote(distance_column.column)} = %s, "
+        f"{quote(course_column.column)} = %s WHERE {quote(model._meta.pk.column)} = %s"
+    )
+    rows = [
+        (
+            distance_column.get_db_prep_save(_round(distance, distance_decimals), connection),
+            None if np.isnan(course) else int(round(float(course))) % 360,
+            int(pk),
+        )
+        for pk, distance, course in zip(result["pks"], result["distance"], result["course"], strict=True)
+    ]
+    with transaction.atomic(), connection.cursor() as cursor:
+        for start in range(0, len(rows), UPDATE_BATCH_SIZE):
+            cursor.executemany(sql, rows[start : start + UPDATE_BATCH_SIZE])
+
+
+def _round(value, decimals: int):
+    if np.isnan(value):
+        return None
+    return int(round(float(value))) if decimals == 0 else round(float(value), decimals)
+
+
+def _floats(values) -> np.ndarray:
+    return np.fromiter((np.nan if value is None else float(value) for value in values), dtype=np.float64)
+
+
+def _counts(checked: int) -> dict:
+    return {
+        "checked": checked,
+        "backfilled_distance": 0,
+        "backfilled_course": 0,
+        "distance_mismatches": 0,
+        "course_mismatches": 0,
+        "mismatch_samples": [],
+    }
@@ -0,0 +1,159 @@
+"""
+Instrumentation of the ingestion pipeline.
+
+An ``IngestProfiler`` measures the stages of loading a file: staging each section, parsing each section into the
+``navigation`` tables, resolving references, committing, and so on. Every stage records its wall time, the records
+it handled and their rate, the queries it ran and the rows they wrote, and the peak resident memory of the process
+at its end. Stages may split their wall time further, e.g. into XML parsing, field extraction and database writes.
+When ``ARINC_PROFILE_DIR`` is set, each stage also runs under ``cProfile`` and its stats are dumped there, to be read
+with ``pstats`` or snakeviz.
+"""
+
+import cProfile
+import os
+import re
+import resource
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from django.db import connection
+from django.utils import timezone
+
+# Statements whose row count is added to a stage's ``rows_written``.
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, in kilobytes elsewhere.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Stage:
+    """
+    Measurements of one stage, while it runs.
+
+    Attributes:
+        name (str): Name of the stage, unique within a file's pipeline.
+        records (int): Records handled by the stage, counted by its caller.
+        splits (dict[str, float]): Seconds spent in named parts of the stage.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.records = 0
+        self.splits = {}
+        self.queries = 0
+        self.rows_written = 0
+
+    def count(self, records: int = 1) -> None:
+        self.records += records
+
+    def add(self, split: str, seconds: float) -> None:
+        """Add seconds to a part of the stage."""
+        self.splits[split] = self.splits.get(split, 0.0) + seconds
+
+    @contextmanager
+    def split(self, split: str) -> Iterator[None]:
+        """Time a block as part of the stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(split, time.perf_counter() - started)
+
+    def timed(self, iterable: Iterable, split: str) -> Iterator:
+        """Yield the items of an iterable, adding the time spent producing them to a part of the stage."""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(split, time.perf_counter() - started)
+                return
+            self.add(split, time.perf_counter() - started)
+            yield item
+
+    def _count_query(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        self.queries += 1
+        if sql.lstrip()[:6].upper() in WRITE_STATEMENTS:
+            self.rows_written += max(context["cursor"].rowcount, 0)
+        return result
+
+
+class IngestProfiler:
+    """
+    Collect the metrics of the stages of an ingestion run.
+
+    Stages run one after the other in a process; they are not nested.
+
+    Attributes:
+        stages (list[dict]): Metrics of the finished stages, in order: ``name``, ``started_at``, ``seconds``,
+            ``records``, ``records_per_second``, ``queries``, ``rows_written``, ``peak_rss_mb``, and ``splits``
+            and ``profile`` (the path of the stage's cProfile dump) when there are any.
+        profile_dir (str | None): Directory the cProfile dump of each stage is written to; None disables cProfile.
+    """
+
+    def __init__(self, profile_dir: str | os.PathLike | None = None) -> None:
+        self.stages = []
+        self.profile_dir = profile_dir
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """
+        Measure a stage of the run.
+
+        Args:
+            name (str): Name of the stage.
+
+        Yields:
+            Stage: The running stage, to count its records and time its parts on.
+        """
+        stage = Stage(name)
+        started_at = timezone.now()
+        # SQLite only reports the rows of an ``INSERT ... RETURNING`` once they are fetched, so its own count of
+        # changed rows is used instead.
+        changes = self._total_changes()
+        profile = cProfile.Profile() if self.profile_dir else None
+        started = time.perf_counter()
+        with connection.execute_wrapper(stage._count_query):
+            if profile is not None:
+                profile.enable()
+            try:
+                yield stage
+            finally:
+                if profile is not None:
+                    profile.disable()
+        seconds = time.perf_counter() - started
+
+        if changes is not None:
+            stage.rows_written = self._total_changes() - changes
+        metrics = {
+            "name": name,
+            "started_at": started_at.isoformat(),
+            "seconds": round(seconds, 3),
+            "records": stage.records,
+            "records_per_second": round(stage.records / seconds, 1) if seconds else None,
+            "queries": stage.queries,
+            "rows_written": stage.rows_written,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        if stage.splits:
+            metrics["splits"] = {split: round(seconds, 3) for split, seconds in stage.splits.items()}
+        if profile is not None:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            metrics["profile"] = os.path.join(self.profile_dir, re.sub(r"\W+", "-", name).strip("-") + ".prof")
+            profile.dump_stats(metrics["profile"])
+        self.stages.append(metrics)
+
+    @staticmethod
+    def _total_changes() -> int | None:
+        if connection.vendor != "sqlite":
+            return None
+        connection.ensure_connection()
+        return connection.connection.total_changes
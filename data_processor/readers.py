@@ -0,0 +1,176 @@
+import io
+import mmap
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
+from os import PathLike
+from typing import BinaryIO, NamedTuple
+from xml.etree.ElementTree import Element
+
+# Record tags that may appear in each top-level section of an ARINC 424 XML file.
+SECTION_RECORDS = {
+    "AIRPORTS": ("AIRPORT",),
+    "NAVAIDS": ("NAVAID",),
+    "WAYPOINTS": ("WAYPOINT",),
+    "AIRWAYS": ("AIRWAY",),
+    "PROCEDURES": ("APPROACH", "SID", "STAR"),
+}
+
+# Tags opening or closing a section, and tags closing a record, as scanned by ``plan_chunks``.
+CHUNK_TAGS = re.compile(
+    rb"<(?P<close>/?)(?P<section>%s)(?:\s[^>]*?)?(?P<empty>/?)>|</(?P<record>%s)\s*>"
+    % (
+        "|".join(SECTION_RECORDS).encode(),
+        "|".join(tag for tags in SECTION_RECORDS.values() for tag in tags).encode(),
+    )
+)
+XML_DECLARATION = re.compile(rb"<\?xml[^>]*\?>")
+
+
+class Chunk(NamedTuple):
+    """
+    A run of consecutive records of one section, located by byte offsets in the file.
+
+    Attributes:
+        section (str): Section of the records, e.g. ``"AIRPORTS"``.
+        index (int): Position of the chunk within its section.
+        start (int): Offset of the first byte of the chunk.
+        end (int): Offset just past the end tag of its last record.
+        records (int): Number of records in the chunk.
+    """
+
+    section: str
+    index: int
+    start: int
+    end: int
+    records: int
+
+
+def read_header(path: str | PathLike) -> dict:
+    """
+    Read the cycle attributes and data source of an ARINC 424 XML file without loading it.
+
+    Parsing stops at the first record section, so only the head of the file is read.
+
+    Args:
+        path (str | PathLike): Path to the XML file.
+
+    Returns:
+        dict: ``cycle`` and ``effective_date`` root attributes and ``data_source`` text (or None).
+    """
+    with open(path, "rb") as source:
+        events = ET.iterparse(source, events=("start", "end"))
+        _, root = next(events)
+        header = {"cycle": root.get("cycle"), "effective_date": root.get("effective_date"), "data_source": None}
+        for event, elem in events:
+            if event == "start" and elem.tag in SECTION_RECORDS:
+                break
+            if event == "end" and elem.tag == "DATA_SOURCE":
+                header["data_source"] = elem.text
+                break
+    return header
+
+
+def iter_records(path: str | PathLike, sections: Iterable[str] | None = None) -> Iterator[Element]:
+    """
+    Stream the records of an ARINC 424 XML file one at a time.
+
+    Uses incremental parsing; every record is cleared once the consumer has handled it,
+    so peak memory is bounded by the largest record rather than the size of the file.
+
+    Args:
+        path (str | PathLike): Path to the XML file.
+        sections (Iterable[str] | None): Only yield records of these sections, e.g. ``["AIRPORTS"]``.
+
+    Yields:
+        Element: AIRPORT, NAVAID, WAYPOINT, AIRWAY, APPROACH, SID and STAR elements, in document order.
+    """
+    wanted = set(SECTION_RECORDS if sections is None else sections)
+    with open(path, "rb") as source:
+        yield from _iter_source_records(source, wanted)
+
+
+def plan_chunks(path: str | PathLike, chunk_size: int) -> list[Chunk]:
+    """
+    Split the record sections of an ARINC 424 XML file into chunks of ``chunk_size`` records.
+
+    The file is scanned for the tags opening and closing each section and closing each record, without parsing it,
+    so every chunk can then be parsed on its own from its bytes (see ``iter_chunk_records``), in any process.
+    Records are flat elements with an end tag, and tags are not expected inside comments or CDATA sections.
+
+    Args:
+        path (str | PathLike): Path to the XML file.
+        chunk_size (int): Records per chunk; the last chunk of a section may hold fewer.
+
+    Returns:
+        list[Chunk]: The chunks of every section, in document order.
+    """
+    chunks = []
+    if os.path.getsize(path) == 0:
+        return chunks
+    with open(path, "rb") as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        section, start, records = None, 0, 0
+        indexes = dict.fromkeys(SECTION_RECORDS, 0)
+        for match in CHUNK_TAGS.finditer(data):
+            if match["record"] is not None:
+                if section is None or match["record"].decode() not in SECTION_RECORDS[section]:
+                    continue
+                records += 1
+                if records == chunk_size:
+                    chunks.append(Chunk(section, indexes[section], start, match.end(), records))
+                    indexes[section] += 1
+                    start, records = match.end(), 0
+            elif match["close"]:
+                if section is not None and records:
+                    chunks.append(Chunk(section, indexes[section], start, match.start(), records))
+                    indexes[section] += 1
+                section = None
+            elif not match["empty"]:
+                section, start, records = match["section"].decode(), match.end(), 0
+    return chunks
+
+
+def iter_chunk_records(path: str | PathLike, chunk: Chunk) -> Iterator[Element]:
+    """
+    Stream the records of one chunk of an ARINC 424 XML file, reading only the chunk's bytes.
+
+    Args:
+        path (str | PathLike): Path to the XML file.
+        chunk (Chunk): Chunk to read, as planned by ``plan_chunks``.
+
+    Yields:
+        Element: The records of the chunk, in document order.
+    """
+    with open(path, "rb") as source:
+        declaration = XML_DECLARATION.match(source.read(256))
+        source.seek(chunk.start)
+        data = source.read(chunk.end - chunk.start)
+    tag = chunk.section.encode()
+    # The records are wrapped in a root and their section, like in the file, with its encoding declaration.
+    fragment = b"".join(
+        [declaration[0] if declaration else b"", b"<CHUNK><", tag, b">", data, b"</", tag, b"></CHUNK>"]
+    )
+    yield from _iter_source_records(io.BytesIO(fragment), {chunk.section})
+
+
+def _iter_source_records(source: BinaryIO, wanted: set[str]) -> Iterator[Element]:
+    depth = 0
+    root = section = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                root = elem
+            elif depth == 2:
+                section = elem if elem.tag in wanted else None
+            continue
+
+        depth -= 1
+        if depth == 2 and section is not None:
+            if elem.tag in SECTION_RECORDS[section.tag]:
+                yield elem
+            elem.clear()
+            section.clear()
+        elif depth == 1:
+            root.clear()
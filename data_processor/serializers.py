@@ -13,10 +13,14 @@ class ArincFileSerializer(serializers.ModelSerializer):
             "status",
             "cycle",
             "processing_errors",
+            "checkpoint",
+            "metrics",
         ]
         read_only_fields = [
             "uploaded_at",
             "status",
             "cycle",
             "processing_errors",
+            "checkpoint",
+            "metrics",
         ]
@@ -1,53 +1,276 @@
 import logging
+import os
+from contextlib import ExitStack
 from datetime import datetime, timedelta
+from time import perf_counter
 
 from celery import shared_task
-import xml.etree.ElementTree as ET
+from django.conf import settings
+from django.db import transaction
 
+from navigation.caching import invalidate_cached_responses
+from navigation.cycles import invalidate_active_cycle
+from navigation.geodesy import CoordinateTable
 from navigation.models import DataCycle
-from .models import ArincFile
-from .parsers import ARINCParser
+from navigation.routing import AirwayGraph, cache_airway_graph
+from navigation.snapshots import write_snapshot
+from .extraction import RECORD_SCHEMAS
+from .models import ArincFile, StagedChunk
+from .parsers import DeltaARINCParser
+from .postprocess import (
+    CycleValidationError,
+    backfill_geodesy,
+    refresh_planner_statistics,
+    resolve_fix_references,
+    validate_cycle,
+)
+from .profiling import IngestProfiler
+from .readers import SECTION_RECORDS, Chunk, iter_chunk_records, plan_chunks, read_header
 
 logger = logging.getLogger(__name__)
 
 
 @shared_task
 def process_arinc_file(file_id):
+    """
+    Start the ingestion pipeline of an uploaded ARINC file.
+
+    Registers the file's data cycle and splits its sections into chunks of ``ARINC_STAGING_CHUNK_SIZE``
+    records (see ``plan_chunks``), kept in the file's checkpoint. Every chunk is then staged by its own
+    task (``stage_arinc_chunk``), in parallel across the workers; the task staging the last chunk
+    promotes the staged rows (``promote_arinc_file``). A new cycle is registered as LOADING, and is not
+    served until the promotion marks it READY. Chunks staged by an earlier attempt are skipped, so
+    running it again resumes an interrupted load.
+    """
     arinc_file = None
     try:
         arinc_file = ArincFile.objects.get(id=file_id)
         arinc_file.status = "PROCESSING"
-        arinc_file.save()
-
-        tree = ET.parse(arinc_file.file.path)
-        root = tree.getroot()
-
-        cycle_id = root.get("cycle")
-        effective_date = datetime.strptime(root.get("effective_date"), "%Y-%m-%d").date()
-        expiry_date = effective_date + timedelta(days=28)
-
-        data_cycle, created = DataCycle.objects.get_or_create(
-            cycle_id=cycle_id,
-            defaults={
-                "effective_date": effective_date,
-                "expiry_date": expiry_date,
-                "source": root.find(".//DATA_SOURCE").text if root.find(".//DATA_SOURCE") is not None else "UNKNOWN",
-            },
-        )
+        arinc_file.save(update_fields=["status"])
 
-        arinc_file.cycle = data_cycle
-        arinc_file.save()
+        profiler = _profiler(file_id)
+        with profiler.stage("register cycle"):
+            header = read_header(arinc_file.file.path)
 
-        parser = ARINCParser(data_cycle)
-        parser.parse_file(root)
+            cycle_id = header["cycle"]
+            effective_date = datetime.strptime(header["effective_date"], "%Y-%m-%d").date()
+            expiry_date = effective_date + timedelta(days=28)
 
-        arinc_file.status = "COMPLETED"
-        arinc_file.save()
-        return f"Successfully processed file {arinc_file.file.name}"
+            data_cycle, created = DataCycle.objects.get_or_create(
+                cycle_id=cycle_id,
+                defaults={
+                    "effective_date": effective_date,
+                    "expiry_date": expiry_date,
+                    "source": header["data_source"] or "UNKNOWN",
+                    "status": "LOADING",
+                },
+            )
+            if data_cycle.status == "FAILED":
+                data_cycle.status = "LOADING"
+                data_cycle.save(update_fields=["status"])
+
+            arinc_file.cycle = data_cycle
+            arinc_file.save(update_fields=["cycle"])
+        # The plan of an earlier attempt is kept, so the chunks it staged keep their place.
+        if "chunks" not in arinc_file.checkpoint:
+            with profiler.stage("plan chunks"):
+                chunks = plan_chunks(arinc_file.file.path, settings.ARINC_STAGING_CHUNK_SIZE)
+            arinc_file.checkpoint = {"chunks": [{**chunk._asdict(), "staged": False} for chunk in chunks]}
+            arinc_file.save(update_fields=["checkpoint"])
+        # A reprocessed file starts its measurements over.
+        arinc_file.metrics = {"stages": profiler.stages}
+        arinc_file.save(update_fields=["metrics"])
+
+        pending = [number for number, chunk in enumerate(arinc_file.checkpoint["chunks"]) if not chunk["staged"]]
+        for number in pending:
+            stage_arinc_chunk.delay(file_id, number)
+        if not pending:
+            promote_arinc_file.delay(file_id)
+        return f"Started processing file {arinc_file.file.name}: {len(pending)} chunks to stage"
     except Exception as e:
-        logger.error(f"Error processing file {file_id}: {str(e)}")
-        if arinc_file:
-            arinc_file.status = "FAILED"
-            arinc_file.processing_errors = {"error": str(e)}
-            arinc_file.save()
+        _mark_failed(file_id, e)
         raise
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def stage_arinc_chunk(self, file_id, number):
+    """
+    Extract one chunk of an ARINC file, reading only its bytes, into a ``StagedChunk``.
+
+    The chunk is committed together with the file's checkpoint, so a retry skips it once staged.
+    The task staging the last chunk of the file starts the promotion: the checkpoint is locked
+    while it is updated, so exactly one task sees every chunk staged.
+    """
+    try:
+        arinc_file = ArincFile.objects.get(id=file_id)
+        planned = arinc_file.checkpoint["chunks"][number]
+        chunk = Chunk(*(planned[field] for field in Chunk._fields))
+        if planned["staged"]:
+            return f"Chunk {chunk.index} of {chunk.section} of file {arinc_file.file.name} already staged"
+
+        profiler = _profiler(file_id)
+        with profiler.stage(f"stage {chunk.section} {chunk.index}") as stage:
+            rows = []
+            for record in stage.timed(iter_chunk_records(arinc_file.file.path, chunk), "xml_parsing"):
+                started = perf_counter()
+                rows.append([record.tag, RECORD_SCHEMAS[record.tag].extract_values(record)])
+                stage.add("extraction", perf_counter() - started)
+                stage.count()
+            with stage.split("database"):
+                last = _stage_chunk(file_id, number, chunk, rows)
+        _save_metrics(file_id, profiler)
+    except Exception as e:
+        _retry_or_fail(self, file_id, e)
+    if last:
+        promote_arinc_file.delay(file_id)
+    return f"Staged {len(rows)} {chunk.section} records of file {arinc_file.file.name}"
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def promote_arinc_file(self, file_id):
+    """
+    Promote the staged rows of an ARINC file into the ``navigation`` tables in a single transaction.
+
+    Records unchanged since the previous completed cycle are copied forward in the database
+    instead of being written again (see ``DeltaARINCParser``). The fix references of segments and legs
+    are then resolved (see ``resolve_fix_references``), their distances and courses backfilled and
+    validated (see ``backfill_geodesy``), and the cycle checked as a whole (see ``validate_cycle``);
+    a cycle failing the checks is rolled back and marked FAILED.
+
+    The committed cycle is then warmed while it is still LOADING, so nobody reads it cold: the planner
+    statistics are refreshed, its airway graph is built for the route finder and its snapshot written.
+    Only then is it marked READY, and it takes over from the current cycle at its effective date (see
+    ``navigation.cycles``), or right away when that date has passed. Every step is measured as a stage of
+    the file's ``metrics`` (see ``IngestProfiler``).
+    """
+    try:
+        arinc_file = ArincFile.objects.select_related("cycle").get(id=file_id)
+        # A cycle already served is loaded again in place; its records change at the commit.
+        reloaded = arinc_file.cycle.status == "READY"
+        previous_cycle = (
+            DataCycle.objects.filter(effective_date__lt=arinc_file.cycle.effective_date, files__status="COMPLETED")
+            .order_by("-effective_date")
+            .first()
+        )
+        profiler = _profiler(file_id)
+        parser = DeltaARINCParser(
+            arinc_file.cycle,
+            previous_cycle=previous_cycle,
+            batch_size=settings.ARINC_BULK_BATCH_SIZE,
+            profiler=profiler,
+        )
+        try:
+            with ExitStack() as commit:
+                with transaction.atomic():
+                    parser.parse_rows(_staged_rows(arinc_file))
+                    with profiler.stage("resolve references"):
+                        resolve_fix_references(arinc_file.cycle)
+                    with profiler.stage("backfill geodesy"):
+                        coordinates = CoordinateTable.for_cycle(arinc_file.cycle)
+                        backfill_geodesy(arinc_file.cycle, coordinates)
+                    with profiler.stage("validate"):
+                        validate_cycle(arinc_file.cycle, previous_cycle)
+                    # Processing the file again plans and stages it from scratch.
+                    arinc_file.staged_chunks.all().delete()
+                    arinc_file.checkpoint = {}
+                    arinc_file.status = "COMPLETED"
+                    arinc_file.save(update_fields=["checkpoint", "status"])
+                    # Exited after the transaction, so this stage measures the commit.
+                    commit.enter_context(profiler.stage("commit"))
+        except CycleValidationError as e:
+            # Loading the same rows again would fail the same way, so the task is not retried.
+            _reject_cycle(arinc_file, e)
+            return f"Rejected file {arinc_file.file.name}: {e}"
+        try:
+            with profiler.stage("analyze"):
+                refresh_planner_statistics()
+        except Exception as e:
+            logger.warning(f"Could not refresh the planner statistics after loading cycle {arinc_file.cycle_id}: {e}")
+        try:
+            with profiler.stage("airway graph"):
+                cache_airway_graph(AirwayGraph.for_cycle(arinc_file.cycle, coordinates))
+        except Exception as e:
+            # The file is loaded; the route finder builds the graph on first use instead.
+            logger.warning(f"Could not build the airway graph of cycle {arinc_file.cycle_id}: {e}")
+        if settings.NAVIGATION_SNAPSHOT_DIR:
+            try:
+                with profiler.stage("snapshot"):
+                    write_snapshot(arinc_file.cycle)
+            except Exception as e:
+                # Lookups of this cycle are served from the database until a snapshot is written.
+                logger.warning(f"Could not write the snapshot of cycle {arinc_file.cycle_id}: {e}")
+        if reloaded:
+            # Only now, so requests rebuilding these responses read the new graph and snapshot, not the old ones.
+            invalidate_cached_responses()
+        else:
+            arinc_file.cycle.status = "READY"
+            arinc_file.cycle.save(update_fields=["status"])
+        invalidate_active_cycle()
+        _save_metrics(file_id, profiler)
+        return f"Successfully processed file {arinc_file.file.name}"
+    except Exception as e:
+        _retry_or_fail(self, file_id, e)
+
+
+def _stage_chunk(file_id, number, chunk, rows):
+    """Store the rows of a chunk and mark it staged in one transaction; return whether it was the last one."""
+    with transaction.atomic():
+        arinc_file = ArincFile.objects.select_for_update().get(id=file_id)
+        chunks = arinc_file.checkpoint["chunks"]
+        # Staged meanwhile by another delivery of the same task.
+        if chunks[number]["staged"]:
+            return False
+        StagedChunk.objects.create(arinc_file_id=file_id, section=chunk.section, index=chunk.index, rows=rows)
+        chunks[number]["staged"] = True
+        arinc_file.save(update_fields=["checkpoint"])
+    return all(planned["staged"] for planned in chunks)
+
+
+def _profiler(file_id):
+    """Return a profiler for a task of a file, dumping cProfile stats per file when ``ARINC_PROFILE_DIR`` is set."""
+    if settings.ARINC_PROFILE_DIR:
+        return IngestProfiler(os.path.join(settings.ARINC_PROFILE_DIR, str(file_id)))
+    return IngestProfiler()
+
+
+def _save_metrics(file_id, profiler):
+    """Merge the stages measured by a task into the file's metrics, replacing those of an earlier attempt."""
+    with transaction.atomic():
+        arinc_file = ArincFile.objects.select_for_update().get(id=file_id)
+        names = {stage["name"] for stage in profiler.stages}
+        stages = [stage for stage in arinc_file.metrics.get("stages", []) if stage["name"] not in names]
+        arinc_file.metrics = {"stages": stages + profiler.stages}
+        arinc_file.save(update_fields=["metrics"])
+
+
+def _staged_rows(arinc_file):
+    """Yield the staged ``(record tag, values)`` rows of a file, section by section in document order."""
+    for section in SECTION_RECORDS:
+        chunks = arinc_file.staged_chunks.filter(section=section).order_by("index")
+        for chunk in chunks.iterator(chunk_size=1):
+            for tag, values in chunk.rows:
+                yield tag, values
+
+
+def _retry_or_fail(task, file_id, exc):
+    """Retry a pipeline task, marking the file as failed once its retries are exhausted."""
+    if task.request.retries >= task.max_retries:
+        _mark_failed(file_id, exc)
+        raise exc
+    raise task.retry(exc=exc)
+
+
+def _reject_cycle(arinc_file, exc):
+    """Record why a loaded cycle was rejected and fail its file; a cycle already served keeps being served."""
+    cycle = arinc_file.cycle
+    cycle.refresh_from_db()
+    cycle.validation_report["readiness"] = exc.report
+    if cycle.status != "READY":
+        cycle.status = "FAILED"
+    cycle.save(update_fields=["validation_report", "status"])
+    _mark_failed(arinc_file.id, exc)
+
+
+def _mark_failed(file_id, exc):
+    logger.error(f"Error processing file {file_id}: {str(exc)}")
+    ArincFile.objects.filter(id=file_id).update(status="FAILED", processing_errors={"error": str(exc)})
@@ -2,6 +2,22 @@ import pytest
 from rest_framework.test import APIClient
 
 
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    # Uploaded files are written to the test's own directory, not to the repository's uploads/.
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
+
+
+@pytest.fixture
+def eager_celery():
+    from navdb_manager.celery import celery
+
+    celery.conf.update(task_always_eager=True, task_eager_propagates=True)
+    yield celery
+    celery.conf.update(task_always_eager=False, task_eager_propagates=False)
@@ -49,3 +49,152 @@ invalid_airport_xml = ET.fromstring("""
     </AIRPORT>
 </AIRPORTS>
 """)
+
+cycle_xml = """<ARINC424 cycle="2501" effective_date="2025-01-23">
+  <HEADER>
+    <DATA_SOURCE>TEST</DATA_SOURCE>
+  </HEADER>
+  <AIRPORTS>
+    <AIRPORT>
+      <AIRPORT_IDENTIFIER>KJFK</AIRPORT_IDENTIFIER>
+      <ICAO_CODE>KJFK</ICAO_CODE>
+      <AIRPORT_NAME>JOHN F KENNEDY INTL</AIRPORT_NAME>
+      <CITY_NAME>NEW YORK</CITY_NAME>
+      <STATE_CODE>NY</STATE_CODE>
+      <COUNTRY_CODE>US</COUNTRY_CODE>
+      <POSITION>
+        <LATITUDE>40.639751</LATITUDE>
+        <LONGITUDE>-73.778925</LONGITUDE>
+      </POSITION>
+      <ELEVATION>13</ELEVATION>
+      <MAGNETIC_VARIATION>13W</MAGNETIC_VARIATION>
+    </AIRPORT>
+    <AIRPORT>
+      <AIRPORT_IDENTIFIER>KBOS</AIRPORT_IDENTIFIER>
+      <ICAO_CODE>KBOS</ICAO_CODE>
+      <AIRPORT_NAME>GENERAL EDWARD LAWRENCE LOGAN INTL</AIRPORT_NAME>
+      <CITY_NAME>BOSTON</CITY_NAME>
+      <STATE_CODE>MA</STATE_CODE>
+      <COUNTRY_CODE>US</COUNTRY_CODE>
+      <POSITION>
+        <LATITUDE>42.362944</LATITUDE>
+        <LONGITUDE>-71.006389</LONGITUDE>
+      </POSITION>
+      <ELEVATION>20</ELEVATION>
+      <MAGNETIC_VARIATION>14W</MAGNETIC_VARIATION>
+    </AIRPORT>
+  </AIRPORTS>
+  <NAVAIDS>
+    <NAVAID>
+      <NAVAID_IDENTIFIER>JFK</NAVAID_IDENTIFIER>
+      <NAVAID_NAME>KENNEDY</NAVAID_NAME>
+      <NAVAID_TYPE>VOR/DME</NAVAID_TYPE>
+      <NAVAID_FREQUENCY>115.90</NAVAID_FREQUENCY>
+      <POSITION>
+        <LATITUDE>40.632842</LATITUDE>
+        <LONGITUDE>-73.771395</LONGITUDE>
+      </POSITION>
+      <ELEVATION>12</ELEVATION>
+      <MAGNETIC_VARIATION>13W</MAGNETIC_VARIATION>
+      <DME_POSITION>
+        <LATITUDE>40.632842</LATITUDE>
+        <LONGITUDE>-73.771395</LONGITUDE>
+        <ELEVATION>12</ELEVATION>
+      </DME_POSITION>
+    </NAVAID>
+  </NAVAIDS>
+  <WAYPOINTS>
+    <WAYPOINT>
+      <WAYPOINT_IDENTIFIER>MERIT</WAYPOINT_IDENTIFIER>
+      <WAYPOINT_NAME>MERIT</WAYPOINT_NAME>
+      <WAYPOINT_TYPE>ENROUTE</WAYPOINT_TYPE>
+      <POSITION>
+        <LATITUDE>41.381944</LATITUDE>
+        <LONGITUDE>-73.137500</LONGITUDE>
+      </POSITION>
+    </WAYPOINT>
+    <WAYPOINT>
+      <WAYPOINT_IDENTIFIER>MERIT</WAYPOINT_IDENTIFIER>
+      <WAYPOINT_NAME>DUPLICATE</WAYPOINT_NAME>
+      <WAYPOINT_TYPE>ENROUTE</WAYPOINT_TYPE>
+      <POSITION>
+        <LATITUDE>0</LATITUDE>
+        <LONGITUDE>0</LONGITUDE>
+      </POSITION>
+    </WAYPOINT>
+  </WAYPOINTS>
+  <AIRWAYS>
+    <AIRWAY>
+      <ROUTE_IDENTIFIER>J75</ROUTE_IDENTIFIER>
+      <ROUTE_TYPE>JETWAY</ROUTE_TYPE>
+      <SEQUENCE_NUMBER>10</SEQUENCE_NUMBER>
+      <FIX_IDENTIFIER>JFK</FIX_IDENTIFIER>
+      <FIX_TYPE>NAVAID</FIX_TYPE>
+      <NEXT_FIX_IDENTIFIER>MERIT</NEXT_FIX_IDENTIFIER>
+      <NEXT_FIX_TYPE>WAYPOINT</NEXT_FIX_TYPE>
+      <ROUTE_DISTANCE>55</ROUTE_DISTANCE>
+      <MINIMUM_ALTITUDE>18000</MINIMUM_ALTITUDE>
+      <MAXIMUM_ALTITUDE>45000</MAXIMUM_ALTITUDE>
+    </AIRWAY>
+    <AIRWAY>
+      <ROUTE_IDENTIFIER>J75</ROUTE_IDENTIFIER>
+      <ROUTE_TYPE>JETWAY</ROUTE_TYPE>
+      <SEQUENCE_NUMBER>20</SEQUENCE_NUMBER>
+      <FIX_IDENTIFIER>MERIT</FIX_IDENTIFIER>
+      <FIX_TYPE>WAYPOINT</FIX_TYPE>
+      <NEXT_FIX_IDENTIFIER>KBOS</NEXT_FIX_IDENTIFIER>
+      <NEXT_FIX_TYPE>AIRPORT</NEXT_FIX_TYPE>
+      <ROUTE_DISTANCE>120</ROUTE_DISTANCE>
+      <MINIMUM_ALTITUDE>18000</MINIMUM_ALTITUDE>
+      <MAXIMUM_ALTITUDE>45000</MAXIMUM_ALTITUDE>
+    </AIRWAY>
+  </AIRWAYS>
+  <PROCEDURES>
+    <APPROACH>
+      <AIRPORT_IDENTIFIER>KJFK</AIRPORT_IDENTIFIER>
+      <PROCEDURE_IDENTIFIER>I04L</PROCEDURE_IDENTIFIER>
+      <TRANSITION_IDENTIFIER>ALL</TRANSITION_IDENTIFIER>
+      <SEQUENCE_NUMBER>10</SEQUENCE_NUMBER>
+      <WAYPOINT_IDENTIFIER>MERIT</WAYPOINT_IDENTIFIER>
+      <WAYPOINT_TYPE>IAF</WAYPOINT_TYPE>
+      <POSITION>
+        <LATITUDE>41.381944</LATITUDE>
+        <LONGITUDE>-73.137500</LONGITUDE>
+      </POSITION>
+      <ALTITUDE_CONSTRAINT>3000A</ALTITUDE_CONSTRAINT>
+    </APPROACH>
+    <APPROACH>
+      <AIRPORT_IDENTIFIER>KJFK</AIRPORT_IDENTIFIER>
+      <PROCEDURE_IDENTIFIER>I04L</PROCEDURE_IDENTIFIER>
+      <TRANSITION_IDENTIFIER>ALL</TRANSITION_IDENTIFIER>
+      <SEQUENCE_NUMBER>20</SEQUENCE_NUMBER>
+      <WAYPOINT_IDENTIFIER>JFK</WAYPOINT_IDENTIFIER>
+      <WAYPOINT_TYPE>FAF</WAYPOINT_TYPE>
+      <POSITION>
+        <LATITUDE>40.632842</LATITUDE>
+        <LONGITUDE>-73.771395</LONGITUDE>
+      </POSITION>
+      <DISTANCE>12.5</DISTANCE>
+    </APPROACH>
+    <SID>
+      <AIRPORT_IDENTIFIER>KBOS</AIRPORT_IDENTIFIER>
+      <PROCEDURE_IDENTIFIER>LOGAN9</PROCEDURE_IDENTIFIER>
+      <TRANSITION_IDENTIFIER>RW04R</TRANSITION_IDENTIFIER>
+      <SEQUENCE_NUMBER>10</SEQUENCE_NUMBER>
+      <WAYPOINT_IDENTIFIER>MERIT</WAYPOINT_IDENTIFIER>
+      <WAYPOINT_TYPE>WAYPOINT</WAYPOINT_TYPE>
+      <POSITION>
+        <LATITUDE>41.381944</LATITUDE>
+        <LONGITUDE>-73.137500</LONGITUDE>
+      </POSITION>
+    </SID>
+    <STAR>
+      <AIRPORT_IDENTIFIER>KXXX</AIRPORT_IDENTIFIER>
+      <PROCEDURE_IDENTIFIER>GHOST1</PROCEDURE_IDENTIFIER>
+      <TRANSITION_IDENTIFIER>ALL</TRANSITION_IDENTIFIER>
+      <SEQUENCE_NUMBER>10</SEQUENCE_NUMBER>
+      <WAYPOINT_IDENTIFIER>MERIT</WAYPOINT_IDENTIFIER>
+    </STAR>
+  </PROCEDURES>
+</ARINC424>
+"""
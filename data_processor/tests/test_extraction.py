@@ -0,0 +1,55 @@
+import logging
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from data_processor.extraction import AIRPORT_SCHEMA, NAVAID_SCHEMA, PROCEDURE_SCHEMA, RecordSchema
+from data_processor.tests.test_data import cycle_xml, invalid_airport_xml, valid_airport_xml
+
+
+def find_text(element, path):
+    found = element.find(path)
+    return found.text.strip() if found is not None and found.text else None
+
+
+class TestRecordSchema:
+    def test_extract_airport(self):
+        fields = AIRPORT_SCHEMA.extract(valid_airport_xml.find("AIRPORT"))
+        assert fields["airport_id"] == "KJFK"
+        assert fields["latitude"] == 40.639751
+        assert fields["longitude"] == -73.778925
+        assert fields["elevation"] == 13
+        assert fields["transition_level"] == 180
+
+    @pytest.mark.parametrize("schema", [AIRPORT_SCHEMA, NAVAID_SCHEMA, PROCEDURE_SCHEMA])
+    def test_extract_matches_find_per_field(self, schema):
+        root = ET.fromstring(cycle_xml)
+        for record in root.iter():
+            values = schema.extract_values(record)
+            for path, converter, value in zip(schema._paths, schema._converters, values, strict=True):
+                text = find_text(record, path)
+                assert value == (converter(text) if text is not None else None)
+
+    def test_extract_nested_path_uses_first_match(self):
+        element = ET.fromstring(
+            "<NAVAID><DME_POSITION><LATITUDE>2</LATITUDE></DME_POSITION><POSITION><LATITUDE>1</LATITUDE></POSITION>"
+            "</NAVAID>"
+        )
+        fields = NAVAID_SCHEMA.extract(element)
+        assert fields["latitude"] == 2.0
+        assert fields["dme_latitude"] == 2.0
+
+    def test_child_path_ignores_descendants(self):
+        schema = RecordSchema({"elevation": ("ELEVATION", int)})
+        element = ET.fromstring("<NAVAID><DME_POSITION><ELEVATION>12</ELEVATION></DME_POSITION></NAVAID>")
+        assert schema.extract(element) == {"elevation": None}
+
+    def test_invalid_value_logs_warning(self, caplog):
+        caplog.set_level(logging.WARNING)
+        fields = AIRPORT_SCHEMA.extract(invalid_airport_xml.find("AIRPORT"))
+        assert fields["latitude"] is None
+        assert "Invalid float value for tag './/LATITUDE'" in caplog.text
+
+    def test_unsupported_path(self):
+        with pytest.raises(ValueError):
+            RecordSchema({"value": ("A/B/C", str)})
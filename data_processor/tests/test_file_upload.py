@@ -1,6 +1,7 @@
 import io
 
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 
@@ -25,3 +26,12 @@ class TestFileUpload:
         arinc_file = ArincFile.objects.first()
         assert response.data["id"] == arinc_file.id
         mock_task.assert_called_once_with(arinc_file.id)
+
+    def test_file_detail_exposes_metrics(self, api_client):
+        metrics = {"stages": [{"name": "commit", "seconds": 0.01, "records": 0, "queries": 0}]}
+        arinc_file = ArincFile.objects.create(file=SimpleUploadedFile("cycle.xml", b"<ARINC424/>"), metrics=metrics)
+
+        response = api_client.get(reverse("upload-detail", args=[arinc_file.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["metrics"] == metrics
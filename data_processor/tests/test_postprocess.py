@@ -0,0 +1,117 @@
+import xml.etree.ElementTree as ET
+from decimal import Decimal
+
+import pytest
+from model_bakery import baker
+
+from data_processor.parsers import BulkARINCParser
+from data_processor.postprocess import backfill_geodesy, resolve_fix_references
+from data_processor.tests.test_data import cycle_xml
+from navigation.models import Airport, AirwaySegment, Navaid, ProcedureLeg, Waypoint
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make("DataCycle")
+    BulkARINCParser(data_cycle=cycle).parse_file(ET.fromstring(cycle_xml))
+    return cycle
+
+
+@pytest.mark.django_db
+class TestBackfillGeodesy:
+    def test_backfills_missing_segment_courses(self, cycle):
+        report = backfill_geodesy(cycle)
+
+        segments = dict(AirwaySegment.objects.values_list("sequence_number", "magnetic_course"))
+        # JFK to MERIT is 032 true; the JFK navaid's 13W variation makes it 045 magnetic.
+        assert segments[10] == 45
+        assert report["segments"]["checked"] == 2
+        assert report["segments"]["backfilled_course"] == 2
+        assert report["segments"]["unresolved"] == 0
+
+    def test_keeps_and_validates_source_distances(self, cycle):
+        report = backfill_geodesy(cycle)
+
+        distances = dict(AirwaySegment.objects.values_list("sequence_number", "route_distance"))
+        assert distances == {10: 55, 20: 120}
+        # MERIT to KBOS is about 111 nm, so the 120 nm in the source is reported.
+        assert report["segments"]["distance_mismatches"] == 1
+        assert report["segments"]["mismatch_samples"][0]["record"] == "J75/20"
+
+    def test_backfills_leg_course_from_previous_leg(self, cycle):
+        report = backfill_geodesy(cycle)
+
+        leg = ProcedureLeg.objects.get(transition__procedure__procedure_id="I04L", sequence_number=20)
+        assert leg.distance == Decimal("12.50")
+        # MERIT to JFK is 213 true; KJFK's 13W variation makes it 226 magnetic.
+        assert leg.course == 226
+        assert report["legs"]["checked"] == 1
+        assert report["legs"]["distance_mismatches"] == 1
+        assert report["legs"]["mismatch_samples"][0]["computed_distance"] == pytest.approx(53.36, abs=0.01)
+
+    def test_backfills_leg_distance(self, cycle):
+        ProcedureLeg.objects.filter(sequence_number=20).update(distance=None)
+
+        report = backfill_geodesy(cycle)
+
+        leg = ProcedureLeg.objects.get(transition__procedure__procedure_id="I04L", sequence_number=20)
+        assert leg.distance == Decimal("53.36")
+        assert report["legs"]["backfilled_distance"] == 1
+
+    def test_reports_unresolved_fixes(self, cycle):
+        AirwaySegment.objects.filter(sequence_number=20).update(next_fix_identifier="NOWHERE")
+
+        report = backfill_geodesy(cycle)
+
+        assert report["segments"]["unresolved"] == 1
+
+    def test_report_is_stored_on_cycle(self, cycle):
+        report = backfill_geodesy(cycle)
+
+        cycle.refresh_from_db()
+        assert cycle.validation_report["geodesy"] == report
+
+
+@pytest.mark.django_db
+class TestResolveFixReferences:
+    def test_resolves_segment_fixes_and_coordinates(self, cycle):
+        report = resolve_fix_references(cycle)
+
+        first, second = AirwaySegment.objects.order_by("sequence_number")
+        jfk, merit = Navaid.objects.get(navaid_id="JFK"), Waypoint.objects.get(waypoint_id="MERIT")
+        assert (first.fix_navaid, first.fix_airport, first.fix_waypoint) == (jfk, None, None)
+        assert (first.fix_latitude, first.fix_longitude) == (jfk.latitude, jfk.longitude)
+        assert first.next_fix_waypoint == merit
+        assert (first.next_fix_latitude, first.next_fix_longitude) == (merit.latitude, merit.longitude)
+        assert second.next_fix_airport == Airport.objects.get(airport_id="KBOS")
+        assert report["segments"] == {"checked": 4, "unresolved": 0, "unresolved_fixes": []}
+
+    def test_resolves_legs_by_waypoint_type(self, cycle):
+        resolve_fix_references(cycle)
+
+        legs = ProcedureLeg.objects.filter(transition__procedure__procedure_id="I04L").order_by("sequence_number")
+        assert legs[0].fix_waypoint == Waypoint.objects.get(waypoint_id="MERIT")
+        # No waypoint is named JFK, so the final approach fix falls back to the navaid.
+        assert (legs[1].fix_waypoint, legs[1].fix_navaid) == (None, Navaid.objects.get(navaid_id="JFK"))
+
+    def test_navaid_legs_only_match_navaids(self, cycle):
+        ProcedureLeg.objects.filter(transition__procedure__procedure_id="LOGAN9").update(waypoint_type="NAVAID")
+
+        report = resolve_fix_references(cycle)
+
+        leg = ProcedureLeg.objects.get(transition__procedure__procedure_id="LOGAN9")
+        assert leg.fix_waypoint is None
+        assert report["legs"]["unresolved"] == 1
+        assert report["legs"]["unresolved_fixes"] == [{"fix": "NAVAID/MERIT", "references": 1}]
+
+    def test_reports_unresolved_references(self, cycle):
+        AirwaySegment.objects.filter(sequence_number=20).update(next_fix_identifier="NOWHERE")
+
+        report = resolve_fix_references(cycle)
+
+        segment = AirwaySegment.objects.get(sequence_number=20)
+        assert (segment.next_fix_airport, segment.next_fix_latitude) == (None, None)
+        assert report["segments"]["unresolved"] == 1
+        assert report["segments"]["unresolved_fixes"] == [{"fix": "AIRPORT/NOWHERE", "references": 1}]
+        cycle.refresh_from_db()
+        assert cycle.validation_report["references"] == report
@@ -0,0 +1,58 @@
+import pstats
+
+import pytest
+from model_bakery import baker
+
+from data_processor.profiling import IngestProfiler
+from navigation.models import Airport
+
+
+@pytest.mark.django_db
+class TestIngestProfiler:
+    def test_stage_counts_queries_and_rows_written(self):
+        profiler = IngestProfiler()
+        cycle = baker.make("DataCycle")
+
+        with profiler.stage("write airports") as stage:
+            Airport.objects.bulk_create(baker.prepare("Airport", cycle=cycle, _quantity=3))
+            Airport.objects.filter(cycle=cycle).update(name="X")
+            list(Airport.objects.all())
+            stage.count(3)
+
+        (metrics,) = profiler.stages
+        assert metrics["name"] == "write airports"
+        assert metrics["records"] == 3
+        assert metrics["queries"] == 3
+        assert metrics["rows_written"] == 6
+        assert metrics["seconds"] >= 0
+        assert metrics["peak_rss_mb"] > 0
+        assert "splits" not in metrics and "profile" not in metrics
+
+    def test_splits(self):
+        profiler = IngestProfiler()
+
+        with profiler.stage("read") as stage:
+            assert list(stage.timed(range(3), "iteration")) == [0, 1, 2]
+            with stage.split("work"):
+                pass
+            stage.add("work", 1.0)
+
+        assert set(profiler.stages[0]["splits"]) == {"iteration", "work"}
+        assert profiler.stages[0]["splits"]["work"] >= 1.0
+
+    def test_failed_stage_is_not_recorded(self):
+        profiler = IngestProfiler()
+
+        with pytest.raises(ValueError), profiler.stage("fail"):
+            raise ValueError
+
+        assert profiler.stages == []
+
+    def test_profile_dump(self, tmp_path):
+        profiler = IngestProfiler(tmp_path / "profiles")
+
+        with profiler.stage("parse procedures"):
+            sorted(range(1000))
+
+        assert profiler.stages[0]["profile"] == str(tmp_path / "profiles" / "parse-procedures.prof")
+        assert pstats.Stats(profiler.stages[0]["profile"]).total_calls > 0
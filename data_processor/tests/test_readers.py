@@ -0,0 +1,82 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+from model_bakery import baker
+
+from data_processor.parsers import BulkARINCParser
+from data_processor.readers import iter_chunk_records, iter_records, plan_chunks, read_header
+from data_processor.tests.test_data import cycle_xml
+from navigation.models import Airport, AirwaySegment, ProcedureLeg
+
+
+@pytest.fixture
+def cycle_file(tmp_path):
+    path = tmp_path / "cycle.xml"
+    path.write_text(cycle_xml)
+    return path
+
+
+class TestReaders:
+    def test_read_header(self, cycle_file):
+        assert read_header(cycle_file) == {"cycle": "2501", "effective_date": "2025-01-23", "data_source": "TEST"}
+
+    def test_read_header_without_data_source(self, tmp_path):
+        path = tmp_path / "cycle.xml"
+        path.write_text('<ARINC424 cycle="2501" effective_date="2025-01-23"><AIRPORTS/></ARINC424>')
+        assert read_header(path)["data_source"] is None
+
+    def test_iter_records_yields_records_in_document_order(self, cycle_file):
+        tags = [record.tag for record in iter_records(cycle_file)]
+        assert tags == ["AIRPORT"] * 2 + ["NAVAID"] + ["WAYPOINT"] * 2 + ["AIRWAY"] * 2 + ["APPROACH"] * 2 + [
+            "SID",
+            "STAR",
+        ]
+
+    def test_iter_records_clears_handled_records(self, cycle_file):
+        records = []
+        for record in iter_records(cycle_file):
+            assert len(record) > 0
+            records.append(record)
+        assert all(len(record) == 0 for record in records)
+
+
+@pytest.mark.django_db
+class TestParseRecords:
+    def test_parse_records_from_stream(self, cycle_file):
+        cycle = baker.make("DataCycle")
+        BulkARINCParser(data_cycle=cycle).parse_records(iter_records(cycle_file))
+
+        assert Airport.objects.filter(cycle=cycle).count() == 2
+        assert AirwaySegment.objects.filter(airway__cycle=cycle).count() == 2
+        assert ProcedureLeg.objects.filter(transition__procedure__cycle=cycle).count() == 3
+
+
+class TestChunks:
+    def test_chunks_partition_sections(self, cycle_file):
+        chunks = plan_chunks(cycle_file, chunk_size=2)
+
+        assert [(chunk.section, chunk.index, chunk.records) for chunk in chunks] == [
+            ("AIRPORTS", 0, 2),
+            ("NAVAIDS", 0, 1),
+            ("WAYPOINTS", 0, 2),
+            ("AIRWAYS", 0, 2),
+            ("PROCEDURES", 0, 2),
+            ("PROCEDURES", 1, 2),
+        ]
+
+    def test_chunk_records_match_streamed_records(self, cycle_file):
+        expected = [ET.tostring(record).strip() for record in iter_records(cycle_file)]
+
+        records = [
+            ET.tostring(record).strip()
+            for chunk in plan_chunks(cycle_file, chunk_size=3)
+            for record in iter_chunk_records(cycle_file, chunk)
+        ]
+
+        assert records == expected
+
+    def test_empty_sections_have_no_chunks(self, tmp_path):
+        path = tmp_path / "cycle.xml"
+        path.write_text('<ARINC424 cycle="2501"><AIRPORTS/><NAVAIDS >\n</NAVAIDS></ARINC424>')
+
+        assert plan_chunks(path, chunk_size=2) == []
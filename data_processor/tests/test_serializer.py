@@ -1,3 +1,4 @@
+import xml.etree.ElementTree as ET
 from decimal import Decimal
 
 import pytest
@@ -5,9 +6,10 @@ import logging
 
 from model_bakery import baker
 
-from data_processor.tests.test_data import valid_airport_xml, invalid_airport_xml
+from data_processor.tests.test_data import valid_airport_xml, invalid_airport_xml, cycle_xml
 from navigation.models import Airport, Navaid, Waypoint, Airway, AirwaySegment, Procedure, ProcedureLeg, DataCycle
-from data_processor.parsers import ARINCParser
+from data_processor.parsers import ARINCParser, BulkARINCParser, DeltaARINCParser
+from data_processor.extraction import RECORD_SCHEMAS
 
 
 @pytest.fixture
@@ -48,3 +50,181 @@ class TestFileParser:
             parser.parse_file(invalid_airport_xml)
         assert Airport.objects.count() == 0
         assert "Parsing failed — rolling back transaction." in caplog.text
+
+
+@pytest.fixture
+def cycle_root():
+    return ET.fromstring(cycle_xml)
+
+
+@pytest.mark.django_db
+class TestBulkParser:
+    def test_parse_file_matches_per_row_parser(self, cycle, cycle_root):
+        ARINCParser(data_cycle=cycle).parse_file(cycle_root)
+        expected = {
+            model: sorted(model.objects.values_list(*fields))
+            for model, fields in self.snapshot_fields().items()
+        }
+        DataCycle.objects.all().delete()
+
+        bulk_cycle = baker.make("DataCycle")
+        BulkARINCParser(data_cycle=bulk_cycle, batch_size=3).parse_file(cycle_root)
+
+        for model, fields in self.snapshot_fields().items():
+            assert sorted(model.objects.values_list(*fields)) == expected[model]
+
+    def test_parse_file_dedupes_on_natural_keys(self, cycle, cycle_root):
+        BulkARINCParser(data_cycle=cycle).parse_file(cycle_root)
+
+        waypoint = Waypoint.objects.get(cycle=cycle, waypoint_id="MERIT")
+        assert waypoint.name == "MERIT"
+        assert waypoint.grid_cell is not None
+        assert AirwaySegment.objects.filter(airway__airway_id="J75").count() == 2
+        assert ProcedureLeg.objects.filter(transition__procedure__procedure_id="I04L").count() == 2
+
+    def test_parse_file_skips_rows_already_stored(self, cycle, cycle_root):
+        BulkARINCParser(data_cycle=cycle).parse_file(cycle_root)
+        BulkARINCParser(data_cycle=cycle).parse_file(cycle_root)
+
+        assert Airport.objects.filter(cycle=cycle).count() == 2
+        assert ProcedureLeg.objects.count() == 3
+
+    def test_parse_file_does_not_query_per_record(self, cycle, cycle_root, django_assert_max_num_queries):
+        # One natural key load and one insert per model, plus the transaction savepoint.
+        with django_assert_max_num_queries(2 * len(BulkARINCParser.WRITE_ORDER) + 2):
+            BulkARINCParser(data_cycle=cycle).parse_file(cycle_root)
+
+    def test_parse_file_logs_missing_airport(self, cycle, cycle_root, caplog):
+        BulkARINCParser(data_cycle=cycle).parse_file(cycle_root)
+
+        assert "STAR: Airport 'KXXX' not found." in caplog.text
+        assert not Procedure.objects.filter(procedure_id="GHOST1").exists()
+
+    def test_parse_file_rolls_back_on_error(self, cycle, cycle_root, mocker):
+        parser = BulkARINCParser(data_cycle=cycle, batch_size=1)
+        mocker.patch.object(parser, "_parse_procedures", side_effect=Exception("Boom"))
+        with pytest.raises(Exception, match="Boom"):
+            parser.parse_file(cycle_root)
+        assert Airport.objects.count() == 0
+
+    @staticmethod
+    def snapshot_fields():
+        return {
+            Airport: ("airport_id", "name", "latitude", "longitude", "grid_cell"),
+            Navaid: ("navaid_id", "frequency", "dme_latitude"),
+            Waypoint: ("waypoint_id", "name", "grid_cell"),
+            AirwaySegment: ("airway__airway_id", "sequence_number", "fix_identifier", "route_distance"),
+            Procedure: ("airport__airport_id", "procedure_id", "procedure_type"),
+            ProcedureLeg: (
+                "transition__procedure__procedure_id",
+                "transition__transition_id",
+                "sequence_number",
+                "waypoint_identifier",
+                "distance",
+            ),
+        }
+
+
+@pytest.fixture
+def next_cycle_root():
+    return ET.fromstring(
+        cycle_xml.replace('cycle="2501"', 'cycle="2502"')
+        .replace("<WAYPOINT_NAME>MERIT</WAYPOINT_NAME>", "<WAYPOINT_NAME>MERIT RENAMED</WAYPOINT_NAME>")
+        .replace("<NAVAID_IDENTIFIER>JFK</NAVAID_IDENTIFIER>", "<NAVAID_IDENTIFIER>JFX</NAVAID_IDENTIFIER>")
+        .replace("<WAYPOINT_TYPE>WAYPOINT</WAYPOINT_TYPE>", "<WAYPOINT_TYPE>IF</WAYPOINT_TYPE>")
+    )
+
+
+@pytest.mark.django_db
+class TestDeltaParser:
+    def test_first_cycle_is_all_added(self, cycle, cycle_root):
+        DeltaARINCParser(data_cycle=cycle).parse_file(cycle_root)
+
+        cycle.refresh_from_db()
+        assert cycle.change_summary["Airport"] == {"added": 2, "changed": 0, "unchanged": 0, "removed": 0}
+        assert Airway.objects.get(cycle=cycle).fingerprint
+
+    def test_next_cycle_matches_full_load(self, cycle, cycle_root, next_cycle_root):
+        DeltaARINCParser(data_cycle=cycle).parse_file(cycle_root)
+        full_cycle = baker.make("DataCycle")
+        BulkARINCParser(data_cycle=full_cycle).parse_file(next_cycle_root)
+        delta_cycle = baker.make("DataCycle")
+
+        DeltaARINCParser(data_cycle=delta_cycle, previous_cycle=cycle, batch_size=2).parse_file(next_cycle_root)
+
+        for model, (cycle_lookup, fields) in self.snapshot_fields().items():
+            full = sorted(model.objects.filter(**{cycle_lookup: full_cycle}).values_list(*fields))
+            delta = sorted(model.objects.filter(**{cycle_lookup: delta_cycle}).values_list(*fields))
+            assert delta == full, model
+
+    def test_next_cycle_change_summary(self, cycle, cycle_root, next_cycle_root):
+        DeltaARINCParser(data_cycle=cycle).parse_file(cycle_root)
+        next_cycle = baker.make("DataCycle")
+
+        DeltaARINCParser(data_cycle=next_cycle, previous_cycle=cycle).parse_file(next_cycle_root)
+
+        summary = DataCycle.objects.get(pk=next_cycle.pk).change_summary
+        assert summary["previous_cycle"] == cycle.pk
+        assert summary["Airport"] == {"added": 0, "changed": 0, "unchanged": 2, "removed": 0}
+        assert summary["Navaid"] == {"added": 1, "changed": 0, "unchanged": 0, "removed": 1}
+        assert summary["Waypoint"] == {"added": 0, "changed": 1, "unchanged": 0, "removed": 0}
+        assert summary["Airway"] == {"added": 0, "changed": 0, "unchanged": 1, "removed": 0}
+        assert summary["Procedure"]["unchanged"] == 1
+        assert summary["Procedure"]["changed"] == 1
+
+    def test_unchanged_records_are_copied_in_the_database(self, cycle, cycle_root, next_cycle_root, mocker):
+        DeltaARINCParser(data_cycle=cycle).parse_file(cycle_root)
+        next_cycle = baker.make("DataCycle")
+        bulk_create = mocker.spy(AirwaySegment.objects, "bulk_create")
+
+        DeltaARINCParser(data_cycle=next_cycle, previous_cycle=cycle).parse_file(next_cycle_root)
+
+        bulk_create.assert_not_called()
+        assert list(
+            AirwaySegment.objects.filter(airway__cycle=next_cycle).values_list("sequence_number", "next_fix_identifier")
+        ) == [(10, "MERIT"), (20, "KBOS")]
+
+    def test_complete_groups_are_written_every_batch(self, cycle, cycle_root):
+        written = []
+
+        def rows():
+            for record in [*cycle_root.find("AIRPORTS"), *cycle_root.find("PROCEDURES")]:
+                if record.tag == "STAR":
+                    written.append(list(Procedure.objects.filter(cycle=cycle).values_list("procedure_id", flat=True)))
+                yield record.tag, RECORD_SCHEMAS[record.tag].extract_values(record)
+
+        DeltaARINCParser(data_cycle=cycle, batch_size=1).parse_rows(rows())
+
+        # KJFK's approach is complete once the SID starts; the SID is still being read when the STAR comes.
+        assert written == [["I04L"]]
+        assert ProcedureLeg.objects.filter(transition__procedure__cycle=cycle).count() == 3
+
+    def test_rejects_group_split_across_the_file(self, cycle, cycle_root):
+        approach, _, sid, _ = cycle_root.find("PROCEDURES")
+        rows = [(record.tag, RECORD_SCHEMAS[record.tag].extract_values(record)) for record in (approach, sid, approach)]
+
+        with pytest.raises(Exception, match="Procedure KJFK I04L are not contiguous"):
+            DeltaARINCParser(data_cycle=cycle).parse_rows(rows)
+
+    @staticmethod
+    def snapshot_fields():
+        return {
+            Airport: ("cycle", ("airport_id", "name", "latitude", "grid_cell")),
+            Navaid: ("cycle", ("navaid_id", "frequency")),
+            Waypoint: ("cycle", ("waypoint_id", "name")),
+            Airway: ("cycle", ("airway_id", "route_type")),
+            AirwaySegment: ("airway__cycle", ("airway__airway_id", "sequence_number", "fix_identifier")),
+            Procedure: ("cycle", ("airport__airport_id", "procedure_id", "procedure_type")),
+            ProcedureLeg: (
+                "transition__procedure__cycle",
+                (
+                    "transition__procedure__airport__airport_id",
+                    "transition__procedure__procedure_id",
+                    "transition__transition_id",
+                    "sequence_number",
+                    "waypoint_identifier",
+                    "waypoint_type",
+                    "distance",
+                ),
+            ),
+        }
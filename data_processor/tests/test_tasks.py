@@ -0,0 +1,297 @@
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from model_bakery import baker
+
+from data_processor.models import ArincFile, StagedChunk
+from data_processor.readers import plan_chunks
+from data_processor.tasks import process_arinc_file, promote_arinc_file, stage_arinc_chunk
+from data_processor.tests.test_data import cycle_xml
+from navigation.cycles import get_active_cycle, invalidate_active_cycle, resolve_active_cycle
+from navigation.models import Airport, AirwaySegment, DataCycle, Navaid, ProcedureLeg
+from navigation.routing import GRAPH_CACHE_KEY
+
+
+@pytest.fixture
+def arinc_file():
+    return ArincFile.objects.create(file=SimpleUploadedFile("cycle.xml", cycle_xml.encode()))
+
+
+@pytest.fixture
+def staged_file(arinc_file):
+    arinc_file.cycle = DataCycle.objects.create(
+        cycle_id="2501", effective_date="2025-01-23", expiry_date="2025-02-20", source="TEST"
+    )
+    arinc_file.save()
+    return arinc_file
+
+
+@pytest.fixture
+def planned_file(staged_file, settings):
+    settings.ARINC_STAGING_CHUNK_SIZE = 2
+    chunks = plan_chunks(staged_file.file.path, settings.ARINC_STAGING_CHUNK_SIZE)
+    staged_file.checkpoint = {"chunks": [{**chunk._asdict(), "staged": False} for chunk in chunks]}
+    staged_file.save()
+    return staged_file
+
+
+def chunk_numbers(arinc_file, section):
+    return [number for number, chunk in enumerate(arinc_file.checkpoint["chunks"]) if chunk["section"] == section]
+
+
+@pytest.mark.django_db
+class TestProcessArincFile:
+    def test_process_arinc_file_completes(self, arinc_file, eager_celery):
+        process_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        assert arinc_file.status == "COMPLETED"
+        assert arinc_file.cycle == DataCycle.objects.get(cycle_id="2501", source="TEST")
+        assert Airport.objects.filter(cycle=arinc_file.cycle).count() == 2
+        assert ProcedureLeg.objects.filter(transition__procedure__cycle=arinc_file.cycle).count() == 3
+        assert arinc_file.checkpoint == {}
+        assert arinc_file.cycle.validation_report["geodesy"]["segments"]["checked"] == 2
+        assert not StagedChunk.objects.exists()
+
+    def test_process_arinc_file_marks_cycle_ready(self, arinc_file, eager_celery):
+        process_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        assert arinc_file.cycle.status == "READY"
+        assert arinc_file.cycle.validation_report["readiness"]["records"]["Airport"] == 2
+        assert get_active_cycle() == arinc_file.cycle
+
+    def test_cycle_is_not_served_until_warmed(self, arinc_file, eager_celery, mocker):
+        served = []
+
+        def build_graph(graph):
+            invalidate_active_cycle()
+            served.append((DataCycle.objects.get(cycle_id="2501").status, get_active_cycle()))
+            return graph
+
+        mocker.patch("data_processor.tasks.cache_airway_graph", side_effect=build_graph)
+
+        process_arinc_file(arinc_file.id)
+
+        assert served == [("LOADING", None)]
+        assert get_active_cycle().cycle_id == "2501"
+
+    def test_process_arinc_file_records_metrics(self, arinc_file, eager_celery):
+        process_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        stages = {stage["name"]: stage for stage in arinc_file.metrics["stages"]}
+        assert list(stages) == [
+            "register cycle",
+            "plan chunks",
+            "stage AIRPORTS 0",
+            "stage NAVAIDS 0",
+            "stage WAYPOINTS 0",
+            "stage AIRWAYS 0",
+            "stage PROCEDURES 0",
+            "parse airports",
+            "parse navaids",
+            "parse waypoints",
+            "parse airways",
+            "parse procedures",
+            "flush",
+            "resolve references",
+            "backfill geodesy",
+            "validate",
+            "commit",
+            "analyze",
+            "airway graph",
+        ]
+        assert stages["stage PROCEDURES 0"]["records"] == 4
+        assert set(stages["stage PROCEDURES 0"]["splits"]) == {"xml_parsing", "extraction", "database"}
+        assert stages["parse airports"]["records"] == 2
+        # Fewer records than a batch: they are all written by the final flush.
+        assert stages["flush"]["rows_written"] >= 15
+        assert stages["resolve references"]["queries"] > 0
+
+    def test_process_arinc_file_dumps_profiles(self, arinc_file, eager_celery, settings, tmp_path):
+        settings.ARINC_PROFILE_DIR = str(tmp_path / "profiles")
+
+        process_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        assert (tmp_path / "profiles" / str(arinc_file.id) / "commit.prof").exists()
+        assert all(stage["profile"] for stage in arinc_file.metrics["stages"])
+
+    def test_process_arinc_file_marks_failure(self, arinc_file, eager_celery, mocker):
+        mocker.patch("data_processor.tasks.DeltaARINCParser.parse_rows", side_effect=Exception("Boom"))
+        mocker.patch.object(promote_arinc_file, "max_retries", 0)
+        with pytest.raises(Exception, match="Boom"):
+            process_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        assert arinc_file.status == "FAILED"
+        assert "Boom" in arinc_file.processing_errors
+        assert not Airport.objects.exists()
+
+    def test_process_arinc_file_without_eager_tasks(self, arinc_file, mocker):
+        # Tasks are only queued here: the pipeline must not need a result backend to run on workers.
+        stage = mocker.spy(stage_arinc_chunk, "delay")
+        promote = mocker.patch.object(promote_arinc_file, "delay")
+
+        process_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        assert arinc_file.status == "PROCESSING"
+        assert [call.args for call in stage.call_args_list] == [(arinc_file.id, number) for number in range(5)]
+        for number in reversed(range(5)):
+            promote.assert_not_called()
+            stage_arinc_chunk(arinc_file.id, number)
+        promote.assert_called_once_with(arinc_file.id)
+
+        promote_arinc_file(arinc_file.id)
+
+        arinc_file.refresh_from_db()
+        assert arinc_file.status == "COMPLETED"
+        assert arinc_file.cycle.status == "READY"
+
+    def test_process_arinc_file_resumes_staging(self, planned_file, mocker):
+        stage_arinc_chunk(planned_file.id, 0)
+        stage = mocker.patch.object(stage_arinc_chunk, "delay")
+
+        process_arinc_file(planned_file.id)
+
+        assert [call.args for call in stage.call_args_list] == [
+            (planned_file.id, number) for number in range(1, len(planned_file.checkpoint["chunks"]))
+        ]
+
+
+@pytest.mark.django_db
+class TestStageArincChunk:
+    def test_stage_section_in_chunks(self, planned_file):
+        for number in chunk_numbers(planned_file, "PROCEDURES"):
+            stage_arinc_chunk(planned_file.id, number)
+
+        chunks = list(StagedChunk.objects.filter(arinc_file=planned_file).values_list("index", "rows"))
+        assert [(index, [tag for tag, _ in rows]) for index, rows in chunks] == [
+            (0, ["APPROACH", "APPROACH"]),
+            (1, ["SID", "STAR"]),
+        ]
+        planned_file.refresh_from_db()
+        assert [chunk["staged"] for chunk in planned_file.checkpoint["chunks"]] == [False] * 4 + [True] * 2
+
+    def test_stage_chunk_skips_staged_chunk(self, planned_file):
+        number = chunk_numbers(planned_file, "AIRPORTS")[0]
+        stage_arinc_chunk(planned_file.id, number)
+
+        stage_arinc_chunk(planned_file.id, number)
+
+        assert StagedChunk.objects.filter(arinc_file=planned_file).count() == 1
+
+    def test_last_chunk_starts_promotion(self, planned_file, mocker):
+        promote = mocker.patch.object(promote_arinc_file, "delay")
+        numbers = range(len(planned_file.checkpoint["chunks"]))
+
+        for number in numbers:
+            stage_arinc_chunk(planned_file.id, number)
+            assert promote.called == (number == numbers[-1])
+
+        promote.assert_called_once_with(planned_file.id)
+
+
+@pytest.mark.django_db
+class TestPromoteArincFile:
+    def test_promote_is_all_or_nothing(self, planned_file, eager_celery, mocker):
+        for number in chunk_numbers(planned_file, "AIRPORTS") + chunk_numbers(planned_file, "PROCEDURES"):
+            stage_arinc_chunk(planned_file.id, number)
+        mocker.patch("data_processor.tasks.DeltaARINCParser._flush", side_effect=Exception("Boom"))
+        mocker.patch.object(promote_arinc_file, "max_retries", 0)
+
+        with pytest.raises(Exception, match="Boom"):
+            promote_arinc_file.apply(args=[planned_file.id])
+
+        planned_file.refresh_from_db()
+        assert planned_file.status == "FAILED"
+        assert not Airport.objects.exists()
+        assert StagedChunk.objects.filter(arinc_file=planned_file).count() == 3
+
+    def test_promote_compares_with_previous_completed_cycle(self, arinc_file, eager_celery):
+        process_arinc_file(arinc_file.id)
+        next_xml = cycle_xml.replace(
+            'cycle="2501" effective_date="2025-01-23"', 'cycle="2502" effective_date="2025-02-20"'
+        )
+        next_file = ArincFile.objects.create(file=SimpleUploadedFile("next.xml", next_xml.encode()))
+
+        process_arinc_file(next_file.id)
+
+        next_file.refresh_from_db()
+        assert next_file.cycle.change_summary["previous_cycle"] == "2501"
+        assert next_file.cycle.change_summary["Airport"]["unchanged"] == 2
+        assert Airport.objects.filter(cycle=next_file.cycle).count() == 2
+
+    def test_promote_rejects_cycle_missing_records(self, arinc_file, eager_celery, mocker):
+        process_arinc_file(arinc_file.id)
+        arinc_file.refresh_from_db()
+        baker.make("Airport", cycle=arinc_file.cycle, _quantity=8)
+        next_xml = cycle_xml.replace(
+            'cycle="2501" effective_date="2025-01-23"', 'cycle="2502" effective_date="2025-02-20"'
+        )
+        next_file = ArincFile.objects.create(file=SimpleUploadedFile("next.xml", next_xml.encode()))
+        retry = mocker.spy(promote_arinc_file, "retry")
+
+        process_arinc_file(next_file.id)
+
+        next_file.refresh_from_db()
+        assert next_file.status == "FAILED"
+        assert "Airport: 2 records, down from 10 in 2501" in next_file.processing_errors
+        assert next_file.cycle.status == "FAILED"
+        assert next_file.cycle.validation_report["readiness"]["errors"] == ["Airport: 2 records, down from 10 in 2501."]
+        assert not Airport.objects.filter(cycle=next_file.cycle).exists()
+        assert StagedChunk.objects.filter(arinc_file=next_file).exists()
+        retry.assert_not_called()
+        invalidate_active_cycle()
+        assert resolve_active_cycle(date(2025, 3, 1))[0] == arinc_file.cycle
+
+    def test_promote_resolves_references_of_copied_records(self, arinc_file, eager_celery):
+        process_arinc_file(arinc_file.id)
+        next_xml = cycle_xml.replace(
+            'cycle="2501" effective_date="2025-01-23"', 'cycle="2502" effective_date="2025-02-20"'
+        )
+        next_file = ArincFile.objects.create(file=SimpleUploadedFile("next.xml", next_xml.encode()))
+
+        process_arinc_file(next_file.id)
+
+        next_file.refresh_from_db()
+        assert next_file.cycle.change_summary["Airway"]["unchanged"] == 1
+        segment = AirwaySegment.objects.get(airway__cycle=next_file.cycle, sequence_number=10)
+        assert segment.fix_navaid == Navaid.objects.get(cycle=next_file.cycle, navaid_id="JFK")
+        assert next_file.cycle.validation_report["references"]["segments"]["unresolved"] == 0
+
+    def test_promote_invalidates_active_cycle(self, staged_file, eager_celery, mocker):
+        invalidate = mocker.patch("data_processor.tasks.invalidate_active_cycle")
+
+        promote_arinc_file(staged_file.id)
+
+        invalidate.assert_called_once_with()
+
+    def test_promote_invalidates_cached_responses(self, staged_file, eager_celery, mocker, settings, tmp_path):
+        settings.NAVIGATION_SNAPSHOT_DIR = str(tmp_path / "snapshots")
+        # A cycle being served is reloaded.
+        staged_file.cycle.status = "READY"
+        staged_file.cycle.save()
+        manifest = tmp_path / "snapshots" / "2501" / "manifest.json"
+        graph_key = GRAPH_CACHE_KEY.format(cycle_id="2501")
+        warmed = []
+        invalidate = mocker.patch(
+            "data_processor.tasks.invalidate_cached_responses",
+            side_effect=lambda: warmed.append((manifest.exists(), cache.get(graph_key) is not None)),
+        )
+
+        promote_arinc_file(staged_file.id)
+
+        invalidate.assert_called_once_with()
+        assert warmed == [(True, True)]
+
+    def test_promote_writes_snapshot(self, staged_file, eager_celery, settings, tmp_path):
+        settings.NAVIGATION_SNAPSHOT_DIR = str(tmp_path / "snapshots")
+
+        promote_arinc_file(staged_file.id)
+
+        assert (tmp_path / "snapshots" / "2501" / "manifest.json").exists()
@@ -157,5 +157,41 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache config
+# Shared between processes when pointed at Redis, e.g. CACHE_URL=redis://localhost:6379/1
+CACHES = {"default": env.cache_url("CACHE_URL", default="locmemcache://")}
+
 # Celery config
 CELERY_BROKER_URL = env("CELERY_BROKER_URL")
+
+# ARINC ingestion config
+ARINC_BULK_BATCH_SIZE = env.int("ARINC_BULK_BATCH_SIZE", default=1000)
+# Records per staged chunk; every chunk is staged by its own task, and a retried load skips staged chunks.
+ARINC_STAGING_CHUNK_SIZE = env.int("ARINC_STAGING_CHUNK_SIZE", default=5000)
+# Directory a cProfile dump of every ingestion stage is written to, per file; empty disables profiling.
+ARINC_PROFILE_DIR = env("ARINC_PROFILE_DIR", default="")
+# Largest share of a record type a new cycle may lose compared with the previous one before it is rejected.
+ARINC_MAX_RECORD_DROP = env.float("ARINC_MAX_RECORD_DROP", default=0.2)
+
+# Navigation API config
+# Seconds a process reuses its own copy of the active cycle before checking the shared cache again.
+ACTIVE_CYCLE_LOCAL_TTL = env.int("ACTIVE_CYCLE_LOCAL_TTL", default=30)
+# Default and maximum ``page_size`` of the navigation list endpoints.
+NAVIGATION_PAGE_SIZE = env.int("NAVIGATION_PAGE_SIZE", default=100)
+NAVIGATION_MAX_PAGE_SIZE = env.int("NAVIGATION_MAX_PAGE_SIZE", default=1000)
+# Seconds a rendered navigation response stays in the cache; 0 disables response caching.
+NAVIGATION_RESPONSE_CACHE_TIMEOUT = env.int("NAVIGATION_RESPONSE_CACHE_TIMEOUT", default=86400)
+# ``max-age`` of the ``Cache-Control`` header of navigation responses.
+NAVIGATION_RESPONSE_MAX_AGE = env.int("NAVIGATION_RESPONSE_MAX_AGE", default=300)
+# Directory of the memory-mapped cycle snapshots (see navigation.snapshots); empty disables them.
+NAVIGATION_SNAPSHOT_DIR = env("NAVIGATION_SNAPSHOT_DIR", default="")
+# Most fixes one batch resolve request may look up.
+NAVIGATION_RESOLVE_MAX_FIXES = env.int("NAVIGATION_RESOLVE_MAX_FIXES", default=1000)
+# Rows fetched per database round trip, and written per chunk, by the streaming exports.
+NAVIGATION_EXPORT_CHUNK_SIZE = env.int("NAVIGATION_EXPORT_CHUNK_SIZE", default=2000)
+# READY cycles before the active one kept in the database; older cycles are pruned (see navigation.retention).
+NAVIGATION_RETAINED_PREVIOUS_CYCLES = env.int("NAVIGATION_RETAINED_PREVIOUS_CYCLES", default=1)
+# Directory pruned cycles are archived to as gzipped NDJSON; empty deletes them without an archive.
+NAVIGATION_ARCHIVE_DIR = env("NAVIGATION_ARCHIVE_DIR", default="")
+# Rows deleted per statement, and per transaction, when a cycle is pruned.
+NAVIGATION_PRUNE_CHUNK_SIZE = env.int("NAVIGATION_PRUNE_CHUNK_SIZE", default=5000)
@@ -0,0 +1,132 @@
+"""
+Async read views of the navigation API, for serving under ASGI (see ``navdb_manager.asgi``).
+
+The list, detail and nearest endpoints of the airport, navaid and waypoint viewsets are also served here as native
+coroutines, querying with the async ORM (``aget``, ``async for``) so a request waiting on the database doesn't hold
+a worker thread. Each view drives an instance of the viewset it mirrors, so the records, the cursor pagination
+pinned to a data cycle, the response cache and the snapshot lookups are those of the viewset: responses are
+byte-for-byte identical. The few synchronous steps (the cache, the snapshot files, the page read by DRF's cursor
+pagination) are run with ``sync_to_async``.
+
+Only JSON is rendered; the viewsets remain the full-featured API.
+"""
+
+import json
+from operator import itemgetter
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from .caching import cache_response, conditional_response
+from .encoders import JSON_MEDIA_TYPE, escape_line_separators
+from .serializers import NearestQuerySerializer
+from .spatial import closest, radius_q
+
+
+class AsyncRecordView(View):
+    """
+    Base view running an action of a viewset as a coroutine.
+
+    Attributes:
+        viewset_class: Viewset of the records, e.g. ``AirportViewSet``.
+        action (str): Action of the viewset the view serves, which decides e.g. whether a cursor is read.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    viewset_class = None
+    action = None
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        drf_request = Request(request)
+        drf_request.accepted_media_type = JSON_MEDIA_TYPE
+        self.viewset = self.viewset_class(
+            request=drf_request, action=self.action, args=args, kwargs=kwargs, format_kwarg=None
+        )
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            await self.viewset.aget_latest_cycle()
+            key, entry = await sync_to_async(self.get_cached_entry)()
+            if entry is not None:
+                return conditional_response(request, entry)
+            response = await self.get_response(*args, **kwargs)
+        except APIException as e:
+            # As DRF's exception handler renders them.
+            data = e.detail if isinstance(e.detail, list | dict) else {"detail": e.detail}
+            return HttpResponse(JSONRenderer().render(data), status=e.status_code, content_type=JSON_MEDIA_TYPE)
+        if key is None or response.status_code != 200:
+            return response
+        entry = await sync_to_async(cache_response)(key, response.content, response["Content-Type"])
+        return conditional_response(request, entry, response)
+
+    def get_cached_entry(self) -> tuple[str | None, dict | None]:
+        """Return the response cache key of the request and its cache entry, see ``CachedResponseMixin``."""
+        key = self.viewset.get_response_cache_key(self.viewset.request)
+        return key, cache.get(key) if key is not None else None
+
+    async def get_response(self, *args, **kwargs) -> HttpResponse:
+        raise NotImplementedError
+
+    def get_rows(self, named: bool = False):
+        """Return the viewset's records as ``values_list`` rows of its row encoder's columns."""
+        return self.viewset.get_queryset().values_list(*self.viewset.get_row_encoder().columns, named=named)
+
+    @staticmethod
+    def json_response(content: str) -> HttpResponse:
+        return HttpResponse(escape_line_separators(content).encode(), content_type=JSON_MEDIA_TYPE)
+
+
+class AsyncRecordListView(AsyncRecordView):
+    """A page of records, as the viewset's ``list``: ``{"next": ..., "previous": ..., "results": [...]}``."""
+
+    action = "list"
+
+    async def get_response(self):
+        # DRF's cursor pagination reads the page itself; the async ORM would hop to a thread for it all the same.
+        page = await sync_to_async(self.viewset.paginate_queryset)(self.get_rows(named=True))
+        return self.viewset.paginator.get_encoded_paginated_response(self.viewset.get_row_encoder().encode(page))
+
+
+class AsyncRecordDetailView(AsyncRecordView):
+    """A record of the cycle being served by id, from its snapshot when there is one."""
+
+    action = "retrieve"
+
+    async def get_response(self, pk):
+        row = await sync_to_async(self.viewset.get_snapshot_row)(pk)
+        if row is not None:
+            return HttpResponse(JSONRenderer().render(row), content_type=JSON_MEDIA_TYPE)
+        rows = self.get_rows()
+        try:
+            row = await rows.aget(pk=pk)
+        except rows.model.DoesNotExist as e:
+            raise NotFound(f"No {rows.model._meta.object_name} matches the given query.") from e
+        return self.json_response(self.viewset.get_row_encoder().encode_objects([row])[0])
+
+
+class AsyncNearestView(AsyncRecordView):
+    """The records within a radius of a point, closest first, each with its ``distance_nm``."""
+
+    action = "nearest"
+
+    async def get_response(self):
+        params = NearestQuerySerializer(data=self.viewset.request.query_params)
+        params.is_valid(raise_exception=True)
+        latitude, longitude, radius, limit = (params.validated_data[name] for name in ("lat", "lon", "radius", "limit"))
+
+        encoder = self.viewset.get_row_encoder()
+        coordinates = itemgetter(encoder.columns.index("latitude"), encoder.columns.index("longitude"))
+        rows = self.get_rows().filter(radius_q(latitude, longitude, radius))
+        found = closest([row async for row in rows], latitude, longitude, radius, limit, coordinates)
+        # Appended after the record's fields, as the viewset's ``nearest`` action does.
+        results = [
+            result[:-1] + ',"distance_nm":' + json.dumps(round(distance, 3)) + "}"
+            for result, (_, distance) in zip(encoder.encode_objects([row for row, _ in found]), found, strict=True)
+        ]
+        return self.json_response("[" + ",".join(results) + "]")
@@ -0,0 +1,64 @@
+import hashlib
+import uuid
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+
+RESPONSE_GENERATION_CACHE_KEY = "navigation:response-generation"
+
+
+def response_cache_key(cycle_id: str, media_type: str, path: str, query_params) -> str:
+    """
+    Build the cache key of a rendered navigation response.
+
+    The key covers the data cycle the response was read from, the negotiated media type, the path and the query
+    parameters in a canonical order, and the current response generation (see ``invalidate_cached_responses``).
+    """
+    query = urlencode(sorted((name, value) for name in query_params for value in query_params.getlist(name)))
+    digest = hashlib.blake2b(f"{media_type}\x1f{path}\x1f{query}".encode(), digest_size=16).hexdigest()
+    return f"navigation:response:{_generation()}:{cycle_id}:{digest}"
+
+
+def _generation() -> str:
+    # A random token rather than a counter: if the cache evicts it, entries written under the old one are orphaned
+    # instead of being served again.
+    return cache.get_or_set(RESPONSE_GENERATION_CACHE_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def invalidate_cached_responses() -> None:
+    """Orphan every cached navigation response, e.g. after a cycle is loaded or removed."""
+    cache.set(RESPONSE_GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def cache_response(key: str, content: bytes, content_type: str) -> dict:
+    """Store a rendered response and return its cache entry."""
+    entry = {
+        "content": content,
+        "content_type": content_type,
+        "etag": f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"',
+    }
+    cache.set(key, entry, settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT)
+    return entry
+
+
+def conditional_response(request, entry: dict, response=None):
+    """
+    Add the validators of a cache entry to a response, or answer 304 when the client already has it.
+
+    Args:
+        request: Request being answered.
+        entry (dict): Cache entry, see ``cache_response``.
+        response: Response to send; built from the cached content when not given.
+
+    Returns:
+        The response, or a 304 response when ``If-None-Match`` matches the entry's ETag.
+    """
+    if response is None:
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    response["ETag"] = entry["etag"]
+    patch_cache_control(response, public=True, max_age=settings.NAVIGATION_RESPONSE_MAX_AGE)
+    patch_vary_headers(response, ["Accept"])
+    return get_conditional_response(request, etag=entry["etag"], response=response)
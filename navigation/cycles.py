@@ -0,0 +1,84 @@
+from datetime import date, datetime, time, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import DataCycle
+
+ACTIVE_CYCLE_CACHE_KEY = "navigation:active-cycle"
+
+# Process-local copy of the shared cache entry: {"cycle": ..., "local_expires_at": ...}
+_local = {}
+
+
+def get_active_cycle() -> DataCycle | None:
+    """
+    Return the data cycle currently in effect, served from cache.
+
+    The cycle is cached per process for ``ACTIVE_CYCLE_LOCAL_TTL`` seconds and in the shared Django cache
+    until the next cycle becomes effective, so a cycle uploaded ahead of time takes over on its
+    ``effective_date`` without a deploy or a manual flush. Neither copy outlives that instant, so every
+    process switches at the same time. ``invalidate_active_cycle`` drops both copies.
+
+    Returns:
+        DataCycle | None: See ``resolve_active_cycle``.
+    """
+    now = timezone.now()
+    entry = _local.get("entry")
+    if entry is not None and entry["local_expires_at"] > now:
+        return entry["cycle"]
+
+    shared = cache.get(ACTIVE_CYCLE_CACHE_KEY)
+    if shared is None or (shared["expires_at"] is not None and shared["expires_at"] <= now):
+        cycle, expires_at = resolve_active_cycle(timezone.localdate(now))
+        shared = {"cycle": cycle, "expires_at": expires_at}
+        timeout = None if expires_at is None else max(int((expires_at - now).total_seconds()), 1)
+        cache.set(ACTIVE_CYCLE_CACHE_KEY, shared, timeout)
+
+    local_expires_at = now + timedelta(seconds=settings.ACTIVE_CYCLE_LOCAL_TTL)
+    if shared["expires_at"] is not None:
+        local_expires_at = min(local_expires_at, shared["expires_at"])
+    _local["entry"] = {"cycle": shared["cycle"], "local_expires_at": local_expires_at}
+    return shared["cycle"]
+
+
+async def aget_active_cycle() -> DataCycle | None:
+    """Async version of ``get_active_cycle``; the process-local copy is read without leaving the event loop."""
+    entry = _local.get("entry")
+    if entry is not None and entry["local_expires_at"] > timezone.now():
+        return entry["cycle"]
+    return await sync_to_async(get_active_cycle)()
+
+
+def resolve_active_cycle(on: date) -> tuple[DataCycle | None, datetime | None]:
+    """
+    Look up the data cycle in effect on a date, bypassing the cache.
+
+    The active cycle is the READY cycle with the latest ``effective_date`` not after ``on``, regardless of the
+    order the cycles were uploaded in. When no cycle is effective yet, the first upcoming one is served. Cycles
+    still loading, or rejected, are ignored: a cycle pre-staged ahead of its ``effective_date`` takes over at
+    that instant only if it is READY by then, and the current cycle is served until it is.
+
+    Args:
+        on (date): Date to resolve the cycle for.
+
+    Returns:
+        tuple[DataCycle | None, datetime | None]: The cycle (``None`` when there are no READY cycles) and the
+            instant the next READY cycle becomes effective (``None`` when no later cycle is ready).
+    """
+    ready = DataCycle.objects.filter(status="READY")
+    cycle = ready.filter(effective_date__lte=on).order_by("-effective_date").first()
+    upcoming = ready.filter(effective_date__gt=on).order_by("effective_date").first()
+    if cycle is None:
+        cycle = upcoming
+    if upcoming is None:
+        return cycle, None
+    return cycle, datetime.combine(upcoming.effective_date, time.min, tzinfo=timezone.get_default_timezone())
+
+
+def invalidate_active_cycle() -> None:
+    """Drop the cached active cycle of this process and of the shared cache, e.g. after a cycle is loaded."""
+    _local.pop("entry", None)
+    cache.delete(ACTIVE_CYCLE_CACHE_KEY)
@@ -0,0 +1,160 @@
+"""
+Fast JSON encoding of ``values_list`` rows for the bulk read endpoints.
+
+A ``RowEncoder`` is compiled once from a ``ModelSerializer`` and renders rows without field instances,
+``OrderedDict`` or intermediate ``Decimal`` objects. The bytes match what DRF's ``JSONRenderer`` produces for the
+serializer's data in its default, compact configuration.
+"""
+
+import decimal
+import json
+from collections import defaultdict
+from json.encoder import encode_basestring
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from .models import ProcedureLeg, ProcedureTransition
+from .serializers import ProcedureLegSerializer, ProcedureTransitionSerializer
+
+# The media type the encoders render; anything else (an ``indent``, the browsable API) goes through DRF.
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _encode_value(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return encode_basestring(value)
+    return json.dumps(value)
+
+
+def escape_line_separators(text: str) -> str:
+    """Escape U+2028 and U+2029 like ``JSONRenderer``, so the JSON is also valid JavaScript."""
+    if "\u2028" in text or "\u2029" in text:
+        text = text.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return text
+
+
+def _quantized(field: serializers.DecimalField):
+    """Mirror ``DecimalField.to_representation`` for a field with a custom rounding mode."""
+    exponent = decimal.Decimal(".1") ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+
+    def encode(value) -> str:
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return f'"{value.quantize(exponent, rounding=field.rounding, context=context):f}"'
+
+    return encode
+
+
+class RowEncoder:
+    """
+    Encodes rows of a model's values into the JSON a serializer renders for the same records.
+
+    The encoder is compiled to a single list comprehension: each field becomes an inline expression (a null check
+    and a ``str``, ``encode_basestring`` or ``format`` call), and the constant ``"name":`` prefixes are laid out in
+    a ``%`` template, so a row costs one format operation.
+
+    Attributes:
+        fields (tuple[str, ...]): Names of the serializer's fields.
+        columns (tuple[str, ...]): Sources to pass to ``values_list``, in the order of the serializer's fields.
+            Nested list fields are not queried: the row holds their already encoded JSON.
+    """
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer]):
+        fields, columns, prefixes, expressions = [], [], [], []
+        namespace = {"encode_basestring": encode_basestring, "encode_value": _encode_value}
+        for index, (name, field) in enumerate(serializer_class().fields.items()):
+            fields.append(name)
+            columns.append(field.source)
+            prefixes.append(encode_basestring(name).replace("%", "%%") + ":%s")
+            expressions.append(self._expression(field, f"v{index}", namespace))
+        self.fields = tuple(fields)
+        self.columns = tuple(columns)
+        namespace["template"] = "{" + ",".join(prefixes) + "}"
+        variables = "".join(f"v{index}, " for index in range(len(columns)))
+        source = f"def encode_rows(rows):\n    return [template % ({', '.join(expressions)},) for {variables}in rows]\n"
+        exec(compile(source, f"<RowEncoder {serializer_class.__name__}>", "exec"), namespace)
+        self._encode_rows = namespace["encode_rows"]
+
+    @staticmethod
+    def _expression(field: serializers.Field, variable: str, namespace: dict) -> str:
+        """Return the Python expression rendering the field's value held in ``variable`` as JSON."""
+        if isinstance(field, serializers.ListSerializer):
+            return variable
+        if isinstance(field, serializers.DecimalField):
+            coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+            if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+                raise ValueError(f"Unsupported decimal rendering of field {field.field_name!r}")
+            if field.rounding is not None:
+                namespace[f"quantized_{variable}"] = _quantized(field)
+                rendered = f"quantized_{variable}({variable})"
+            else:
+                # Same digits as quantizing with the default context, for values that fit the field.
+                rendered = f"f'\"{{{variable}:.{field.decimal_places}f}}\"'"
+        elif isinstance(field, serializers.IntegerField):
+            rendered = f"str(int({variable}))"
+        elif isinstance(field, serializers.ChoiceField | serializers.CharField):
+            # Choices render their stored value; model choices are strings here.
+            rendered = f"encode_basestring(str({variable}))"
+        elif isinstance(field, serializers.PrimaryKeyRelatedField | serializers.ReadOnlyField):
+            return f"encode_value({variable})"
+        else:
+            raise ValueError(f"No fast encoder for {type(field).__name__} field {field.field_name!r}")
+        return f'("null" if {variable} is None else {rendered})'
+
+    def encode_objects(self, rows) -> list[str]:
+        """
+        Encode rows of ``columns`` values as one JSON object each.
+
+        U+2028 and U+2029 are left as they are; pass the text being sent through ``escape_line_separators``.
+        """
+        return self._encode_rows(rows)
+
+    def encode_rows(self, rows) -> str:
+        """Encode rows of ``columns`` values as a JSON array."""
+        return escape_line_separators("[" + ",".join(self._encode_rows(rows)) + "]")
+
+    def encode(self, rows) -> bytes:
+        """Encode rows of ``columns`` values as the UTF-8 bytes of a JSON array."""
+        return self.encode_rows(rows).encode()
+
+
+LEG_ENCODER = RowEncoder(ProcedureLegSerializer)
+TRANSITION_ENCODER = RowEncoder(ProcedureTransitionSerializer)
+
+
+def encode_procedure_transitions(cycle, procedure_id) -> bytes | None:
+    """
+    Encode the transitions of a procedure with their legs, as ``ProcedureTransitionSerializer`` renders them.
+
+    Transitions are ordered by id and legs by sequence number, in two queries.
+
+    Args:
+        cycle (DataCycle | None): Cycle the procedure must belong to, e.g. the cycle being served.
+        procedure_id: Primary key of the procedure.
+
+    Returns:
+        bytes | None: The JSON array, ``None`` when the procedure has no transitions or is not in the cycle.
+    """
+    transitions = list(
+        ProcedureTransition.objects.filter(procedure__cycle=cycle, procedure__id=procedure_id)
+        .order_by("id")
+        .values_list("id", "transition_id")
+    )
+    if not transitions:
+        return None
+    legs = defaultdict(list)
+    for *row, transition in (
+        ProcedureLeg.objects.filter(transition__in=[pk for pk, _ in transitions])
+        .order_by("transition", "sequence_number")
+        .values_list(*LEG_ENCODER.columns, "transition")
+    ):
+        legs[transition].append(row)
+    return TRANSITION_ENCODER.encode(
+        [(transition_id, LEG_ENCODER.encode_rows(legs[pk])) for pk, transition_id in transitions]
+    )
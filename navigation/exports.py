@@ -0,0 +1,241 @@
+"""
+Streaming bulk exports of a data cycle as NDJSON or CSV.
+
+Every record type is read with ``values_list(...).iterator(chunk_size=...)`` (a server-side cursor where the
+database supports one) and written out chunk by chunk, so the memory used does not grow with the cycle. Nested
+records are read in the order of their parents, one query per level, and joined to them as the rows go by:
+airway segments by sequence number, procedure transitions by id and their legs by sequence number.
+
+NDJSON exports start with a ``{"record": "cycle", ...}`` line, followed by one line per record tagged with its
+``record`` type; airways embed their ``segments`` and procedures their ``transitions`` and ``legs``, as rendered
+by the API's serializers. CSV exports hold one record type, nested records flattened to one row per segment or
+leg with dotted column names (``segments.fix_identifier``).
+
+Under ASGI, Django would consume a synchronous stream whole before sending it; ``astream_export`` yields the same
+chunks asynchronously, each one produced in the request's sync thread, so the export is streamed on both servers.
+"""
+
+import csv
+import json
+import zlib
+from decimal import Decimal
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .encoders import LEG_ENCODER, TRANSITION_ENCODER, RowEncoder, escape_line_separators
+from .models import (
+    Airport,
+    Airway,
+    AirwaySegment,
+    DataCycle,
+    Navaid,
+    Procedure,
+    ProcedureLeg,
+    ProcedureTransition,
+    Waypoint,
+)
+from .serializers import (
+    AirportSerializer,
+    AirwayExportSerializer,
+    AirwaySegmentSerializer,
+    NavaidSerializer,
+    ProcedureExportSerializer,
+    WaypointSerializer,
+)
+
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+# Record types without nested records: (record tag, model, encoder).
+FLAT_RECORDS = {
+    "airports": ("airport", Airport, RowEncoder(AirportSerializer)),
+    "navaids": ("navaid", Navaid, RowEncoder(NavaidSerializer)),
+    "waypoints": ("waypoint", Waypoint, RowEncoder(WaypointSerializer)),
+}
+AIRWAY_ENCODER = RowEncoder(AirwayExportSerializer)
+SEGMENT_ENCODER = RowEncoder(AirwaySegmentSerializer)
+PROCEDURE_ENCODER = RowEncoder(ProcedureExportSerializer)
+# Parent columns, without the nested records; both start with the id the children are joined on.
+AIRWAY_COLUMNS = AIRWAY_ENCODER.columns[:-1]
+PROCEDURE_COLUMNS = PROCEDURE_ENCODER.columns[:-1]
+
+
+def stream_export(cycle: DataCycle, records: list[str], output: str = "ndjson", compress: bool = False):
+    """
+    Yield the export of a cycle as encoded chunks, for a ``StreamingHttpResponse``.
+
+    Args:
+        cycle (DataCycle): Cycle to export.
+        records (list[str]): Record types to export, in order: airports, navaids, waypoints, airways, procedures.
+        output (str): ``"ndjson"`` or ``"csv"``; CSV exports take a single record type.
+        compress (bool): Whether to gzip the stream.
+
+    Yields:
+        bytes: Consecutive pieces of the file.
+    """
+    chunks = _ndjson(cycle, records) if output == "ndjson" else _csv(cycle, records[0])
+    if not compress:
+        for chunk in chunks:
+            yield chunk.encode()
+        return
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def astream_export(cycle: DataCycle, records: list[str], output: str = "ndjson", compress: bool = False):
+    """
+    Asynchronously yield the export of a cycle, for a ``StreamingHttpResponse`` served under ASGI.
+
+    Takes the arguments of ``stream_export``. Chunks are produced by ``stream_export`` in the thread the request
+    runs its database code in, one chunk per hop, so its server-side cursors stay on their connection.
+    """
+    chunks = stream_export(cycle, records, output=output, compress=compress)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def _batches(rows, size: int | None = None):
+    rows = iter(rows)
+    size = size or settings.NAVIGATION_EXPORT_CHUNK_SIZE
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _rows(queryset, *columns):
+    return queryset.values_list(*columns).iterator(chunk_size=settings.NAVIGATION_EXPORT_CHUNK_SIZE)
+
+
+def _nest(parents, children):
+    """
+    Join child rows to their parents as both streams go by.
+
+    Args:
+        parents: ``(key, row)`` pairs.
+        children: ``(parent key, row)`` pairs, in the same order of parents as ``parents``.
+
+    Yields:
+        tuple: ``(key, row, [child rows])`` for every parent.
+    """
+    children = iter(children)
+    child = next(children, None)
+    for key, row in parents:
+        group = []
+        while child is not None and child[0] == key:
+            group.append(child[1])
+            child = next(children, None)
+        yield key, row, group
+
+
+def _airways(cycle: DataCycle):
+    """Yield ``(airway row, [segment rows])`` for the airways of a cycle."""
+    airways = _rows(Airway.objects.filter(cycle=cycle).order_by("id"), *AIRWAY_COLUMNS)
+    segments = _rows(
+        AirwaySegment.objects.filter(airway__cycle=cycle).order_by("airway", "sequence_number"),
+        "airway",
+        *SEGMENT_ENCODER.columns,
+    )
+    for _, row, group in _nest(((row[0], row) for row in airways), ((row[0], row[1:]) for row in segments)):
+        yield row, group
+
+
+def _procedures(cycle: DataCycle):
+    """Yield ``(procedure row, [(transition_id, [leg rows])])`` for the procedures of a cycle."""
+    procedures = _rows(Procedure.objects.filter(cycle=cycle).order_by("id"), *PROCEDURE_COLUMNS)
+    transitions = _rows(
+        ProcedureTransition.objects.filter(procedure__cycle=cycle).order_by("procedure", "id"),
+        "id",
+        "procedure",
+        "transition_id",
+    )
+    legs = _rows(
+        ProcedureLeg.objects.filter(transition__procedure__cycle=cycle).order_by(
+            "transition__procedure", "transition", "sequence_number"
+        ),
+        "transition",
+        *LEG_ENCODER.columns,
+    )
+    transitions = _nest(((row[0], row[1:]) for row in transitions), ((row[0], row[1:]) for row in legs))
+    grouped = _nest(
+        ((row[0], row) for row in procedures),
+        ((procedure, (transition_id, group)) for _, (procedure, transition_id), group in transitions),
+    )
+    for _, row, group in grouped:
+        yield row, group
+
+
+def _ndjson(cycle: DataCycle, records: list[str]):
+    header = {
+        "record": "cycle",
+        "cycle_id": cycle.cycle_id,
+        "effective_date": cycle.effective_date.isoformat(),
+        "expiry_date": cycle.expiry_date.isoformat(),
+        "source": cycle.source,
+    }
+    yield escape_line_separators(json.dumps(header, ensure_ascii=False, separators=(",", ":"))) + "\n"
+    for name in records:
+        if name in FLAT_RECORDS:
+            record, model, encoder = FLAT_RECORDS[name]
+            rows = _rows(model.objects.filter(cycle=cycle).order_by("id"), *encoder.columns)
+        elif name == "airways":
+            record, encoder = "airway", AIRWAY_ENCODER
+            rows = ((*row, SEGMENT_ENCODER.encode_rows(segments)) for row, segments in _airways(cycle))
+        else:
+            record, encoder = "procedure", PROCEDURE_ENCODER
+            rows = (
+                (*row, TRANSITION_ENCODER.encode_rows([(id_, LEG_ENCODER.encode_rows(legs)) for id_, legs in group]))
+                for row, group in _procedures(cycle)
+            )
+        prefix = '{"record":' + json.dumps(record) + ","
+        for batch in _batches(rows):
+            lines = encoder.encode_objects(batch)
+            yield escape_line_separators("".join([prefix + line[1:] + "\n" for line in lines]))
+
+
+class _Echo:
+    """A file-like object handing back what ``csv.writer`` writes to it."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, Decimal):
+        # As the API renders decimals: fixed point, never an exponent.
+        return f"{value:f}"
+    return value
+
+
+def _csv(cycle: DataCycle, name: str):
+    writer = csv.writer(_Echo())
+    if name in FLAT_RECORDS:
+        _, model, encoder = FLAT_RECORDS[name]
+        header = encoder.fields
+        rows = _rows(model.objects.filter(cycle=cycle).order_by("id"), *encoder.columns)
+    elif name == "airways":
+        header = AIRWAY_ENCODER.fields[:-1] + tuple(f"segments.{field}" for field in SEGMENT_ENCODER.fields)
+        blank = (None,) * len(SEGMENT_ENCODER.fields)
+        rows = (row + segment for row, segments in _airways(cycle) for segment in segments or [blank])
+    else:
+        header = PROCEDURE_ENCODER.fields[:-1] + ("transitions.transition_id",)
+        header += tuple(f"transitions.legs.{field}" for field in LEG_ENCODER.fields)
+        no_legs = [(None,) * len(LEG_ENCODER.fields)]
+        rows = (
+            (*row, transition_id, *leg)
+            for row, transitions in _procedures(cycle)
+            for transition_id, legs in transitions or [(None, [])]
+            for leg in legs or no_legs
+        )
+    yield writer.writerow(header)
+    for batch in _batches(rows):
+        yield "".join([writer.writerow([_csv_value(value) for value in row]) for row in batch])
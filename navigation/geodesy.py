@@ -0,0 +1,114 @@
+"""
+Vectorized great-circle computations over a cycle's coordinates.
+
+Coordinates are held in contiguous float64 arrays so distances, bearings and cross-track distances are computed
+for whole columns at once. All angles are in degrees and all distances in nautical miles on a spherical earth,
+matching ``navigation.spatial``.
+"""
+
+import numpy as np
+
+from .models import Airport, Navaid, Waypoint
+from .spatial import EARTH_RADIUS_NM
+
+
+def haversine(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Return the great-circle distances between two sets of points."""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    half_d_phi = (phi2 - phi1) / 2
+    half_d_lambda = np.radians(np.subtract(lon2, lon1)) / 2
+    a = np.sin(half_d_phi) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(half_d_lambda) ** 2
+    return 2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def initial_bearing(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Return the true initial course from the first to the second set of points, in [0, 360)."""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    d_lambda = np.radians(np.subtract(lon2, lon1))
+    y = np.sin(d_lambda) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(d_lambda)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+
+def cross_track(lat1, lon1, lat2, lon2, lat3, lon3) -> np.ndarray:
+    """
+    Return the signed distance of the third set of points from the great circles through the first two.
+
+    Positive distances are right of the course from point 1 to point 2.
+    """
+    angular_13 = haversine(lat1, lon1, lat3, lon3) / EARTH_RADIUS_NM
+    theta_13 = np.radians(initial_bearing(lat1, lon1, lat3, lon3))
+    theta_12 = np.radians(initial_bearing(lat1, lon1, lat2, lon2))
+    return EARTH_RADIUS_NM * np.arcsin(np.sin(angular_13) * np.sin(theta_13 - theta_12))
+
+
+def parse_variation(value) -> float:
+    """Convert a magnetic variation such as ``13W``, ``E002`` or ``-13`` to degrees east, NaN when unknown."""
+    if not value:
+        return np.nan
+    value = value.strip().upper()
+    sign = 1.0
+    if value[-1:] in ("E", "W"):
+        sign, value = (-1.0 if value[-1] == "W" else 1.0), value[:-1]
+    elif value[:1] in ("E", "W"):
+        sign, value = (-1.0 if value[0] == "W" else 1.0), value[1:]
+    try:
+        return sign * float(value)
+    except ValueError:
+        return np.nan
+
+
+def true_to_magnetic(course, variation) -> np.ndarray:
+    """Convert true courses to magnetic ones given the variation in degrees east."""
+    return np.subtract(course, variation) % 360
+
+
+class CoordinateTable:
+    """
+    Positions of a set of fixes in contiguous float64 arrays, keyed by ``(fix type, identifier)``.
+
+    Attributes:
+        keys (list[tuple[str, str]]): Fix type and identifier of each row.
+        latitudes (np.ndarray): Latitude of each row.
+        longitudes (np.ndarray): Longitude of each row.
+        variations (np.ndarray): Magnetic variation in degrees east of each row, NaN when unknown.
+    """
+
+    # Fix type each model is referenced by from airway segments, with its identifier and variation fields.
+    SOURCES = (
+        ("AIRPORT", Airport, "airport_id", "magnetic_variation"),
+        ("NAVAID", Navaid, "navaid_id", "magnetic_variation"),
+        ("WAYPOINT", Waypoint, "waypoint_id", None),
+    )
+
+    def __init__(self, keys, latitudes, longitudes, variations=None):
+        self.keys = list(keys)
+        self.latitudes = np.ascontiguousarray(latitudes, dtype=np.float64)
+        self.longitudes = np.ascontiguousarray(longitudes, dtype=np.float64)
+        self.variations = (
+            np.full(len(self.keys), np.nan)
+            if variations is None
+            else np.ascontiguousarray(variations, dtype=np.float64)
+        )
+        self._index = {key: row for row, key in enumerate(self.keys)}
+
+    @classmethod
+    def for_cycle(cls, cycle) -> "CoordinateTable":
+        """Load the airports, navaids and waypoints of a cycle."""
+        keys, latitudes, longitudes, variations = [], [], [], []
+        for fix_type, model, identifier_field, variation_field in cls.SOURCES:
+            fields = [identifier_field, "latitude", "longitude"] + ([variation_field] if variation_field else [])
+            for row in model.objects.filter(cycle=cycle).values_list(*fields).iterator(chunk_size=10000):
+                keys.append((fix_type, row[0]))
+                latitudes.append(row[1])
+                longitudes.append(row[2])
+                variations.append(parse_variation(row[3]) if variation_field else np.nan)
+        return cls(keys, latitudes, longitudes, variations)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def locate(self, keys) -> np.ndarray:
+        """Return the row of each ``(fix type, identifier)`` key, -1 for unknown fixes."""
+        index = self._index
+        return np.fromiter((index.get(key, -1) for key in keys), dtype=np.int64)
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from navigation.retention import cycles_to_prune, prune_cycle
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the data cycles the retention policy no longer keeps: every cycle before the active one but the "
+        "most recent NAVIGATION_RETAINED_PREVIOUS_CYCLES READY ones. Run it daily, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-previous",
+            type=int,
+            help="Cycles before the active one to keep; NAVIGATION_RETAINED_PREVIOUS_CYCLES by default.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            help="Directory pruned cycles are archived to; NAVIGATION_ARCHIVE_DIR by default, empty to disable.",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, help="Rows deleted per statement; NAVIGATION_PRUNE_CHUNK_SIZE by default."
+        )
+        parser.add_argument("--dry-run", action="store_true", help="List the cycles to prune without deleting them.")
+
+    def handle(self, *args, keep_previous, archive_dir, chunk_size, dry_run, **options):
+        cycles = cycles_to_prune(keep_previous=keep_previous)
+        if not cycles:
+            self.stdout.write("No cycle to prune.")
+        for cycle in cycles:
+            # Deleting the cycle clears its primary key.
+            name = str(cycle)
+            if dry_run:
+                self.stdout.write(f"Would prune cycle {name}")
+                continue
+            result = prune_cycle(cycle, archive_dir=archive_dir, chunk_size=chunk_size)
+            archive = result.pop("archive", None)
+            counts = ", ".join(f"{count} {model}" for model, count in result.items())
+            self.stdout.write(self.style.SUCCESS(f"Pruned cycle {name}: {counts}"))
+            if archive:
+                self.stdout.write(f"Archived to {archive}")
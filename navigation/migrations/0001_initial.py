@@ -0,0 +1,179 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataCycle',
+            fields=[
+                ('cycle_id', models.CharField(max_length=10, primary_key=True, serialize=False)),
+                ('effective_date', models.DateField()),
+                ('expiry_date', models.DateField()),
+                ('source', models.CharField(max_length=100)),
+                ('change_summary', models.JSONField(blank=True, default=dict, help_text='Records added, changed, unchanged and removed per model compared with the previous cycle.')),
+            ],
+            options={
+                'ordering': ['-effective_date'],
+                'indexes': [models.Index(fields=['-effective_date'], name='datacycle_effective_date_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Airway',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(blank=True, default='', help_text="Hash of the record's normalized fields, used to detect changes between cycles.", max_length=32)),
+                ('airway_id', models.CharField(max_length=10)),
+                ('route_type', models.CharField(choices=[('JETWAY', 'Jet Route'), ('VICTOR', 'Victor Airway'), ('RNAV', 'RNAV Route'), ('HELICOPTER', 'Helicopter Route')], max_length=10)),
+                ('cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='navigation.datacycle')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Airport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('longitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('fingerprint', models.CharField(blank=True, default='', help_text="Hash of the record's normalized fields, used to detect changes between cycles.", max_length=32)),
+                ('airport_id', models.CharField(max_length=10)),
+                ('icao_code', models.CharField(max_length=4)),
+                ('name', models.CharField(max_length=100)),
+                ('city', models.CharField(max_length=100)),
+                ('state', models.CharField(blank=True, max_length=2, null=True)),
+                ('country', models.CharField(max_length=2)),
+                ('elevation', models.IntegerField(help_text='Elevation in feet')),
+                ('magnetic_variation', models.CharField(max_length=5)),
+                ('transition_altitude', models.IntegerField(blank=True, null=True)),
+                ('transition_level', models.IntegerField(blank=True, null=True)),
+                ('longest_runway', models.IntegerField(blank=True, null=True)),
+                ('cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='navigation.datacycle')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Navaid',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('longitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('fingerprint', models.CharField(blank=True, default='', help_text="Hash of the record's normalized fields, used to detect changes between cycles.", max_length=32)),
+                ('navaid_id', models.CharField(max_length=10)),
+                ('name', models.CharField(max_length=100)),
+                ('navaid_type', models.CharField(choices=[('VOR', 'VOR'), ('DME', 'DME'), ('VOR/DME', 'VOR/DME'), ('VORTAC', 'VORTAC'), ('TACAN', 'TACAN'), ('NDB', 'NDB'), ('NDB/DME', 'NDB/DME'), ('LOC', 'Localizer'), ('GP', 'Glide Path'), ('TCN', 'TACAN')], max_length=10)),
+                ('frequency', models.DecimalField(blank=True, decimal_places=2, max_digits=7, null=True)),
+                ('elevation', models.IntegerField(blank=True, help_text='Elevation in feet', null=True)),
+                ('magnetic_variation', models.CharField(blank=True, max_length=5, null=True)),
+                ('dme_latitude', models.DecimalField(blank=True, decimal_places=8, max_digits=11, null=True)),
+                ('dme_longitude', models.DecimalField(blank=True, decimal_places=8, max_digits=11, null=True)),
+                ('dme_elevation', models.IntegerField(blank=True, help_text='Elevation in feet', null=True)),
+                ('service_volume', models.CharField(blank=True, max_length=10, null=True)),
+                ('cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='navigation.datacycle')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Procedure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(blank=True, default='', help_text="Hash of the record's normalized fields, used to detect changes between cycles.", max_length=32)),
+                ('procedure_id', models.CharField(max_length=10)),
+                ('procedure_type', models.CharField(choices=[('SID', 'Standard Instrument Departure'), ('STAR', 'Standard Terminal Arrival Route'), ('APPROACH', 'Instrument Approach')], max_length=10)),
+                ('airport', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='procedures', to='navigation.airport')),
+                ('cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='navigation.datacycle')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProcedureTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('transition_id', models.CharField(max_length=10)),
+                ('procedure', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='navigation.procedure')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProcedureLeg',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('longitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('sequence_number', models.IntegerField()),
+                ('waypoint_identifier', models.CharField(max_length=10)),
+                ('waypoint_type', models.CharField(choices=[('WAYPOINT', 'Waypoint'), ('NAVAID', 'Navaid'), ('IAF', 'Initial Approach Fix'), ('IF', 'Intermediate Fix'), ('FAF', 'Final Approach Fix'), ('MAP', 'Missed Approach Point')], max_length=10)),
+                ('altitude_constraint', models.CharField(blank=True, max_length=50, null=True)),
+                ('speed_constraint', models.CharField(blank=True, max_length=50, null=True)),
+                ('course', models.IntegerField(blank=True, null=True)),
+                ('distance', models.DecimalField(blank=True, decimal_places=2, max_digits=7, null=True)),
+                ('leg_type', models.CharField(blank=True, max_length=10, null=True)),
+                ('transition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='legs', to='navigation.proceduretransition')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Waypoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('longitude', models.DecimalField(decimal_places=8, max_digits=11)),
+                ('fingerprint', models.CharField(blank=True, default='', help_text="Hash of the record's normalized fields, used to detect changes between cycles.", max_length=32)),
+                ('waypoint_id', models.CharField(max_length=10)),
+                ('name', models.CharField(max_length=100)),
+                ('waypoint_type', models.CharField(choices=[('ENROUTE', 'Enroute'), ('TERMINAL', 'Terminal'), ('IAF', 'Initial Approach Fix'), ('IF', 'Intermediate Fix'), ('FAF', 'Final Approach Fix'), ('MAP', 'Missed Approach Point')], max_length=10)),
+                ('airspace_classification', models.CharField(blank=True, max_length=1, null=True)),
+                ('cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='navigation.datacycle')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AirwaySegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence_number', models.IntegerField()),
+                ('fix_identifier', models.CharField(max_length=10)),
+                ('fix_type', models.CharField(choices=[('WAYPOINT', 'Waypoint'), ('NAVAID', 'Navaid'), ('AIRPORT', 'Airport')], max_length=10)),
+                ('next_fix_identifier', models.CharField(blank=True, max_length=10, null=True)),
+                ('next_fix_type', models.CharField(blank=True, choices=[('WAYPOINT', 'Waypoint'), ('NAVAID', 'Navaid'), ('AIRPORT', 'Airport')], max_length=10, null=True)),
+                ('route_distance', models.IntegerField(blank=True, help_text='Distance in nautical miles', null=True)),
+                ('minimum_altitude', models.IntegerField(blank=True, help_text='Altitude in feet', null=True)),
+                ('maximum_altitude', models.IntegerField(blank=True, help_text='Altitude in feet', null=True)),
+                ('magnetic_course', models.IntegerField(blank=True, null=True)),
+                ('reverse_magnetic_course', models.IntegerField(blank=True, null=True)),
+                ('airway', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='segments', to='navigation.airway')),
+            ],
+            options={
+                'ordering': ['sequence_number'],
+                'constraints': [models.UniqueConstraint(fields=('airway', 'sequence_number'), name='unique_airway_segment')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='airway',
+            constraint=models.UniqueConstraint(fields=('cycle', 'airway_id'), name='unique_airway_per_cycle'),
+        ),
+        migrations.AddConstraint(
+            model_name='airport',
+            constraint=models.UniqueConstraint(fields=('cycle', 'airport_id'), name='unique_airport_per_cycle'),
+        ),
+        migrations.AddConstraint(
+            model_name='navaid',
+            constraint=models.UniqueConstraint(fields=('cycle', 'navaid_id'), name='unique_navaid_per_cycle'),
+        ),
+        migrations.AddConstraint(
+            model_name='procedure',
+            constraint=models.UniqueConstraint(fields=('cycle', 'airport', 'procedure_id'), name='unique_procedure_per_cycle'),
+        ),
+        migrations.AddConstraint(
+            model_name='proceduretransition',
+            constraint=models.UniqueConstraint(fields=('procedure', 'transition_id'), name='unique_procedure_transition'),
+        ),
+        migrations.AddConstraint(
+            model_name='procedureleg',
+            constraint=models.UniqueConstraint(fields=('transition', 'sequence_number'), name='unique_procedure_leg'),
+        ),
+        migrations.AddConstraint(
+            model_name='waypoint',
+            constraint=models.UniqueConstraint(fields=('cycle', 'waypoint_id'), name='unique_waypoint_per_cycle'),
+        ),
+    ]
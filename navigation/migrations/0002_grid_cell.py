@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:32
+
+from django.db import migrations, models
+
+from navigation.spatial import grid_cell
+
+
+def backfill_grid_cells(apps, schema_editor):
+    for model_name in ("Airport", "Navaid", "Waypoint"):
+        model = apps.get_model("navigation", model_name)
+        batch = []
+        for obj in model.objects.only("latitude", "longitude").iterator(chunk_size=2000):
+            obj.grid_cell = grid_cell(obj.latitude, obj.longitude)
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ["grid_cell"])
+                batch = []
+        model.objects.bulk_update(batch, ["grid_cell"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('navigation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airport',
+            name='grid_cell',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='1 x 1 degree cell of the coordinates, see navigation.spatial.', null=True),
+        ),
+        migrations.AddField(
+            model_name='navaid',
+            name='grid_cell',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='1 x 1 degree cell of the coordinates, see navigation.spatial.', null=True),
+        ),
+        migrations.AddField(
+            model_name='waypoint',
+            name='grid_cell',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='1 x 1 degree cell of the coordinates, see navigation.spatial.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='airport',
+            index=models.Index(fields=['cycle', 'grid_cell'], name='airport_grid_cell_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='navaid',
+            index=models.Index(fields=['cycle', 'grid_cell'], name='navaid_grid_cell_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='waypoint',
+            index=models.Index(fields=['cycle', 'grid_cell'], name='waypoint_grid_cell_idx'),
+        ),
+        migrations.RunPython(backfill_grid_cells, migrations.RunPython.noop),
+    ]
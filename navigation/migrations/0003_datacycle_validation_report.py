@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 02:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('navigation', '0002_grid_cell'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datacycle',
+            name='validation_report',
+            field=models.JSONField(blank=True, default=dict, help_text="Results of the post-ingest checks of the cycle's data, per check."),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('navigation', '0003_datacycle_validation_report'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='fix_airport',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.airport'),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='fix_latitude',
+            field=models.DecimalField(blank=True, decimal_places=8, editable=False, max_digits=11, null=True),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='fix_longitude',
+            field=models.DecimalField(blank=True, decimal_places=8, editable=False, max_digits=11, null=True),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='fix_navaid',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.navaid'),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='fix_waypoint',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.waypoint'),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='next_fix_airport',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.airport'),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='next_fix_latitude',
+            field=models.DecimalField(blank=True, decimal_places=8, editable=False, max_digits=11, null=True),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='next_fix_longitude',
+            field=models.DecimalField(blank=True, decimal_places=8, editable=False, max_digits=11, null=True),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='next_fix_navaid',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.navaid'),
+        ),
+        migrations.AddField(
+            model_name='airwaysegment',
+            name='next_fix_waypoint',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.waypoint'),
+        ),
+        migrations.AddField(
+            model_name='procedureleg',
+            name='fix_airport',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.airport'),
+        ),
+        migrations.AddField(
+            model_name='procedureleg',
+            name='fix_navaid',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.navaid'),
+        ),
+        migrations.AddField(
+            model_name='procedureleg',
+            name='fix_waypoint',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='navigation.waypoint'),
+        ),
+    ]
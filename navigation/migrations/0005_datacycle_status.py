@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:39
+
+from django.db import migrations, models
+
+
+def mark_existing_cycles_ready(apps, schema_editor):
+    # Cycles loaded before the status existed were all being served.
+    apps.get_model("navigation", "DataCycle").objects.update(status="READY")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('navigation', '0004_resolved_fix_references'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datacycle',
+            name='status',
+            field=models.CharField(choices=[('LOADING', 'Loading'), ('READY', 'Ready'), ('FAILED', 'Failed')], default='LOADING', help_text='Only READY cycles are served. A cycle is LOADING until the ingestion pipeline has loaded, validated and warmed it, or until it is marked READY by hand.', max_length=20),
+        ),
+        migrations.RunPython(mark_existing_cycles_ready, migrations.RunPython.noop),
+    ]
@@ -1,14 +1,41 @@
 from django.db import models
 
+from .spatial import grid_cell
+
 
 class DataCycle(models.Model):
+    STATUS_CHOICES = [
+        ("LOADING", "Loading"),
+        ("READY", "Ready"),
+        ("FAILED", "Failed"),
+    ]
     cycle_id = models.CharField(max_length=10, primary_key=True)
     effective_date = models.DateField()
     expiry_date = models.DateField()
     source = models.CharField(max_length=100)
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="LOADING",
+        help_text="Only READY cycles are served. A cycle is LOADING until the ingestion pipeline has loaded, "
+        "validated and warmed it, or until it is marked READY by hand.",
+    )
+    change_summary = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Records added, changed, unchanged and removed per model compared with the previous cycle.",
+    )
+    validation_report = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Results of the post-ingest checks of the cycle's data, per check.",
+    )
 
     class Meta:
         ordering = ["-effective_date"]
+        indexes = [
+            models.Index(fields=["-effective_date"], name="datacycle_effective_date_idx"),
+        ]
 
     def __str__(self):
         return f"{self.cycle_id} ({self.effective_date} -> {self.expiry_date})"
@@ -22,7 +49,38 @@ class Coordinates(models.Model):
         abstract = True
 
 
-class Airport(Coordinates):
+class GridIndexed(Coordinates):
+    grid_cell = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="1 x 1 degree cell of the coordinates, see navigation.spatial.",
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.update_grid_cell()
+        super().save(*args, **kwargs)
+
+    def update_grid_cell(self):
+        self.grid_cell = grid_cell(self.latitude, self.longitude)
+
+
+class Fingerprinted(models.Model):
+    fingerprint = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        help_text="Hash of the record's normalized fields, used to detect changes between cycles.",
+    )
+
+    class Meta:
+        abstract = True
+
+
+class Airport(GridIndexed, Fingerprinted):
     cycle = models.ForeignKey(DataCycle, on_delete=models.CASCADE)
     airport_id = models.CharField(max_length=10)
     icao_code = models.CharField(max_length=4)
@@ -36,11 +94,19 @@ class Airport(Coordinates):
     transition_level = models.IntegerField(null=True, blank=True)
     longest_runway = models.IntegerField(null=True, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["cycle", "airport_id"], name="unique_airport_per_cycle"),
+        ]
+        indexes = [
+            models.Index(fields=["cycle", "grid_cell"], name="airport_grid_cell_idx"),
+        ]
+
     def __str__(self):
         return f"{self.icao_code} - {self.name}"
 
 
-class Navaid(Coordinates):
+class Navaid(GridIndexed, Fingerprinted):
     NAVAID_TYPES = [
         ("VOR", "VOR"),
         ("DME", "DME"),
@@ -65,11 +131,19 @@ class Navaid(Coordinates):
     dme_elevation = models.IntegerField(null=True, blank=True, help_text="Elevation in feet")
     service_volume = models.CharField(max_length=10, null=True, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["cycle", "navaid_id"], name="unique_navaid_per_cycle"),
+        ]
+        indexes = [
+            models.Index(fields=["cycle", "grid_cell"], name="navaid_grid_cell_idx"),
+        ]
+
     def __str__(self):
         return f"{self.navaid_id} - {self.name} - {self.navaid_type}"
 
 
-class Waypoint(Coordinates):
+class Waypoint(GridIndexed, Fingerprinted):
     WAYPOINT_TYPES = [
         ("ENROUTE", "Enroute"),
         ("TERMINAL", "Terminal"),
@@ -84,11 +158,29 @@ class Waypoint(Coordinates):
     waypoint_type = models.CharField(max_length=10, choices=WAYPOINT_TYPES)
     airspace_classification = models.CharField(max_length=1, null=True, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["cycle", "waypoint_id"], name="unique_waypoint_per_cycle"),
+        ]
+        indexes = [
+            models.Index(fields=["cycle", "grid_cell"], name="waypoint_grid_cell_idx"),
+        ]
+
     def __str__(self):
         return f"{self.waypoint_id} - {self.name}"
 
 
-class Airway(models.Model):
+def resolved_fix_field(to) -> models.ForeignKey:
+    """
+    Return an optional link from a fix reference to the airport, navaid or waypoint it names in the same cycle.
+
+    The links are only followed from the referencing side, so they get no reverse accessor. They are indexed all
+    the same: deleting a fix, e.g. when a cycle is pruned, looks up and unlinks its references.
+    """
+    return models.ForeignKey(to, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+")
+
+
+class Airway(Fingerprinted):
     ROUTE_TYPES = [
         ("JETWAY", "Jet Route"),
         ("VICTOR", "Victor Airway"),
@@ -99,6 +191,11 @@ class Airway(models.Model):
     airway_id = models.CharField(max_length=10)
     route_type = models.CharField(max_length=10, choices=ROUTE_TYPES)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["cycle", "airway_id"], name="unique_airway_per_cycle"),
+        ]
+
     def __str__(self):
         return f"{self.airway_id} - {self.route_type}"
 
@@ -121,15 +218,29 @@ class AirwaySegment(models.Model):
     maximum_altitude = models.IntegerField(null=True, blank=True, help_text="Altitude in feet")
     magnetic_course = models.IntegerField(null=True, blank=True)
     reverse_magnetic_course = models.IntegerField(null=True, blank=True)
+    # Resolved from the fix references after ingest, see data_processor.postprocess.resolve_fix_references.
+    fix_latitude = models.DecimalField(max_digits=11, decimal_places=8, null=True, blank=True, editable=False)
+    fix_longitude = models.DecimalField(max_digits=11, decimal_places=8, null=True, blank=True, editable=False)
+    next_fix_latitude = models.DecimalField(max_digits=11, decimal_places=8, null=True, blank=True, editable=False)
+    next_fix_longitude = models.DecimalField(max_digits=11, decimal_places=8, null=True, blank=True, editable=False)
+    fix_airport = resolved_fix_field(Airport)
+    fix_navaid = resolved_fix_field(Navaid)
+    fix_waypoint = resolved_fix_field(Waypoint)
+    next_fix_airport = resolved_fix_field(Airport)
+    next_fix_navaid = resolved_fix_field(Navaid)
+    next_fix_waypoint = resolved_fix_field(Waypoint)
 
     class Meta:
         ordering = ["sequence_number"]
+        constraints = [
+            models.UniqueConstraint(fields=["airway", "sequence_number"], name="unique_airway_segment"),
+        ]
 
     def __str__(self):
         return f"{self.airway.airway_id} - segment {self.sequence_number}"
 
 
-class Procedure(models.Model):
+class Procedure(Fingerprinted):
     PROCEDURE_TYPES = [
         ("SID", "Standard Instrument Departure"),
         ("STAR", "Standard Terminal Arrival Route"),
@@ -140,6 +251,11 @@ class Procedure(models.Model):
     procedure_id = models.CharField(max_length=10)
     procedure_type = models.CharField(max_length=10, choices=PROCEDURE_TYPES)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["cycle", "airport", "procedure_id"], name="unique_procedure_per_cycle"),
+        ]
+
     def __str__(self):
         return f"{self.airport.icao_code} - {self.procedure_id} - {self.procedure_type}"
 
@@ -148,6 +264,11 @@ class ProcedureTransition(models.Model):
     procedure = models.ForeignKey(Procedure, on_delete=models.CASCADE, related_name="transitions")
     transition_id = models.CharField(max_length=10)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["procedure", "transition_id"], name="unique_procedure_transition"),
+        ]
+
     def __str__(self):
         return f"{self.procedure.procedure_id} - {self.transition_id}"
 
@@ -171,6 +292,15 @@ class ProcedureLeg(Coordinates):
     course = models.IntegerField(null=True, blank=True)
     distance = models.DecimalField(max_digits=7, decimal_places=2, null=True, blank=True)
     leg_type = models.CharField(max_length=10, null=True, blank=True)
+    # Resolved from ``waypoint_identifier`` after ingest, see data_processor.postprocess.resolve_fix_references.
+    fix_airport = resolved_fix_field(Airport)
+    fix_navaid = resolved_fix_field(Navaid)
+    fix_waypoint = resolved_fix_field(Waypoint)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["transition", "sequence_number"], name="unique_procedure_leg"),
+        ]
 
     def __str__(self):
         return (
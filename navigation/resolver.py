@@ -0,0 +1,72 @@
+"""
+Batch resolution of fix identifiers, e.g. the fixes of a flight plan, against a data cycle.
+
+All identifiers are looked up with one ``IN`` query per table (airports, navaids, waypoints), whatever their
+number. Identifiers are unique within a table but may exist in several of them: a type hint restricts the
+lookup to one table, and a reference point picks the closest of the remaining matches.
+"""
+
+from .geodesy import CoordinateTable
+from .models import Airport, DataCycle, Navaid, Waypoint
+from .serializers import AirportSerializer, NavaidSerializer, WaypointSerializer
+from .spatial import great_circle_distance
+
+SERIALIZERS = {Airport: AirportSerializer, Navaid: NavaidSerializer, Waypoint: WaypointSerializer}
+
+# The tables of ``CoordinateTable.SOURCES``, as (fix type, model, identifier field, serializer).
+FIX_SOURCES = tuple(
+    (fix_type, model, identifier_field, SERIALIZERS[model])
+    for fix_type, model, identifier_field, _ in CoordinateTable.SOURCES
+)
+
+RESOLVED = "resolved"
+AMBIGUOUS = "ambiguous"
+NOT_FOUND = "not_found"
+
+
+def resolve_fixes(
+    cycle: DataCycle | None, fixes: list[tuple[str, str | None]], reference: tuple[float, float] | None = None
+) -> list[dict]:
+    """
+    Resolve identifiers to the fixes of a cycle.
+
+    Args:
+        cycle (DataCycle | None): Cycle to resolve against; nothing is found without one.
+        fixes (list[tuple[str, str | None]]): ``(identifier, fix type hint)`` pairs; a ``None`` hint searches
+            every table.
+        reference (tuple[float, float] | None): ``(latitude, longitude)`` that identifiers found in several
+            tables are resolved to the closest match of.
+
+    Returns:
+        list[dict]: One result per requested fix, in order: ``identifier``, ``status`` (``resolved``,
+            ``ambiguous`` or ``not_found``), the ``type`` and serialized ``fix`` of the match (``None`` unless
+            resolved), its ``distance_nm`` from the reference point, and every match as ``candidates`` when
+            there are several, closest first when there is a reference point.
+    """
+    matches = {}
+    for fix_type, model, identifier_field, serializer_class in FIX_SOURCES:
+        identifiers = {identifier for identifier, hint in fixes if hint in (None, fix_type)}
+        if cycle is None or not identifiers:
+            continue
+        records = list(model.objects.filter(cycle=cycle, **{f"{identifier_field}__in": identifiers}))
+        for record, data in zip(records, serializer_class(records, many=True).data, strict=True):
+            distance = None
+            if reference is not None:
+                distance = round(great_circle_distance(*reference, float(record.latitude), float(record.longitude)), 3)
+            matches.setdefault(getattr(record, identifier_field), []).append(
+                {"type": fix_type, "fix": data, "distance_nm": distance}
+            )
+
+    results = []
+    for identifier, hint in fixes:
+        candidates = [match for match in matches.get(identifier, []) if hint in (None, match["type"])]
+        if reference is not None:
+            candidates.sort(key=lambda match: match["distance_nm"])
+        result = {"identifier": identifier, "status": NOT_FOUND, "type": None, "fix": None, "distance_nm": None}
+        if len(candidates) == 1 or (candidates and reference is not None):
+            result.update(candidates[0], status=RESOLVED)
+        elif candidates:
+            result["status"] = AMBIGUOUS
+        result["candidates"] = candidates if len(candidates) > 1 else []
+        results.append(result)
+    return results
@@ -0,0 +1,161 @@
+"""
+Retention of data cycles: which cycles stay in the ``navigation`` tables, and fast removal of the others.
+
+The active cycle, every upcoming cycle and the ``NAVIGATION_RETAINED_PREVIOUS_CYCLES`` most recent READY cycles
+before the active one are kept in the database; older cycles have expired and are pruned, and so are the cycles
+before the active one that never became READY (failed or abandoned loads). When ``NAVIGATION_ARCHIVE_DIR``
+is set, a pruned cycle is first exported there as a gzipped NDJSON file (see ``navigation.exports``), which holds
+everything needed to inspect it later.
+
+Deleting a ``DataCycle`` through the ORM collects and cascades to its records a few at a time, and holds its locks
+for the whole cycle. ``prune_cycle`` deletes the records table by table instead, children before their parents,
+with ``DELETE ... WHERE id IN (SELECT ... LIMIT n)`` statements of ``NAVIGATION_PRUNE_CHUNK_SIZE`` rows, each
+committed on its own. An interrupted prune leaves an expired cycle with part of its records, which is never served
+and is finished by the next run.
+"""
+
+import logging
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .caching import invalidate_cached_responses
+from .cycles import invalidate_active_cycle, resolve_active_cycle
+from .exports import stream_export
+from .models import (
+    Airport,
+    Airway,
+    AirwaySegment,
+    DataCycle,
+    Navaid,
+    Procedure,
+    ProcedureLeg,
+    ProcedureTransition,
+    Waypoint,
+)
+from .routing import drop_airway_graph
+from .serializers import ExportQuerySerializer
+from .snapshots import remove_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Tables of a cycle's records, in deletion order (children first), with the lookup from a row to its cycle.
+PRUNE_ORDER = [
+    (ProcedureLeg, "transition__procedure__cycle"),
+    (ProcedureTransition, "procedure__cycle"),
+    (Procedure, "cycle"),
+    (AirwaySegment, "airway__cycle"),
+    (Airway, "cycle"),
+    (Airport, "cycle"),
+    (Navaid, "cycle"),
+    (Waypoint, "cycle"),
+]
+
+# A cycle is not pruned while one of its files is being loaded.
+LOADING_STATUSES = ["PENDING", "PROCESSING"]
+
+
+def cycles_to_prune(on: date | None = None, keep_previous: int | None = None) -> list[DataCycle]:
+    """
+    Return the expired cycles that the retention policy no longer keeps, oldest first.
+
+    Only READY cycles count towards the cycles kept before the active one, so a failed load does not take the
+    place of the cycle served before it; cycles before the active one that are not READY are pruned.
+
+    Args:
+        on (date | None): Date the active cycle is resolved for, today when not given.
+        keep_previous (int | None): Cycles before the active one to keep, ``NAVIGATION_RETAINED_PREVIOUS_CYCLES``
+            when not given.
+
+    Returns:
+        list[DataCycle]: The cycles to prune; never the active cycle or an upcoming one.
+    """
+    if keep_previous is None:
+        keep_previous = settings.NAVIGATION_RETAINED_PREVIOUS_CYCLES
+    active, _ = resolve_active_cycle(on or timezone.localdate())
+    if active is None:
+        return []
+    previous = DataCycle.objects.filter(effective_date__lt=active.effective_date)
+    kept = previous.filter(status="READY").order_by("-effective_date").values_list("pk", flat=True)[:keep_previous]
+    return list(
+        previous.exclude(pk__in=list(kept)).exclude(files__status__in=LOADING_STATUSES).order_by("effective_date")
+    )
+
+
+def prune_cycle(cycle: DataCycle, archive_dir: str | Path | None = None, chunk_size: int | None = None) -> dict:
+    """
+    Delete a cycle and all of its records, archiving it first when an archive directory is given.
+
+    Args:
+        cycle (DataCycle): Cycle to delete.
+        archive_dir (str | Path | None): Directory the cycle is exported to before it is deleted,
+            ``NAVIGATION_ARCHIVE_DIR`` when not given; empty disables archiving.
+        chunk_size (int | None): Rows deleted per statement, ``NAVIGATION_PRUNE_CHUNK_SIZE`` when not given.
+
+    Returns:
+        dict: Rows deleted per model, keyed by model name, and the path of the ``archive`` when one was written.
+    """
+    archive_dir = settings.NAVIGATION_ARCHIVE_DIR if archive_dir is None else archive_dir
+    chunk_size = chunk_size or settings.NAVIGATION_PRUNE_CHUNK_SIZE
+    result = {}
+    if archive_dir:
+        result["archive"] = str(archive_cycle(cycle, archive_dir))
+
+    for model, lookup in PRUNE_ORDER:
+        result[model.__name__] = _delete_in_chunks(model, lookup, cycle, chunk_size)
+    cycle_id = cycle.pk
+    # Only the cycle row is left, and the files loaded into it, which are kept and unlinked.
+    cycle.delete()
+
+    invalidate_active_cycle()
+    invalidate_cached_responses()
+    drop_airway_graph(cycle_id)
+    remove_snapshot(cycle_id)
+    logger.info(f"Pruned cycle {cycle_id}: {sum(result[model.__name__] for model, _ in PRUNE_ORDER)} records")
+    return result
+
+
+def archive_cycle(cycle: DataCycle, archive_dir: str | Path) -> Path:
+    """
+    Export every record of a cycle to ``<archive_dir>/<cycle_id>.ndjson.gz``, replacing an earlier archive.
+
+    The file is written under a temporary name and renamed into place, so an archive is either complete or absent.
+
+    Returns:
+        Path: The archive.
+    """
+    archive_dir = Path(archive_dir)
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    target = archive_dir / f"{cycle.pk}.ndjson.gz"
+    fd, staging = tempfile.mkstemp(prefix=f".{cycle.pk}-", dir=archive_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in stream_export(cycle, ExportQuerySerializer.RECORDS, compress=True):
+                f.write(chunk)
+        os.replace(staging, target)
+    except BaseException:
+        os.unlink(staging)
+        raise
+    logger.info(f"Archived cycle {cycle.pk} to {target}")
+    return target
+
+
+def _delete_in_chunks(model, lookup: str, cycle: DataCycle, chunk_size: int) -> int:
+    """Delete the rows of a table that belong to a cycle, ``chunk_size`` rows per committed statement."""
+    table = connection.ops.quote_name(model._meta.db_table)
+    pk = connection.ops.quote_name(model._meta.pk.column)
+    ids = model.objects.filter(**{lookup: cycle}).order_by().values("pk")[:chunk_size]
+    select, params = ids.query.sql_with_params()
+    deleted = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE {pk} IN ({select})", params)
+            count = cursor.rowcount
+        deleted += count
+        if count < chunk_size:
+            return deleted
@@ -0,0 +1,332 @@
+"""
+Airway route graph and A* route finder.
+
+The airway segments of a cycle are held as a compressed sparse row (CSR) graph over the cycle's fixes: the edges
+leaving node ``n`` are ``targets[indptr[n]:indptr[n + 1]]``. Edge lengths are great-circle distances, so the
+great-circle distance to the destination is an admissible A* heuristic.
+"""
+
+import heapq
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from django.core.cache import cache
+
+from .geodesy import CoordinateTable, haversine
+from .models import Airway, AirwaySegment
+
+ROUTE_TYPES = [route_type for route_type, _ in Airway.ROUTE_TYPES]
+# Airports off the airway network are joined to it at the closest fixes within this distance.
+AIRPORT_CONNECTION_RADIUS_NM = 50.0
+AIRPORT_CONNECTIONS = 3
+NO_MAXIMUM_ALTITUDE = np.iinfo(np.int32).max
+
+GRAPH_CACHE_KEY = "navigation:airway-graph:{cycle_id}"
+# Edge filters (altitude and route types) whose masks are kept per graph.
+ALLOWED_MASKS = 8
+# Graphs kept in memory per process; the active cycle and the one about to replace it.
+LOCAL_GRAPHS = 2
+
+_local_graphs = OrderedDict()
+# Guards the LRU order of ``_local_graphs`` and of every graph's edge masks, shared by the threads of a process.
+_lru_lock = threading.Lock()
+
+
+class AirwayGraph:
+    """
+    Airway network of one data cycle in CSR form.
+
+    Airways are treated as bidirectional: each segment adds an edge in both directions.
+
+    Attributes:
+        keys (list[tuple[str, str]]): ``(fix type, identifier)`` of each node.
+        latitudes (np.ndarray): Latitude of each node.
+        longitudes (np.ndarray): Longitude of each node.
+        indptr (np.ndarray): Offset of each node's first outgoing edge, plus the total number of edges.
+        targets (np.ndarray): Target node of each edge.
+        distances (np.ndarray): Great-circle length of each edge in nautical miles.
+        minimum_altitudes (np.ndarray): Lowest altitude of each edge in feet, 0 when unrestricted.
+        maximum_altitudes (np.ndarray): Highest altitude of each edge in feet.
+        route_types (np.ndarray): Index into ``ROUTE_TYPES`` of each edge's airway.
+        airways (np.ndarray): Index into ``airway_ids`` of each edge's airway.
+        airway_ids (list[str]): Identifiers of the cycle's airways.
+    """
+
+    def __init__(
+        self,
+        cycle_id,
+        keys,
+        latitudes,
+        longitudes,
+        sources,
+        targets,
+        minimum_altitudes,
+        maximum_altitudes,
+        route_types,
+        airways,
+        airway_ids,
+    ):
+        self.cycle_id = cycle_id
+        self.keys = list(keys)
+        self.latitudes = np.ascontiguousarray(latitudes, dtype=np.float64)
+        self.longitudes = np.ascontiguousarray(longitudes, dtype=np.float64)
+        order = np.argsort(sources, kind="stable")
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(sources, minlength=len(self.keys))))).astype(np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)[order]
+        sources = np.asarray(sources, dtype=np.int64)[order]
+        self.distances = haversine(
+            self.latitudes[sources],
+            self.longitudes[sources],
+            self.latitudes[self.targets],
+            self.longitudes[self.targets],
+        )
+        self.minimum_altitudes = np.asarray(minimum_altitudes, dtype=np.int32)[order]
+        self.maximum_altitudes = np.asarray(maximum_altitudes, dtype=np.int32)[order]
+        self.route_types = np.asarray(route_types, dtype=np.int8)[order]
+        self.airways = np.asarray(airways, dtype=np.int32)[order]
+        self.airway_ids = list(airway_ids)
+        self._nodes_by_identifier = {}
+        for node, (_, identifier) in enumerate(self.keys):
+            self._nodes_by_identifier.setdefault(identifier, []).append(node)
+        self._connected = np.flatnonzero(np.diff(self.indptr) > 0)
+        self._search_lists = None
+        self._allowed_masks = OrderedDict()
+
+    @classmethod
+    def for_cycle(cls, cycle, table: CoordinateTable | None = None) -> "AirwayGraph":
+        """Build the graph of a cycle's airway segments; segments with an unknown fix are left out."""
+        table = table if table is not None else CoordinateTable.for_cycle(cycle)
+        rows = list(
+            AirwaySegment.objects.filter(airway__cycle=cycle, next_fix_identifier__isnull=False).values_list(
+                "airway__airway_id",
+                "airway__route_type",
+                "fix_type",
+                "fix_identifier",
+                "next_fix_type",
+                "next_fix_identifier",
+                "minimum_altitude",
+                "maximum_altitude",
+            )
+        )
+        airway_ids = sorted({row[0] for row in rows})
+        airway_index = {airway_id: index for index, airway_id in enumerate(airway_ids)}
+        if rows:
+            airway, route_type, fix_types, fixes, next_fix_types, next_fixes, minimums, maximums = zip(
+                *rows, strict=True
+            )
+        else:
+            airway = route_type = fix_types = fixes = next_fix_types = next_fixes = minimums = maximums = ()
+        start = table.locate(zip(fix_types, fixes, strict=True))
+        end = table.locate(zip(next_fix_types, next_fixes, strict=True))
+        resolved = (start >= 0) & (end >= 0)
+
+        def edge_values(values, converter):
+            column = np.fromiter((converter(value) for value in values), dtype=np.int64, count=len(rows))[resolved]
+            return np.concatenate((column, column))
+
+        return cls(
+            cycle.pk,
+            table.keys,
+            table.latitudes,
+            table.longitudes,
+            np.concatenate((start[resolved], end[resolved])),
+            np.concatenate((end[resolved], start[resolved])),
+            edge_values(minimums, lambda value: value or 0),
+            edge_values(maximums, lambda value: NO_MAXIMUM_ALTITUDE if value is None else value),
+            edge_values(route_type, lambda value: ROUTE_TYPES.index(value) if value in ROUTE_TYPES else -1),
+            edge_values(airway, airway_index.__getitem__),
+            airway_ids,
+        )
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def endpoints(self, identifier: str) -> dict[int, float]:
+        """
+        Return the nodes a route can start or end at for an identifier, with the distance to reach each one.
+
+        A fix on the network is its own endpoint. A fix or airport off the network is joined to the closest
+        connected fixes within ``AIRPORT_CONNECTION_RADIUS_NM``.
+        """
+        nodes = self._nodes_by_identifier.get(identifier, [])
+        on_network = {node: 0.0 for node in nodes if self.indptr[node + 1] > self.indptr[node]}
+        if on_network or not nodes or not len(self._connected):
+            return on_network
+        node = nodes[0]
+        candidates = self._connected
+        distances = haversine(
+            self.latitudes[node], self.longitudes[node], self.latitudes[candidates], self.longitudes[candidates]
+        )
+        closest = np.argsort(distances)[:AIRPORT_CONNECTIONS]
+        return {
+            int(candidates[i]): float(distances[i]) for i in closest if distances[i] <= AIRPORT_CONNECTION_RADIUS_NM
+        }
+
+    def find_route(self, origin: str, destination: str, altitude: int | None = None, route_types=None) -> dict | None:
+        """
+        Find the shortest route between two fixes or airports with A*.
+
+        Args:
+            origin (str): Identifier of the fix or airport the route starts at.
+            destination (str): Identifier of the fix or airport the route ends at.
+            altitude (int | None): Cruise altitude in feet; segments whose altitude limits exclude it are not used.
+            route_types (Iterable[str] | None): Airway types that may be used, all of them when ``None``.
+
+        Returns:
+            dict | None: ``{"distance_nm": ..., "fixes": [...]}``, or ``None`` when there is no route.
+        """
+        sources, goals = self.endpoints(origin), self.endpoints(destination)
+        if not sources or not goals:
+            return None
+
+        allowed = self._allowed_edges(altitude, None if route_types is None else tuple(sorted(route_types)))
+        goal_nodes = np.fromiter(goals, dtype=np.int64)
+        heuristic = np.min(
+            [
+                haversine(self.latitudes, self.longitudes, self.latitudes[goal], self.longitudes[goal]) + goals[goal]
+                for goal in goal_nodes.tolist()
+            ],
+            axis=0,
+        ).tolist()
+        path = self._search(sources, goals, heuristic, allowed)
+        if path is None:
+            return None
+        return self._describe(origin, destination, sources, goals, path)
+
+    def _allowed_edges(self, altitude, route_types) -> list[bool]:
+        """Return which edges a search may use, caching the masks of the most recent filters."""
+        key = (altitude, route_types)
+        with _lru_lock:
+            allowed = self._allowed_masks.get(key)
+            if allowed is not None:
+                self._allowed_masks.move_to_end(key)
+                return allowed
+
+        mask = np.ones(self.edge_count, dtype=bool)
+        if altitude is not None:
+            mask &= (self.minimum_altitudes <= altitude) & (altitude <= self.maximum_altitudes)
+        if route_types is not None:
+            mask &= np.isin(self.route_types, [ROUTE_TYPES.index(route_type) for route_type in route_types])
+        allowed = mask.tolist()
+        with _lru_lock:
+            self._allowed_masks[key] = allowed
+            while len(self._allowed_masks) > ALLOWED_MASKS:
+                self._allowed_masks.popitem(last=False)
+        return allowed
+
+    def _search(self, sources, goals, heuristic, allowed):
+        """Run A* and return the ``(node, edge used to reach it)`` pairs of the best path, or ``None``."""
+        indptr, targets, distances = self._get_search_lists()
+        heappush, heappop = heapq.heappush, heapq.heappop
+        finish = len(self.keys)  # Virtual node every goal leads to, at the goal's connection distance.
+        best = [math.inf] * (finish + 1)
+        previous_node = [-1] * (finish + 1)
+        previous_edge = [-1] * (finish + 1)
+        for node, cost in sources.items():
+            best[node] = cost
+        heap = [(cost + heuristic[node], cost, node) for node, cost in sources.items()]
+        heapq.heapify(heap)
+        while heap:
+            _, cost, node = heappop(heap)
+            if node == finish:
+                break
+            if cost > best[node]:
+                continue
+            if node in goals:
+                total = cost + goals[node]
+                if total < best[finish]:
+                    best[finish], previous_node[finish] = total, node
+                    heappush(heap, (total, total, finish))
+            for edge in range(indptr[node], indptr[node + 1]):
+                if allowed[edge]:
+                    target, next_cost = targets[edge], cost + distances[edge]
+                    if next_cost < best[target]:
+                        best[target], previous_node[target], previous_edge[target] = next_cost, node, edge
+                        heappush(heap, (next_cost + heuristic[target], next_cost, target))
+        else:
+            return None
+        return self._trace(previous_node, previous_edge, finish)
+
+    def _get_search_lists(self) -> tuple[list, list, list]:
+        """Return the CSR arrays as lists, which A* indexes one element at a time much faster than arrays."""
+        if self._search_lists is None:
+            self._search_lists = (self.indptr.tolist(), self.targets.tolist(), self.distances.tolist())
+        return self._search_lists
+
+    @staticmethod
+    def _trace(previous_node, previous_edge, finish) -> list[tuple[int, int | None]]:
+        """Walk back from the virtual finish node to the ``(node, edge used to reach it)`` pairs of the path."""
+        path, node = [], previous_node[finish]
+        while node != -1:
+            edge = previous_edge[node]
+            path.append((node, None if edge == -1 else edge))
+            node = previous_node[node] if edge != -1 else -1
+        path.reverse()
+        return path
+
+    def _describe(self, origin, destination, sources, goals, path) -> dict:
+        fixes = []
+        first_node, last_node = path[0][0], path[-1][0]
+        if sources[first_node]:
+            fixes.append(self._fix(self._nodes_by_identifier[origin][0], None, 0.0))
+        for node, edge in path:
+            leg = sources[node] if edge is None else float(self.distances[edge])
+            fixes.append(self._fix(node, None if edge is None else self.airway_ids[self.airways[edge]], leg))
+        if goals[last_node]:
+            fixes.append(self._fix(self._nodes_by_identifier[destination][0], None, goals[last_node]))
+        return {"distance_nm": round(sum(fix["distance_nm"] for fix in fixes), 2), "fixes": fixes}
+
+    def _fix(self, node, airway, distance) -> dict:
+        fix_type, identifier = self.keys[node]
+        return {
+            "identifier": identifier,
+            "fix_type": fix_type,
+            "latitude": round(float(self.latitudes[node]), 8),
+            "longitude": round(float(self.longitudes[node]), 8),
+            "airway": airway,
+            "distance_nm": round(float(distance), 2),
+        }
+
+
+def get_airway_graph(cycle) -> AirwayGraph:
+    """
+    Return the airway graph of a cycle, built once and cached.
+
+    Graphs are kept per process (the ``LOCAL_GRAPHS`` most recently used cycles) and in the shared Django cache,
+    where ``promote_arinc_file`` stores the graph of a cycle right after loading it.
+    """
+    with _lru_lock:
+        graph = _local_graphs.get(cycle.pk)
+        if graph is not None:
+            _local_graphs.move_to_end(cycle.pk)
+            return graph
+
+    graph = cache.get(GRAPH_CACHE_KEY.format(cycle_id=cycle.pk))
+    if graph is None:
+        graph = cache_airway_graph(AirwayGraph.for_cycle(cycle))
+    with _lru_lock:
+        _local_graphs[cycle.pk] = graph
+        while len(_local_graphs) > LOCAL_GRAPHS:
+            _local_graphs.popitem(last=False)
+    return graph
+
+
+def cache_airway_graph(graph: AirwayGraph) -> AirwayGraph:
+    """Store a graph in the shared cache, replacing any earlier graph of its cycle."""
+    # Rebuilt on first search; not worth the space in the cache.
+    graph._search_lists = None
+    with _lru_lock:
+        graph._allowed_masks.clear()
+        _local_graphs.pop(graph.cycle_id, None)
+    cache.set(GRAPH_CACHE_KEY.format(cycle_id=graph.cycle_id), graph, None)
+    return graph
+
+
+def drop_airway_graph(cycle_id) -> None:
+    """Forget the graph of a cycle, in this process and in the shared cache."""
+    with _lru_lock:
+        _local_graphs.pop(cycle_id, None)
+    cache.delete(GRAPH_CACHE_KEY.format(cycle_id=cycle_id))
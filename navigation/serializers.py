@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 
 from navigation.models import (
@@ -115,12 +116,144 @@ class AirwaySegmentSerializer(serializers.ModelSerializer):
             "maximum_altitude",
             "magnetic_course",
             "reverse_magnetic_course",
+            "fix_latitude",
+            "fix_longitude",
+            "next_fix_latitude",
+            "next_fix_longitude",
         ]
 
 
+class CountField(serializers.IntegerField):
+    # Number of related records: the ``source`` annotation when the queryset carries it, so a list costs no query
+    # per row, and a count of ``related_name`` otherwise.
+    def __init__(self, related_name, **kwargs):
+        super().__init__(read_only=True, **kwargs)
+        self.related_name = related_name
+
+    def get_attribute(self, instance):
+        count = getattr(instance, self.source, None)
+        if count is None:
+            count = getattr(instance, self.related_name).count()
+        return count
+
+
 class AirwaySerializer(serializers.ModelSerializer):
-    segments_count = serializers.IntegerField(source="segments.count", read_only=True)
+    # Annotated by AirwayViewSet.get_queryset.
+    segments_count = CountField("segments")
 
     class Meta:
         model = Airway
         fields = ["id", "cycle", "airway_id", "route_type", "segments_count"]
+
+
+class AirwayExportSerializer(serializers.ModelSerializer):
+    segments = AirwaySegmentSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Airway
+        fields = ["id", "cycle", "airway_id", "route_type", "segments"]
+
+
+class ProcedureExportSerializer(serializers.ModelSerializer):
+    transitions = ProcedureTransitionSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Procedure
+        fields = ["id", "cycle", "airport", "procedure_id", "procedure_type", "transitions"]
+
+
+class NearestQuerySerializer(serializers.Serializer):
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+    lon = serializers.FloatField(min_value=-180, max_value=180)
+    radius = serializers.FloatField(min_value=0, max_value=1000, default=25, help_text="Radius in nautical miles")
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=20)
+
+
+class BoundingBoxQuerySerializer(serializers.Serializer):
+    min_lat = serializers.FloatField(min_value=-90, max_value=90)
+    min_lon = serializers.FloatField(min_value=-180, max_value=180)
+    max_lat = serializers.FloatField(min_value=-90, max_value=90)
+    max_lon = serializers.FloatField(
+        min_value=-180, max_value=180, help_text="May be west of min_lon for a box crossing the antimeridian"
+    )
+
+    def validate(self, attrs):
+        if attrs["min_lat"] > attrs["max_lat"]:
+            raise serializers.ValidationError("min_lat must not be greater than max_lat.")
+        return attrs
+
+
+class RouteQuerySerializer(serializers.Serializer):
+    origin = serializers.CharField(max_length=10, help_text="Fix or airport identifier the route starts at")
+    destination = serializers.CharField(max_length=10, help_text="Fix or airport identifier the route ends at")
+    altitude = serializers.IntegerField(min_value=0, required=False, help_text="Cruise altitude in feet")
+    route_types = serializers.CharField(
+        required=False, help_text="Comma-separated airway types to use, e.g. JETWAY,RNAV; all types by default"
+    )
+
+    def validate_route_types(self, value):
+        route_types = [route_type.strip().upper() for route_type in value.split(",") if route_type.strip()]
+        known = [route_type for route_type, _ in Airway.ROUTE_TYPES]
+        unknown = sorted(set(route_types) - set(known))
+        if unknown:
+            raise serializers.ValidationError(f"Unknown route types: {', '.join(unknown)}.")
+        return route_types
+
+
+class ResolveFixSerializer(serializers.Serializer):
+    identifier = serializers.CharField(max_length=10)
+    type = serializers.ChoiceField(
+        choices=AirwaySegment.FIX_TYPES, required=False, help_text="Only look the identifier up as this type of fix"
+    )
+
+    def to_internal_value(self, data):
+        # A bare identifier is accepted in place of an object.
+        if isinstance(data, str):
+            data = {"identifier": data}
+        if isinstance(data, dict):
+            data = {name: value.strip().upper() if isinstance(value, str) else value for name, value in data.items()}
+        return super().to_internal_value(data)
+
+
+class ResolveRequestSerializer(serializers.Serializer):
+    fixes = serializers.ListField(
+        child=ResolveFixSerializer(),
+        min_length=1,
+        max_length=settings.NAVIGATION_RESOLVE_MAX_FIXES,
+        help_text='Identifiers, or {"identifier": ..., "type": ...} objects with a type hint',
+    )
+    lat = serializers.FloatField(
+        min_value=-90, max_value=90, required=False, help_text="Reference point ambiguous identifiers resolve near"
+    )
+    lon = serializers.FloatField(min_value=-180, max_value=180, required=False)
+
+    def validate(self, attrs):
+        if ("lat" in attrs) != ("lon" in attrs):
+            raise serializers.ValidationError("lat and lon must be given together.")
+        return attrs
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    RECORDS = ["airports", "navaids", "waypoints", "airways", "procedures"]
+
+    records = serializers.CharField(
+        required=False, help_text="Comma-separated record types to export, e.g. airports,airways; all by default"
+    )
+    output = serializers.ChoiceField(choices=["ndjson", "csv"], default="ndjson")
+    gzip = serializers.BooleanField(default=False, help_text="Compress the export as a .gz file")
+    cycle = serializers.CharField(
+        max_length=10, required=False, help_text="Data cycle to export; the active one by default"
+    )
+
+    def validate_records(self, value):
+        records = [record.strip().lower() for record in value.split(",") if record.strip()]
+        unknown = sorted(set(records) - set(self.RECORDS))
+        if unknown:
+            raise serializers.ValidationError(f"Unknown record types: {', '.join(unknown)}.")
+        return list(dict.fromkeys(records))
+
+    def validate(self, attrs):
+        attrs.setdefault("records", self.RECORDS)
+        if attrs["output"] == "csv" and len(attrs["records"]) != 1:
+            raise serializers.ValidationError({"records": "CSV exports take exactly one record type."})
+        return attrs
@@ -0,0 +1,351 @@
+"""
+Memory-mapped, column-oriented snapshots of completed data cycles.
+
+A cycle does not change once its file is promoted, so its records are exported to a directory of ``.npy``
+column files under ``NAVIGATION_SNAPSHOT_DIR``: fixed-width identifier and text arrays, float64 coordinates and
+integer columns, each with a null mask when needed. Child tables (procedure transitions and legs, airway segments)
+are stored grouped by parent and indexed by an offsets array on the parent table, like a CSR matrix.
+
+Read servers memory-map the columns, so opening a snapshot only reads its headers, the pages are shared by all
+worker processes through the page cache, and lookups by id need no database round trip. The rows produced match
+the output of the ``navigation`` serializers exactly.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils import timezone
+
+from .models import (
+    Airport,
+    Airway,
+    AirwaySegment,
+    DataCycle,
+    Navaid,
+    Procedure,
+    ProcedureLeg,
+    ProcedureTransition,
+    Waypoint,
+)
+from .serializers import (
+    AirportSerializer,
+    AirwaySegmentSerializer,
+    AirwaySerializer,
+    NavaidSerializer,
+    ProcedureLegSerializer,
+    ProcedureSerializer,
+    ProcedureTransitionSerializer,
+    WaypointSerializer,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+MANIFEST = "manifest.json"
+
+
+class SnapshotTable(NamedTuple):
+    """
+    A table of the snapshot.
+
+    Attributes:
+        name (str): Name of the table, also the name of its relation on the parent table.
+        model (type[models.Model]): Model the rows are read from.
+        serializer (type): Serializer whose fields the rows reproduce. Fields naming a child table are rendered
+            as the nested child rows, and ``<child>_count`` fields as their number.
+        cycle_lookup (str): Lookup filtering the model by data cycle.
+        ordering (tuple[str, ...]): Order of the rows; tables looked up by id are ordered by ``id``.
+        parent (tuple[str, str] | None): Parent table and the foreign key to it, for child tables.
+    """
+
+    name: str
+    model: type[models.Model]
+    serializer: type
+    cycle_lookup: str
+    ordering: tuple[str, ...]
+    parent: tuple[str, str] | None = None
+
+
+# Parents come before their children.
+TABLES = (
+    SnapshotTable("airports", Airport, AirportSerializer, "cycle", ("id",)),
+    SnapshotTable("navaids", Navaid, NavaidSerializer, "cycle", ("id",)),
+    SnapshotTable("waypoints", Waypoint, WaypointSerializer, "cycle", ("id",)),
+    SnapshotTable("procedures", Procedure, ProcedureSerializer, "cycle", ("id",), parent=("airports", "airport")),
+    SnapshotTable(
+        "transitions",
+        ProcedureTransition,
+        ProcedureTransitionSerializer,
+        "procedure__cycle",
+        ("procedure", "id"),
+        parent=("procedures", "procedure"),
+    ),
+    SnapshotTable(
+        "legs",
+        ProcedureLeg,
+        ProcedureLegSerializer,
+        "transition__procedure__cycle",
+        ("transition", "sequence_number"),
+        parent=("transitions", "transition"),
+    ),
+    SnapshotTable("airways", Airway, AirwaySerializer, "cycle", ("id",)),
+    SnapshotTable(
+        "segments",
+        AirwaySegment,
+        AirwaySegmentSerializer,
+        "airway__cycle",
+        ("airway", "sequence_number"),
+        parent=("airways", "airway"),
+    ),
+)
+
+# Snapshots opened by this process: {cycle_id: (manifest stat key, CycleSnapshot)}
+_open_snapshots = {}
+
+
+def write_snapshot(cycle: DataCycle, root: str | Path | None = None) -> Path:
+    """
+    Export a cycle to ``<root>/<cycle_id>/``, replacing an earlier snapshot of the same cycle.
+
+    The snapshot is written to a temporary directory and renamed into place, so readers never see a partial one;
+    processes that already mapped the previous snapshot keep reading it until they notice the new manifest.
+
+    Args:
+        cycle (DataCycle): Cycle to export.
+        root (str | Path | None): Snapshot directory, ``NAVIGATION_SNAPSHOT_DIR`` when not given.
+
+    Returns:
+        Path: Directory of the snapshot.
+    """
+    root = Path(root or settings.NAVIGATION_SNAPSHOT_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{cycle.cycle_id}-", dir=root))
+    try:
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "cycle": cycle.cycle_id,
+            "created_at": timezone.now().isoformat(),
+            "tables": {},
+        }
+        ids = {}
+        for table in TABLES:
+            manifest["tables"][table.name] = _write_table(staging, cycle, table, manifest["tables"], ids)
+        with open(staging / MANIFEST, "w") as f:
+            json.dump(manifest, f)
+
+        target = root / cycle.cycle_id
+        previous = None
+        if target.exists():
+            previous = target.rename(root / f".{cycle.cycle_id}-{uuid.uuid4().hex}")
+        staging.rename(target)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    if previous is not None:
+        shutil.rmtree(previous, ignore_errors=True)
+    logger.info(f"Wrote the snapshot of cycle {cycle.cycle_id} to {target}")
+    return target
+
+
+def _write_table(directory: Path, cycle: DataCycle, table: SnapshotTable, tables: dict, ids: dict) -> dict:
+    """Write the columns of a table, and its offsets on the parent table, and return its manifest entry."""
+    opts = table.model._meta
+    fields, columns = [], {}
+    for name in table.serializer.Meta.fields:
+        fields.append(name)
+        try:
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.concrete:
+            columns[name] = _column_spec(field)
+    if table.parent is not None and table.parent[1] not in columns:
+        columns[table.parent[1]] = _column_spec(opts.get_field(table.parent[1]))
+    stored = [name for name, spec in columns.items() if spec["kind"] != "cycle"]
+    if "id" not in stored:
+        stored.append("id")
+
+    queryset = table.model.objects.filter(**{table.cycle_lookup: cycle}).order_by(*table.ordering)
+    rows = list(queryset.values_list(*stored))
+    values = dict(zip(stored, zip(*rows, strict=True) if rows else [()] * len(stored), strict=True))
+    table_directory = directory / table.name
+    table_directory.mkdir()
+    for name in stored:
+        spec = columns.get(name, {"kind": "integer"})
+        array, nulls = _to_array(values[name], spec)
+        np.save(table_directory / f"{name}.npy", array)
+        if nulls.any():
+            np.save(table_directory / f"{name}.null.npy", nulls)
+            spec["nullable"] = True
+    ids[table.name] = np.asarray(values["id"], dtype=np.int64)
+
+    if table.parent is not None:
+        parent, foreign_key = table.parent
+        parent_ids = ids[parent]
+        # Row of each row's parent in the parent table, which is not necessarily stored in id order.
+        sorter = np.argsort(parent_ids, kind="stable")
+        owners = np.asarray(values[foreign_key], dtype=np.int64)
+        owner_rows = sorter[np.searchsorted(parent_ids, owners, sorter=sorter)] if len(owners) else owners
+        grouped = bool(np.all(np.diff(owner_rows) >= 0))
+        # Rows of the table grouped by parent row; tables stored in another order get a permutation into them.
+        order = np.arange(len(owners)) if grouped else np.argsort(owner_rows, kind="stable")
+        offsets = np.append(np.searchsorted(owner_rows[order], np.arange(len(parent_ids))), len(owners))
+        np.save(directory / parent / f"{table.name}.offsets.npy", offsets.astype(np.int64))
+        if not grouped:
+            np.save(directory / parent / f"{table.name}.rows.npy", order.astype(np.int64))
+        tables[parent]["relations"][table.name] = {"indexed": not grouped}
+
+    return {"rows": len(ids[table.name]), "fields": fields, "columns": columns, "relations": {}}
+
+
+def _column_spec(field) -> dict:
+    if field.is_relation:
+        if field.related_model is DataCycle:
+            return {"kind": "cycle"}
+        field = field.target_field
+    if isinstance(field, models.DecimalField):
+        return {"kind": "decimal", "decimal_places": field.decimal_places}
+    if isinstance(field, models.IntegerField):
+        return {"kind": "integer"}
+    return {"kind": "text"}
+
+
+def _to_array(values, spec: dict) -> tuple[np.ndarray, np.ndarray]:
+    nulls = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    if spec["kind"] == "text":
+        array = np.array([b"" if value is None else value.encode() for value in values], dtype="S")
+    elif spec["kind"] == "decimal":
+        array = np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+    else:
+        array = np.array([0 if value is None else value for value in values], dtype=np.int64)
+    return array, nulls
+
+
+class CycleSnapshot:
+    """
+    A memory-mapped snapshot of one cycle.
+
+    Attributes:
+        cycle_id (str): Cycle of the snapshot.
+        manifest (dict): Tables, columns and relations of the snapshot.
+    """
+
+    def __init__(self, directory: str | Path):
+        directory = Path(directory)
+        with open(directory / MANIFEST) as f:
+            self.manifest = json.load(f)
+        if self.manifest["format"] != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format {self.manifest['format']} in {directory}")
+        self.cycle_id = self.manifest["cycle"]
+        # Everything is mapped up front, so a snapshot replaced on disk later can't be read half old, half new.
+        self._arrays = {}
+        for name in self.manifest["tables"]:
+            for path in (directory / name).glob("*.npy"):
+                self._arrays[name, path.name[: -len(".npy")]] = np.load(path, mmap_mode="r")
+
+    def get(self, table: str, pk) -> dict | None:
+        """Return the row of a table with the given id, ``None`` when the snapshot doesn't have it."""
+        row = self._find(table, pk)
+        return None if row is None else self._row(table, row)
+
+    def related(self, table: str, pk, relation: str) -> list[dict] | None:
+        """
+        Return the child rows of a row, e.g. ``related("airways", pk, "segments")``.
+
+        Returns:
+            list[dict] | None: The child rows, ``None`` when the snapshot doesn't have the parent row.
+        """
+        row = self._find(table, pk)
+        return None if row is None else [self._row(relation, child) for child in self._children(table, row, relation)]
+
+    def _find(self, table: str, pk) -> int | None:
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+        ids = self._arrays[table, "id"]
+        row = int(np.searchsorted(ids, pk))
+        if row < len(ids) and ids[row] == pk:
+            return row
+        return None
+
+    def _children(self, table: str, row: int, relation: str) -> range | list[int]:
+        offsets = self._arrays[table, f"{relation}.offsets"]
+        children = range(int(offsets[row]), int(offsets[row + 1]))
+        if self.manifest["tables"][table]["relations"][relation]["indexed"]:
+            return self._arrays[table, f"{relation}.rows"][children.start : children.stop].tolist()
+        return children
+
+    def _row(self, table: str, row: int) -> dict:
+        spec = self.manifest["tables"][table]
+        relations = spec["relations"]
+        data = {}
+        for name in spec["fields"]:
+            column = spec["columns"].get(name)
+            if column is not None:
+                data[name] = self._value(table, name, column, row)
+            elif name in relations:
+                data[name] = [self._row(name, child) for child in self._children(table, row, name)]
+            elif name.endswith("_count") and name[: -len("_count")] in relations:
+                data[name] = len(self._children(table, row, name[: -len("_count")]))
+        return data
+
+    def _value(self, table: str, name: str, column: dict, row: int):
+        kind = column["kind"]
+        if kind == "cycle":
+            return self.cycle_id
+        if column.get("nullable") and self._arrays[table, f"{name}.null"][row]:
+            return None
+        value = self._arrays[table, name][row]
+        if kind == "text":
+            return value.decode()
+        if kind == "decimal":
+            # Same rendering as DRF's DecimalField, which quantizes to the model's decimal places.
+            return f"{float(value):.{column['decimal_places']}f}"
+        return int(value)
+
+
+def get_snapshot(cycle: DataCycle | None) -> CycleSnapshot | None:
+    """
+    Return the memory-mapped snapshot of a cycle, ``None`` when snapshots are disabled or it hasn't been written.
+
+    Snapshots stay mapped for the life of the process; each call only checks that the manifest on disk is still
+    the one mapped, so a snapshot written again (or removed) is picked up by the next request.
+    """
+    root = settings.NAVIGATION_SNAPSHOT_DIR
+    if not root or cycle is None:
+        return None
+    directory = Path(root) / cycle.cycle_id
+    try:
+        stat = os.stat(directory / MANIFEST)
+    except FileNotFoundError:
+        _open_snapshots.pop(cycle.cycle_id, None)
+        return None
+    key = (stat.st_ino, stat.st_mtime_ns)
+    entry = _open_snapshots.get(cycle.cycle_id)
+    if entry is None or entry[0] != key:
+        try:
+            entry = (key, CycleSnapshot(directory))
+        except (OSError, ValueError) as e:
+            # Replaced or removed while it was being opened; the database serves this request.
+            logger.warning(f"Could not open the snapshot of cycle {cycle.cycle_id}: {e}")
+            return None
+        _open_snapshots[cycle.cycle_id] = entry
+    return entry[1]
+
+
+def remove_snapshot(cycle_id: str) -> None:
+    """Unmap the snapshot of a cycle in this process and delete its directory, e.g. once the cycle is pruned."""
+    _open_snapshots.pop(cycle_id, None)
+    if settings.NAVIGATION_SNAPSHOT_DIR:
+        shutil.rmtree(Path(settings.NAVIGATION_SNAPSHOT_DIR) / cycle_id, ignore_errors=True)
@@ -0,0 +1,164 @@
+import math
+from collections.abc import Callable, Iterable
+from operator import attrgetter
+
+from django.db.models import Q
+
+EARTH_RADIUS_NM = 3440.065
+
+# Coordinates are bucketed into 1 x 1 degree cells numbered row by row from the south-west corner:
+# cell = latitude row * 360 + longitude column.
+GRID_COLUMNS = 360
+GRID_ROWS = 180
+
+
+def grid_cell(latitude, longitude) -> int | None:
+    """
+    Return the grid cell of a coordinate, or ``None`` when it is incomplete.
+
+    Args:
+        latitude: Latitude in degrees, -90 to 90.
+        longitude: Longitude in degrees; wrapped into -180 to 180.
+    """
+    if latitude is None or longitude is None:
+        return None
+    return _row(float(latitude)) * GRID_COLUMNS + _column(float(longitude))
+
+
+def _row(latitude: float) -> int:
+    return min(max(math.floor(latitude + 90), 0), GRID_ROWS - 1)
+
+
+def _column(longitude: float) -> int:
+    return math.floor(longitude + 180) % GRID_COLUMNS
+
+
+def normalize_longitude(longitude: float) -> float:
+    """Wrap a longitude into [-180, 180)."""
+    return (longitude + 180) % 360 - 180
+
+
+def bbox_q(min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> Q:
+    """
+    Build a filter for the records inside a bounding box.
+
+    The box spans from ``min_lon`` eastwards to ``max_lon``, so a box with ``min_lon > max_lon`` crosses the
+    antimeridian. The grid cell ranges let the database narrow the search with the ``(cycle, grid_cell)``
+    index; the latitude and longitude conditions then trim the cells at the edges of the box.
+
+    Args:
+        min_lat (float): Southern edge in degrees.
+        min_lon (float): Western edge in degrees.
+        max_lat (float): Northern edge in degrees.
+        max_lon (float): Eastern edge in degrees.
+
+    Returns:
+        Q: Filter on ``grid_cell``, ``latitude`` and ``longitude``.
+    """
+    lat_q = Q(latitude__gte=min_lat, latitude__lte=max_lat)
+    if max_lon - min_lon >= 360:
+        return _cells_q(_row(min_lat), _row(max_lat), [(0, GRID_COLUMNS - 1)]) & lat_q
+    min_lon = normalize_longitude(min_lon)
+    # An eastern edge of 180 is kept rather than wrapped to -180, which would drop the records on the antimeridian.
+    max_lon = 180.0 if max_lon == 180 else normalize_longitude(max_lon)
+    if min_lon > max_lon:
+        columns = [(_column(min_lon), GRID_COLUMNS - 1), (0, _column(max_lon))]
+        lon_q = Q(longitude__gte=min_lon) | Q(longitude__lte=max_lon)
+    elif max_lon == 180:
+        # The antimeridian is stored as 180 or -180, both in the first column.
+        columns = [(_column(min_lon), GRID_COLUMNS - 1), (0, 0)]
+        lon_q = Q(longitude__gte=min_lon) | Q(longitude=-180)
+    else:
+        columns = [(_column(min_lon), _column(max_lon))]
+        lon_q = Q(longitude__gte=min_lon, longitude__lte=max_lon)
+    return _cells_q(_row(min_lat), _row(max_lat), columns) & lat_q & lon_q
+
+
+def _cells_q(first_row: int, last_row: int, columns: Iterable[tuple[int, int]]) -> Q:
+    """Filter the cells of rows ``first_row`` to ``last_row`` within the given column ranges."""
+    columns = list(columns)
+    if columns == [(0, GRID_COLUMNS - 1)]:
+        # Whole rows are contiguous cell numbers, so they collapse into a single range.
+        return Q(grid_cell__range=(first_row * GRID_COLUMNS, last_row * GRID_COLUMNS + GRID_COLUMNS - 1))
+    q = Q()
+    for row in range(first_row, last_row + 1):
+        for first_column, last_column in columns:
+            q |= Q(grid_cell__range=(row * GRID_COLUMNS + first_column, row * GRID_COLUMNS + last_column))
+    return q
+
+
+def radius_q(latitude: float, longitude: float, radius_nm: float) -> Q:
+    """
+    Build a filter for the cells that may hold records within ``radius_nm`` of a point.
+
+    The result is a superset of the circle; use ``great_circle_distance`` to keep the records actually inside it.
+    Near the poles, or when the radius reaches that far, the search covers every longitude.
+    """
+    angular_radius = radius_nm / EARTH_RADIUS_NM
+    delta_lat = math.degrees(angular_radius)
+    min_lat, max_lat = max(latitude - delta_lat, -90.0), min(latitude + delta_lat, 90.0)
+    sin_ratio = math.sin(angular_radius) / max(math.cos(math.radians(latitude)), 1e-12)
+    if min_lat <= -90 or max_lat >= 90 or sin_ratio >= 1:
+        return bbox_q(min_lat, -180.0, max_lat, 180.0)
+    # Widest longitude offset of a circle on the sphere, reached north of the centre's parallel.
+    delta_lon = math.degrees(math.asin(sin_ratio))
+    return bbox_q(min_lat, longitude - delta_lon, max_lat, longitude + delta_lon)
+
+
+def great_circle_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the haversine distance between two points in nautical miles."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_NM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def nearest(queryset, latitude: float, longitude: float, radius_nm: float, limit: int) -> list[tuple[object, float]]:
+    """
+    Return the records of a queryset within ``radius_nm`` of a point, closest first.
+
+    Args:
+        queryset: Queryset of a ``GridIndexed`` model, usually already filtered by cycle.
+        latitude (float): Latitude of the point in degrees.
+        longitude (float): Longitude of the point in degrees.
+        radius_nm (float): Search radius in nautical miles.
+        limit (int): Maximum number of records returned.
+
+    Returns:
+        list[tuple[object, float]]: ``(record, distance in nautical miles)`` pairs.
+    """
+    return closest(queryset.filter(radius_q(latitude, longitude, radius_nm)), latitude, longitude, radius_nm, limit)
+
+
+def closest(
+    candidates: Iterable,
+    latitude: float,
+    longitude: float,
+    radius_nm: float,
+    limit: int,
+    coordinates: Callable = attrgetter("latitude", "longitude"),
+) -> list[tuple[object, float]]:
+    """
+    Return the candidates within ``radius_nm`` of a point, closest first.
+
+    Args:
+        candidates (Iterable): Records or rows, e.g. those matching ``radius_q``.
+        latitude (float): Latitude of the point in degrees.
+        longitude (float): Longitude of the point in degrees.
+        radius_nm (float): Search radius in nautical miles.
+        limit (int): Maximum number of candidates returned.
+        coordinates (Callable): Returns the ``(latitude, longitude)`` of a candidate; reads the attributes of
+            a record by default.
+
+    Returns:
+        list[tuple[object, float]]: ``(candidate, distance in nautical miles)`` pairs.
+    """
+    found = []
+    for candidate in candidates:
+        candidate_latitude, candidate_longitude = coordinates(candidate)
+        distance = great_circle_distance(latitude, longitude, float(candidate_latitude), float(candidate_longitude))
+        if distance <= radius_nm:
+            found.append((candidate, distance))
+    found.sort(key=lambda pair: pair[1])
+    return found[:limit]
@@ -1,7 +1,25 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from ..cycles import invalidate_active_cycle
+from ..routing import _local_graphs
+from ..snapshots import _open_snapshots
+
 
 @pytest.fixture
 def api_client():
     return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    invalidate_active_cycle()
+    _local_graphs.clear()
+    _open_snapshots.clear()
+    cache.clear()
+    yield
+    invalidate_active_cycle()
+    _local_graphs.clear()
+    _open_snapshots.clear()
+    cache.clear()
@@ -0,0 +1,154 @@
+import xml.etree.ElementTree as ET
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from model_bakery import baker
+from rest_framework import status
+
+from data_processor.parsers import BulkARINCParser
+from data_processor.tests.test_data import cycle_xml
+
+from ..cycles import get_active_cycle, invalidate_active_cycle
+from ..models import Airport
+from ..snapshots import write_snapshot
+
+
+def make_cycle(cycle_id, effective_date):
+    cycle = baker.make(
+        "DataCycle", cycle_id=cycle_id, effective_date=effective_date, expiry_date=date(2026, 12, 31), status="READY"
+    )
+    for index in range(5):
+        baker.make(
+            "Airport",
+            cycle=cycle,
+            airport_id=f"LF{index:02d}",
+            name="Roissy en-France",
+            latitude=Decimal("49.0") + Decimal(index) / 10,
+            longitude=Decimal("2.5"),
+        )
+    baker.make("Navaid", cycle=cycle, latitude=Decimal("49.1"), longitude=Decimal("2.6"), _quantity=3)
+    return cycle
+
+
+@pytest.fixture
+def cycle():
+    cycle = make_cycle("2601", date(2026, 1, 22))
+    get_active_cycle()
+    return cycle
+
+
+@pytest.fixture
+def no_response_cache(settings):
+    settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    def test_served_as_coroutine(self, cycle):
+        async def get():
+            return await AsyncClient().get("/navigation/async/airports/")
+
+        response = async_to_sync(get)()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == 5
+
+    def test_list_matches_viewset(self, api_client, cycle, no_response_cache):
+        response = api_client.get("/navigation/async/airports/?page_size=2")
+        viewset = api_client.get("/navigation/airports/?page_size=2")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        assert response.content == viewset.content.replace(b"/navigation/airports/", b"/navigation/async/airports/")
+        # Line separators are escaped as the JSON renderer does.
+        assert b"\\u2028" in response.content
+
+    def test_list_pages_with_the_viewset_cursor(self, api_client, cycle):
+        first = api_client.get("/navigation/async/airports/?page_size=2").json()
+        second = api_client.get(first["next"]).json()
+        third = api_client.get(second["next"]).json()
+
+        assert first["next"].startswith("http://testserver/navigation/async/airports/?cursor=")
+        airports = [airport["airport_id"] for page in (first, second, third) for airport in page["results"]]
+        assert airports == ["LF00", "LF01", "LF02", "LF03", "LF04"]
+        assert third["next"] is None
+
+    def test_list_keeps_the_cycle_of_the_first_page(self, api_client, cycle):
+        first = api_client.get("/navigation/async/airports/?page_size=2").json()
+        make_cycle("2602", date(2026, 2, 19))
+        invalidate_active_cycle()
+
+        second = api_client.get(first["next"]).json()
+
+        assert {airport["cycle"] for airport in second["results"]} == {"2601"}
+
+    def test_list_with_cursor_of_removed_cycle(self, api_client, cycle):
+        first = api_client.get("/navigation/async/airports/?page_size=2").json()
+        make_cycle("2602", date(2026, 2, 19))
+        cycle.delete()
+        invalidate_active_cycle()
+
+        response = api_client.get(first["next"])
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "The data cycle of this cursor is no longer available."}
+
+    def test_repeated_request_is_served_from_cache(self, api_client, cycle, django_assert_num_queries):
+        first = api_client.get("/navigation/async/airports/?page_size=2")
+
+        with django_assert_num_queries(0):
+            second = api_client.get("/navigation/async/airports/?page_size=2")
+            not_modified = api_client.get("/navigation/async/airports/?page_size=2", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert second.content == first.content
+        assert second["ETag"] == first["ETag"]
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_detail_matches_viewset(self, api_client, cycle):
+        navaid = cycle.navaid_set.first()
+
+        response = api_client.get(f"/navigation/async/navaids/{navaid.pk}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == api_client.get(f"/navigation/navaids/{navaid.pk}/").content
+
+    def test_detail_of_another_cycle_is_not_found(self, api_client, cycle):
+        other = make_cycle("2512", date(2025, 12, 25))
+
+        response = api_client.get(f"/navigation/async/airports/{other.airport_set.first().pk}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "No Airport matches the given query."}
+
+    def test_detail_served_from_snapshot(self, api_client, settings, tmp_path, django_assert_num_queries):
+        settings.NAVIGATION_SNAPSHOT_DIR = str(tmp_path / "snapshots")
+        cycle = baker.make("DataCycle", status="READY")
+        BulkARINCParser(data_cycle=cycle).parse_file(ET.fromstring(cycle_xml))
+        get_active_cycle()
+        airport = Airport.objects.get(cycle=cycle, airport_id="KJFK")
+        expected = api_client.get(f"/navigation/airports/{airport.pk}/").content
+        write_snapshot(cycle)
+
+        with django_assert_num_queries(0):
+            response = api_client.get(f"/navigation/async/airports/{airport.pk}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == expected
+
+    def test_nearest_matches_viewset(self, api_client, cycle):
+        query = "lat=49.05&lon=2.5&radius=20&limit=3"
+
+        response = api_client.get(f"/navigation/async/airports/nearest/?{query}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [airport["airport_id"] for airport in response.json()] == ["LF00", "LF01", "LF02"]
+        assert response.content == api_client.get(f"/navigation/airports/nearest/?{query}").content
+
+    def test_nearest_requires_a_point(self, api_client, cycle):
+        response = api_client.get("/navigation/async/airports/nearest/?lat=49")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.content == api_client.get("/navigation/airports/nearest/?lat=49").content
@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+
+from ..caching import invalidate_cached_responses
+from ..cycles import get_active_cycle, invalidate_active_cycle
+from ..models import Airport
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make("DataCycle", effective_date=date(2025, 1, 23), status="READY")
+    baker.make("Airport", cycle=cycle, airport_id="KJFK")
+    baker.make("Airport", cycle=cycle, airport_id="KBOS")
+    get_active_cycle()
+    return cycle
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    def test_response_has_validators(self, api_client, cycle):
+        response = api_client.get("/navigation/airports/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('"')
+        assert response["Cache-Control"] == "public, max-age=300"
+        assert "Accept" in response["Vary"]
+
+    def test_repeated_request_is_served_from_cache(self, api_client, cycle, django_assert_num_queries):
+        first = api_client.get("/navigation/airports/?page_size=1")
+
+        with django_assert_num_queries(0):
+            second = api_client.get("/navigation/airports/?page_size=1")
+
+        assert second.content == first.content
+        assert second["ETag"] == first["ETag"]
+
+    def test_if_none_match_answers_not_modified(self, api_client, cycle, django_assert_num_queries):
+        etag = api_client.get("/navigation/airports/")["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get("/navigation/airports/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_if_none_match_on_first_request(self, api_client, cycle):
+        etag = api_client.get("/navigation/airports/")["ETag"]
+        invalidate_cached_responses()
+
+        response = api_client.get("/navigation/airports/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_key_ignores_query_parameter_order(self, api_client, cycle, django_assert_num_queries):
+        api_client.get("/navigation/airports/?page_size=1&ordering=x")
+
+        with django_assert_num_queries(0):
+            api_client.get("/navigation/airports/?ordering=x&page_size=1")
+
+    def test_query_parameters_are_part_of_the_key(self, api_client, cycle):
+        first = api_client.get("/navigation/airports/?page_size=1")
+        second = api_client.get("/navigation/airports/?page_size=2")
+
+        assert len(first.json()["results"]) == 1
+        assert len(second.json()["results"]) == 2
+
+    def test_invalidation(self, api_client, cycle):
+        etag = api_client.get("/navigation/airports/")["ETag"]
+        Airport.objects.filter(airport_id="KBOS").delete()
+
+        assert api_client.get("/navigation/airports/")["ETag"] == etag
+        invalidate_cached_responses()
+        response = api_client.get("/navigation/airports/")
+
+        assert response["ETag"] != etag
+        assert [row["airport_id"] for row in response.json()["results"]] == ["KJFK"]
+
+    def test_new_active_cycle_misses_cache(self, api_client, cycle):
+        api_client.get("/navigation/airports/")
+        newer = baker.make("DataCycle", effective_date=date(2025, 2, 20), status="READY")
+        baker.make("Airport", cycle=newer, airport_id="EGLL")
+        invalidate_active_cycle()
+        response = api_client.get("/navigation/airports/")
+
+        assert [row["airport_id"] for row in response.json()["results"]] == ["EGLL"]
+
+    def test_errors_are_not_cached(self, api_client, cycle):
+        assert api_client.get("/navigation/airports/999999/").status_code == status.HTTP_404_NOT_FOUND
+        airport = baker.make("Airport", cycle=cycle, id=999999)
+
+        response = api_client.get("/navigation/airports/999999/")
+
+        assert response.json()["airport_id"] == airport.airport_id
+
+    def test_disabled(self, api_client, cycle, settings, django_assert_num_queries):
+        settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+        api_client.get("/navigation/airports/")
+
+        with django_assert_num_queries(1):
+            response = api_client.get("/navigation/airports/")
+
+        assert "ETag" not in response
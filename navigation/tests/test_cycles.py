@@ -0,0 +1,116 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from model_bakery import baker
+
+from ..cycles import get_active_cycle, invalidate_active_cycle, resolve_active_cycle
+from ..models import DataCycle
+
+
+@pytest.fixture
+def cycles():
+    return [
+        baker.make("DataCycle", cycle_id="2501", effective_date=date(2025, 1, 23), status="READY"),
+        baker.make("DataCycle", cycle_id="2502", effective_date=date(2025, 2, 20), status="READY"),
+    ]
+
+
+@pytest.mark.django_db
+class TestResolveActiveCycle:
+    def test_picks_latest_effective_cycle(self, cycles):
+        cycle, switch_at = resolve_active_cycle(date(2025, 2, 1))
+
+        assert cycle.cycle_id == "2501"
+        assert switch_at == datetime(2025, 2, 20, tzinfo=timezone.utc)
+
+    def test_selects_on_effective_date_not_upload_order(self):
+        baker.make("DataCycle", cycle_id="2502", effective_date=date(2025, 2, 20), status="READY")
+        baker.make("DataCycle", cycle_id="2501", effective_date=date(2025, 1, 23), status="READY")
+
+        cycle, _ = resolve_active_cycle(date(2025, 3, 1))
+
+        assert cycle.cycle_id == "2502"
+
+    def test_serves_first_upcoming_cycle_when_none_is_effective(self, cycles):
+        cycle, switch_at = resolve_active_cycle(date(2025, 1, 1))
+
+        assert cycle.cycle_id == "2501"
+        assert switch_at == datetime(2025, 1, 23, tzinfo=timezone.utc)
+
+    def test_no_cycles(self):
+        assert resolve_active_cycle(date(2025, 1, 1)) == (None, None)
+
+    @pytest.mark.parametrize("status", ["LOADING", "FAILED"])
+    def test_ignores_cycles_not_ready(self, cycles, status):
+        baker.make("DataCycle", cycle_id="2503", effective_date=date(2025, 3, 20), status=status)
+        baker.make("DataCycle", cycle_id="2504", effective_date=date(2025, 4, 17), status=status)
+
+        assert resolve_active_cycle(date(2025, 2, 1))[0].cycle_id == "2501"
+        assert resolve_active_cycle(date(2025, 3, 1)) == (cycles[1], None)
+        assert resolve_active_cycle(date(2025, 4, 1)) == (cycles[1], None)
+
+    def test_new_cycles_are_not_ready(self, cycles):
+        # A cycle created outside the ingestion pipeline, e.g. in the admin, is not served until marked READY.
+        DataCycle.objects.create(
+            cycle_id="2503", effective_date=date(2025, 3, 20), expiry_date=date(2025, 4, 17), source="ADMIN"
+        )
+
+        assert resolve_active_cycle(date(2025, 4, 1)) == (cycles[1], None)
+
+    def test_switches_to_prestaged_cycle_once_ready(self, cycles):
+        upcoming = baker.make("DataCycle", cycle_id="2503", effective_date=date(2025, 3, 20), status="LOADING")
+        assert resolve_active_cycle(date(2025, 3, 1)) == (cycles[1], None)
+
+        upcoming.status = "READY"
+        upcoming.save()
+
+        assert resolve_active_cycle(date(2025, 3, 1)) == (cycles[1], datetime(2025, 3, 20, tzinfo=timezone.utc))
+        assert resolve_active_cycle(date(2025, 3, 20))[0] == upcoming
+
+
+@pytest.mark.django_db
+class TestGetActiveCycle:
+    def test_cached_across_calls(self, cycles, django_assert_num_queries):
+        get_active_cycle()
+
+        with django_assert_num_queries(0):
+            assert get_active_cycle().cycle_id == "2502"
+
+    def test_shared_cache_serves_other_processes(self, cycles, django_assert_num_queries, mocker):
+        get_active_cycle()
+        mocker.patch.dict("navigation.cycles._local", clear=True)
+
+        with django_assert_num_queries(0):
+            assert get_active_cycle().cycle_id == "2502"
+
+    def test_switches_when_next_cycle_becomes_effective(self, cycles, mocker):
+        now = mocker.patch("navigation.cycles.timezone.now")
+        now.return_value = datetime(2025, 2, 19, 23, tzinfo=timezone.utc)
+        assert get_active_cycle().cycle_id == "2501"
+
+        now.return_value = datetime(2025, 2, 20, 0, 1, tzinfo=timezone.utc)
+
+        assert get_active_cycle().cycle_id == "2502"
+
+    def test_invalidate_picks_up_new_cycle(self, cycles):
+        assert get_active_cycle().cycle_id == "2502"
+        baker.make("DataCycle", cycle_id="2503", effective_date=date(2025, 3, 20), status="READY")
+
+        assert get_active_cycle().cycle_id == "2502"
+        invalidate_active_cycle()
+        assert get_active_cycle().cycle_id == "2503"
+
+    def test_loading_cycle_is_not_exported(self, api_client, cycles):
+        baker.make("DataCycle", cycle_id="2503", effective_date=date(2025, 3, 20), status="LOADING")
+
+        assert api_client.get("/navigation/export/", {"cycle": "2503"}).status_code == 404
+        assert api_client.get("/navigation/export/", {"cycle": "2502"}).status_code == 200
+
+    def test_viewset_resolves_cycle_once_per_request(self, api_client, cycles, mocker):
+        airport = baker.make("Airport", cycle=cycles[1])
+        resolve = mocker.patch("navigation.views.get_active_cycle", return_value=cycles[1])
+
+        response = api_client.get(f"/navigation/airports/{airport.id}/procedures/")
+
+        assert response.status_code == 404
+        resolve.assert_called_once_with()
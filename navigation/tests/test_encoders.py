@@ -0,0 +1,140 @@
+from decimal import Decimal
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from ..cycles import get_active_cycle
+from ..encoders import JSON_MEDIA_TYPE, RowEncoder, encode_procedure_transitions
+from ..models import Airport, Navaid, ProcedureTransition, Waypoint
+from ..serializers import AirportSerializer, NavaidSerializer, ProcedureTransitionSerializer, WaypointSerializer
+
+# Asks for compact JSON without matching the fast path's media type, so DRF renders the serializer's data.
+SERIALIZER_ACCEPT = "application/json; indent=0"
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make("DataCycle", status="READY")
+    baker.make(
+        "Airport",
+        cycle=cycle,
+        airport_id="LFPG",
+        name='Charles de Gaulle "Roissy"   été',
+        city="Roissy\u2028en-France",
+        state=None,
+        latitude=Decimal("49.0097"),
+        longitude=Decimal("-2.5479"),
+        transition_altitude=5000,
+    )
+    baker.make("Airport", cycle=cycle, airport_id="KJFK", latitude=Decimal("-0.00000001"), longitude=Decimal("0"))
+    baker.make("Navaid", cycle=cycle, frequency=Decimal("115.9"), dme_latitude=None, _quantity=3)
+    baker.make("Waypoint", cycle=cycle, airspace_classification=None, _quantity=3)
+    get_active_cycle()
+    return cycle
+
+
+@pytest.fixture
+def procedure(cycle):
+    procedure = baker.make("Procedure", cycle=cycle, airport=Airport.objects.filter(cycle=cycle).first())
+    for transition_id in ("RW04", "ALL"):
+        transition = baker.make("ProcedureTransition", procedure=procedure, transition_id=transition_id)
+        for sequence_number in (30, 10, 20):
+            baker.make(
+                "ProcedureLeg",
+                transition=transition,
+                sequence_number=sequence_number,
+                distance=Decimal("12.5") if sequence_number == 10 else None,
+            )
+    return procedure
+
+
+@pytest.mark.django_db
+class TestRowEncoder:
+    @pytest.mark.parametrize(
+        "model, serializer_class",
+        [(Airport, AirportSerializer), (Navaid, NavaidSerializer), (Waypoint, WaypointSerializer)],
+    )
+    def test_matches_serializer(self, cycle, model, serializer_class):
+        queryset = model.objects.order_by("id")
+        encoder = RowEncoder(serializer_class)
+
+        encoded = encoder.encode(queryset.values_list(*encoder.columns))
+
+        assert encoded == JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+    def test_empty(self):
+        assert RowEncoder(AirportSerializer).encode([]) == b"[]"
+
+    def test_procedure_transitions_match_serializer(self, procedure):
+        transitions = ProcedureTransition.objects.filter(procedure=procedure).order_by("id")
+        data = ProcedureTransitionSerializer(transitions, many=True).data
+        for transition in data:
+            transition["legs"].sort(key=lambda leg: leg["sequence_number"])
+
+        assert encode_procedure_transitions(procedure.cycle, procedure.pk) == JSONRenderer().render(data)
+
+    def test_procedure_without_transitions(self, db):
+        assert encode_procedure_transitions(None, 0) is None
+
+    def test_procedure_of_another_cycle(self, procedure):
+        other = baker.make("DataCycle", status="READY")
+
+        assert encode_procedure_transitions(other, procedure.pk) is None
+
+
+@pytest.mark.django_db
+class TestEncodedEndpoints:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/navigation/airports/",
+            "/navigation/navaids/?page_size=2",
+            "/navigation/waypoints/",
+            "/navigation/airports/bbox/?min_lat=-90&min_lon=-180&max_lat=90&max_lon=180",
+        ],
+    )
+    def test_list_matches_serializer(self, api_client, cycle, settings, url):
+        settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+
+        encoded = api_client.get(url)
+        serialized = api_client.get(url, HTTP_ACCEPT=SERIALIZER_ACCEPT)
+
+        assert encoded.status_code == status.HTTP_200_OK
+        assert encoded["Content-Type"] == "application/json"
+        assert encoded.content == serialized.content
+
+    def test_next_page(self, api_client, cycle):
+        first = api_client.get("/navigation/navaids/?page_size=2").json()
+        second = api_client.get(first["next"]).json()
+
+        assert len(first["results"]) == 2
+        assert len(second["results"]) == 1
+        assert second["previous"] is not None
+
+    def test_procedure_legs_match_serializer(self, api_client, procedure, settings):
+        settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+        url = f"/navigation/procedures/{procedure.pk}/legs/"
+
+        encoded = api_client.get(url)
+        serialized = api_client.get(url, HTTP_ACCEPT=SERIALIZER_ACCEPT)
+
+        assert encoded.content == serialized.content
+        assert [leg["sequence_number"] for leg in encoded.json()[0]["legs"]] == [10, 20, 30]
+
+    @pytest.mark.parametrize("accept", [JSON_MEDIA_TYPE, SERIALIZER_ACCEPT])
+    def test_procedure_legs_of_a_cycle_not_served(self, api_client, procedure, accept):
+        loading = baker.make("DataCycle", status="LOADING")
+        procedure.cycle = loading
+        procedure.save()
+
+        response = api_client.get(f"/navigation/procedures/{procedure.pk}/legs/", HTTP_ACCEPT=accept)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_browsable_api_uses_serializer(self, api_client, cycle):
+        response = api_client.get("/navigation/airports/", HTTP_ACCEPT="text/html")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "results" in response.data
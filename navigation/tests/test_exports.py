@@ -0,0 +1,166 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db.models import Prefetch
+from django.test import AsyncClient
+from model_bakery import baker
+from rest_framework import status
+
+from ..models import Airport, Airway, AirwaySegment, Procedure, ProcedureLeg, ProcedureTransition
+from ..serializers import AirportSerializer, AirwayExportSerializer, ProcedureExportSerializer
+
+
+def make_cycle(cycle_id, size=2):
+    cycle = baker.make(
+        "DataCycle", cycle_id=cycle_id, effective_date=date(2026, 1, 22), expiry_date=date(2026, 2, 19), status="READY"
+    )
+    airports = baker.make("Airport", cycle=cycle, latitude=Decimal("49.0097"), state=None, _quantity=size)
+    baker.make("Navaid", cycle=cycle, _quantity=size)
+    baker.make("Waypoint", cycle=cycle, _quantity=size)
+    for airway_id in range(size):
+        airway = baker.make("Airway", cycle=cycle, airway_id=f"UN{airway_id}")
+        for sequence_number in (30, 10, 20):
+            baker.make("AirwaySegment", airway=airway, sequence_number=sequence_number)
+    for airport in airports:
+        procedure = baker.make("Procedure", cycle=cycle, airport=airport)
+        for transition_id in ("RW04", "ALL"):
+            transition = baker.make("ProcedureTransition", procedure=procedure, transition_id=transition_id)
+            for sequence_number in (20, 10):
+                baker.make("ProcedureLeg", transition=transition, sequence_number=sequence_number)
+    # A procedure without transitions.
+    baker.make("Procedure", cycle=cycle, airport=airports[0])
+    return cycle
+
+
+def read(response):
+    return b"".join(response.streaming_content)
+
+
+@pytest.fixture
+def cycle():
+    return make_cycle("2601")
+
+
+@pytest.mark.django_db
+class TestExport:
+    def test_ndjson_matches_serializers(self, api_client, cycle):
+        response = api_client.get("/navigation/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert response["Content-Disposition"] == 'attachment; filename="2601-all.ndjson"'
+        lines = [json.loads(line) for line in read(response).decode().splitlines()]
+        assert lines[0] == {
+            "record": "cycle",
+            "cycle_id": "2601",
+            "effective_date": "2026-01-22",
+            "expiry_date": "2026-02-19",
+            "source": cycle.source,
+        }
+        records = {}
+        for line in lines[1:]:
+            records.setdefault(line.pop("record"), []).append(line)
+        assert list(records) == ["airport", "navaid", "waypoint", "airway", "procedure"]
+        airports = AirportSerializer(Airport.objects.order_by("id"), many=True).data
+        assert records["airport"] == json.loads(json.dumps(airports))
+        airways = Airway.objects.order_by("id").prefetch_related(
+            Prefetch("segments", AirwaySegment.objects.order_by("sequence_number"))
+        )
+        assert records["airway"] == json.loads(json.dumps(AirwayExportSerializer(airways, many=True).data))
+        assert [segment["sequence_number"] for segment in records["airway"][0]["segments"]] == [10, 20, 30]
+        procedures = Procedure.objects.order_by("id").prefetch_related(
+            Prefetch("transitions", ProcedureTransition.objects.order_by("id")),
+            Prefetch("transitions__legs", ProcedureLeg.objects.order_by("sequence_number")),
+        )
+        procedures = ProcedureExportSerializer(procedures, many=True).data
+        assert records["procedure"] == json.loads(json.dumps(procedures))
+        assert records["procedure"][-1]["transitions"] == []
+        legs = records["procedure"][0]["transitions"][0]["legs"]
+        assert [leg["sequence_number"] for leg in legs] == [10, 20]
+
+    def test_selected_records_of_a_given_cycle(self, api_client, cycle):
+        make_cycle("2602")
+
+        response = api_client.get("/navigation/export/?cycle=2601&records=waypoints,airports,waypoints")
+
+        lines = [json.loads(line) for line in read(response).decode().splitlines()]
+        assert [line["record"] for line in lines] == ["cycle", "waypoint", "waypoint", "airport", "airport"]
+        assert lines[0]["cycle_id"] == "2601"
+        assert response["Content-Disposition"] == 'attachment; filename="2601-waypoints-airports.ndjson"'
+
+    def test_csv_flattens_nested_records(self, api_client, cycle):
+        response = api_client.get("/navigation/export/?output=csv&records=procedures")
+
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        rows = list(csv.DictReader(io.StringIO(read(response).decode())))
+        # Two procedures with two transitions of two legs, and one procedure without transitions.
+        assert len(rows) == 9
+        first = Procedure.objects.order_by("id").first()
+        assert rows[0]["id"] == str(first.pk)
+        assert rows[0]["transitions.transition_id"] == "RW04"
+        assert [row["transitions.legs.sequence_number"] for row in rows[:4]] == ["10", "20", "10", "20"]
+        assert rows[-1]["transitions.transition_id"] == ""
+        assert rows[-1]["transitions.legs.sequence_number"] == ""
+
+    def test_csv_renders_decimals_and_nulls_like_the_api(self, api_client, cycle):
+        response = api_client.get("/navigation/export/?output=csv&records=airports")
+
+        rows = list(csv.DictReader(io.StringIO(read(response).decode())))
+        assert rows[0]["latitude"] == AirportSerializer(Airport.objects.order_by("id").first()).data["latitude"]
+        assert rows[0]["state"] == ""
+
+    def test_gzip(self, api_client, cycle):
+        plain = read(api_client.get("/navigation/export/"))
+
+        response = api_client.get("/navigation/export/?gzip=true")
+
+        assert response["Content-Type"] == "application/gzip"
+        assert response["Content-Disposition"] == 'attachment; filename="2601-all.ndjson.gz"'
+        assert gzip.decompress(read(response)) == plain
+
+    def test_streamed_asynchronously_under_asgi(self, api_client, cycle, settings):
+        settings.NAVIGATION_EXPORT_CHUNK_SIZE = 1
+        expected = list(api_client.get("/navigation/export/").streaming_content)
+
+        async def export():
+            response = await AsyncClient().get("/navigation/export/")
+            return response, [chunk async for chunk in response.streaming_content]
+
+        response, chunks = async_to_sync(export)()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.is_async
+        assert chunks == expected
+        assert len(chunks) > 1
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_query_count_does_not_grow_with_the_cycle(self, api_client, django_assert_num_queries, size):
+        make_cycle("2601", size=size)
+
+        response = api_client.get("/navigation/export/?cycle=2601")
+        # Airports, navaids, waypoints, airways + segments and procedures + transitions + legs.
+        with django_assert_num_queries(8):
+            read(response)
+
+    def test_csv_takes_a_single_record_type(self, api_client, cycle):
+        response = api_client.get("/navigation/export/?output=csv&records=airports,navaids")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "records" in response.json()
+
+    def test_unknown_record_type(self, api_client, cycle):
+        response = api_client.get("/navigation/export/?records=airports,runways")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "runways" in response.json()["records"][0]
+
+    def test_unknown_cycle(self, api_client, cycle):
+        response = api_client.get("/navigation/export/?cycle=1999")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
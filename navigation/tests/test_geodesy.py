@@ -0,0 +1,67 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from model_bakery import baker
+
+from ..geodesy import CoordinateTable, cross_track, haversine, initial_bearing, parse_variation, true_to_magnetic
+from ..spatial import great_circle_distance
+
+
+class TestVectorizedGeodesy:
+    def test_haversine_matches_scalar_distance(self):
+        rng = np.random.default_rng(42)
+        lat1, lat2 = rng.uniform(-90, 90, (2, 1000))
+        lon1, lon2 = rng.uniform(-180, 180, (2, 1000))
+
+        distances = haversine(lat1, lon1, lat2, lon2)
+
+        expected = [great_circle_distance(*point) for point in zip(lat1, lon1, lat2, lon2, strict=True)]
+        np.testing.assert_allclose(distances, expected, rtol=1e-9)
+
+    def test_initial_bearing(self):
+        bearings = initial_bearing([0, 0, 0, 10], [0, 0, 0, 179.5], [10, 0, -10, 10], [0, 10, 0, -179.5])
+
+        np.testing.assert_allclose(bearings[:3], [0, 90, 180])
+        assert 89 < bearings[3] < 91  # Eastbound across the antimeridian.
+
+    def test_cross_track(self):
+        # Point one degree north of an eastbound equatorial course lies 60 nm to its left.
+        distance = cross_track([0], [0], [0], [10], [1], [5])
+
+        np.testing.assert_allclose(distance, [-60.04], atol=0.01)
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("13W", -13.0), ("E002", 2.0), ("-4.5", -4.5), ("", np.nan), (None, np.nan), ("bad", np.nan)],
+    )
+    def test_parse_variation(self, value, expected):
+        np.testing.assert_equal(parse_variation(value), expected)
+
+    def test_true_to_magnetic(self):
+        np.testing.assert_allclose(true_to_magnetic([350, 5], [-13, 13]), [3, 352])
+
+
+@pytest.mark.django_db
+class TestCoordinateTable:
+    def test_for_cycle_keys_fixes_by_type(self):
+        cycle = baker.make("DataCycle", effective_date=date(2025, 1, 23))
+        baker.make(
+            "Navaid",
+            cycle=cycle,
+            navaid_id="JFK",
+            latitude=Decimal("40.6"),
+            longitude=Decimal("-73.7"),
+            magnetic_variation="13W",
+        )
+        baker.make("Airport", cycle=cycle, airport_id="JFK", latitude=Decimal("40.7"), longitude=Decimal("-73.8"))
+        baker.make("Waypoint", cycle=baker.make("DataCycle"), waypoint_id="OTHER")
+
+        table = CoordinateTable.for_cycle(cycle)
+
+        rows = table.locate([("NAVAID", "JFK"), ("AIRPORT", "JFK"), ("WAYPOINT", "OTHER")])
+        assert rows[2] == -1
+        assert table.latitudes.dtype == np.float64 and table.latitudes.flags.c_contiguous
+        np.testing.assert_allclose(table.latitudes[rows[:2]], [40.6, 40.7])
+        assert table.variations[rows[0]] == -13.0
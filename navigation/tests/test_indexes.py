@@ -0,0 +1,80 @@
+import pytest
+from django.db import IntegrityError, connection
+from model_bakery import baker
+
+from ..models import Airport, AirwaySegment, DataCycle, Procedure, ProcedureLeg, ProcedureTransition, Waypoint
+
+pytestmark = pytest.mark.skipif(connection.vendor != "sqlite", reason="Query plans are asserted for SQLite")
+
+
+@pytest.fixture
+def cycle():
+    return baker.make("DataCycle")
+
+
+@pytest.mark.django_db
+class TestNaturalKeyIndexes:
+    @pytest.mark.parametrize(
+        "build_queryset, search",
+        [
+            (lambda c: Airport.objects.filter(cycle=c, airport_id="KJFK"), "(cycle_id=? AND airport_id=?)"),
+            (lambda c: Waypoint.objects.filter(cycle=c, waypoint_id="MERIT"), "(cycle_id=? AND waypoint_id=?)"),
+            (
+                lambda c: Procedure.objects.filter(cycle=c, airport_id=1, procedure_id="I04L"),
+                "(cycle_id=? AND airport_id=? AND procedure_id=?)",
+            ),
+            (
+                lambda c: ProcedureTransition.objects.filter(procedure_id=1, transition_id="ALL"),
+                "(procedure_id=? AND transition_id=?)",
+            ),
+            (lambda c: ProcedureLeg.objects.filter(transition_id=1, sequence_number=1), "(transition_id=? AND"),
+            (lambda c: AirwaySegment.objects.filter(airway_id=1), "(airway_id=?)"),
+            (lambda c: Airport.objects.filter(cycle=c), "(cycle_id=?)"),
+        ],
+    )
+    def test_hot_lookups_use_an_index_search(self, cycle, build_queryset, search):
+        plan = build_queryset(cycle).explain()
+
+        assert "INDEX" in plan
+        assert search in plan
+        assert "SCAN" not in plan
+
+    @pytest.mark.parametrize(
+        "model, field",
+        [(AirwaySegment, f"{end}fix_{fix}") for end in ("", "next_") for fix in ("airport", "navaid", "waypoint")]
+        + [(ProcedureLeg, f"fix_{fix}") for fix in ("airport", "navaid", "waypoint")],
+    )
+    def test_fix_references_use_an_index_search(self, model, field):
+        # Deleting a fix looks up the segments and legs referencing it.
+        plan = model.objects.filter(**{f"{field}_id": 1}).explain()
+
+        assert f"({field}_id=?)" in plan
+        assert "SCAN" not in plan
+
+    def test_latest_cycle_lookup_reads_the_effective_date_index(self):
+        plan = DataCycle.objects.order_by("-effective_date")[:1].explain()
+
+        assert "USING INDEX datacycle_effective_date_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.django_db
+class TestNaturalKeyConstraints:
+    def test_duplicate_airport_in_cycle_is_rejected(self, cycle):
+        baker.make("Airport", cycle=cycle, airport_id="KJFK")
+
+        with pytest.raises(IntegrityError):
+            baker.make("Airport", cycle=cycle, airport_id="KJFK")
+
+    def test_same_airport_in_another_cycle_is_allowed(self, cycle):
+        baker.make("Airport", cycle=cycle, airport_id="KJFK")
+        baker.make("Airport", cycle=baker.make("DataCycle"), airport_id="KJFK")
+
+        assert Airport.objects.filter(airport_id="KJFK").count() == 2
+
+    def test_duplicate_leg_sequence_is_rejected(self):
+        transition = baker.make("ProcedureTransition")
+        baker.make("ProcedureLeg", transition=transition, sequence_number=1)
+
+        with pytest.raises(IntegrityError):
+            baker.make("ProcedureLeg", transition=transition, sequence_number=1)
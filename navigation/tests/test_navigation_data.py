@@ -6,7 +6,7 @@ from ..serializers import AirportSerializer
 
 @pytest.fixture
 def cycle():
-    return baker.make("DataCycle")
+    return baker.make("DataCycle", status="READY")
 
 @pytest.fixture
 def airport(cycle):
@@ -0,0 +1,90 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+
+from ..cycles import invalidate_active_cycle
+
+
+@pytest.fixture
+def cycle():
+    return baker.make("DataCycle", cycle_id="2501", effective_date=date(2025, 1, 23), status="READY")
+
+
+@pytest.fixture
+def waypoints(cycle):
+    return baker.make("Waypoint", cycle=cycle, waypoint_id=iter(f"WP{i:03}" for i in range(25)), _quantity=25)
+
+
+def get_all_pages(api_client, url):
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.json()["results"])
+        url = response.json()["next"]
+    return pages
+
+
+@pytest.mark.django_db
+class TestNaturalKeyCursorPagination:
+    def test_pages_follow_natural_identifier(self, api_client, waypoints):
+        pages = get_all_pages(api_client, "/navigation/waypoints/?page_size=10")
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert [row["waypoint_id"] for page in pages for row in page] == [f"WP{i:03}" for i in range(25)]
+
+    def test_page_size_is_capped(self, api_client, waypoints, mocker):
+        mocker.patch("navigation.pagination.NaturalKeyCursorPagination.max_page_size", 20)
+
+        response = api_client.get("/navigation/waypoints/?page_size=500")
+
+        assert len(response.json()["results"]) == 20
+
+    def test_deep_page_is_a_keyset_query(self, api_client, waypoints):
+        response = api_client.get("/navigation/waypoints/?page_size=10")
+        second = api_client.get(response.json()["next"])
+
+        with CaptureQueriesContext(connection) as queries:
+            api_client.get(second.json()["next"])
+
+        sql = queries.captured_queries[-1]["sql"]
+        assert "OFFSET" not in sql
+        assert "\"waypoint_id\" > 'WP019'" in sql
+
+    def test_previous_link(self, api_client, waypoints):
+        first = api_client.get("/navigation/waypoints/?page_size=10")
+        second = api_client.get(first.json()["next"])
+
+        previous = api_client.get(second.json()["previous"])
+
+        assert previous.json()["results"] == first.json()["results"]
+
+    def test_cursor_stays_on_its_cycle(self, api_client, waypoints):
+        response = api_client.get("/navigation/waypoints/?page_size=10")
+        next_cycle = baker.make("DataCycle", cycle_id="2502", effective_date=date(2025, 2, 20), status="READY")
+        baker.make("Waypoint", cycle=next_cycle, waypoint_id="WP999")
+        invalidate_active_cycle()
+
+        pages = get_all_pages(api_client, response.json()["next"])
+
+        assert {row["cycle"] for page in pages for row in page} == {"2501"}
+        assert [row["waypoint_id"] for row in api_client.get("/navigation/waypoints/").json()["results"]] == ["WP999"]
+
+    def test_cursor_of_deleted_cycle(self, api_client, cycle, waypoints):
+        response = api_client.get("/navigation/waypoints/?page_size=10")
+        baker.make("DataCycle", cycle_id="2502", effective_date=date(2025, 2, 20), status="READY")
+        cycle.delete()
+        invalidate_active_cycle()
+
+        response = api_client.get(response.json()["next"])
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_cursor(self, api_client, waypoints):
+        response = api_client.get("/navigation/waypoints/?cursor=not-base64!")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,94 @@
+import pytest
+from django.db.models import Count
+from model_bakery import baker
+from rest_framework import status
+
+from ..cycles import get_active_cycle
+from ..models import Airway
+from ..serializers import AirwaySerializer
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make("DataCycle", status="READY")
+    get_active_cycle()  # Resolve the cycle up front so only the endpoint's own queries are counted.
+    return cycle
+
+
+@pytest.mark.django_db
+class TestQueryCounts:
+    @pytest.mark.parametrize("size", [1, 10])
+    @pytest.mark.parametrize(
+        "model, url",
+        [
+            ("Airport", "/navigation/airports/"),
+            ("Navaid", "/navigation/navaids/"),
+            ("Waypoint", "/navigation/waypoints/"),
+            ("Procedure", "/navigation/procedures/"),
+        ],
+    )
+    def test_list(self, api_client, cycle, django_assert_num_queries, model, url, size):
+        if model == "Procedure":
+            baker.make(model, cycle=cycle, airport__cycle=cycle, _quantity=size)
+        else:
+            baker.make(model, cycle=cycle, _quantity=size)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == size
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_airway_list_counts_segments_in_one_query(self, api_client, cycle, django_assert_num_queries, size):
+        for airway in baker.make("Airway", cycle=cycle, _quantity=size):
+            baker.make("AirwaySegment", airway=airway, sequence_number=iter(range(3)), _quantity=3)
+
+        with django_assert_num_queries(1):
+            response = api_client.get("/navigation/airways/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [airway["segments_count"] for airway in response.json()["results"]] == [3] * size
+
+    def test_airway_serializer_counts_segments_without_annotation(self, cycle, django_assert_num_queries):
+        airway = baker.make("Airway", cycle=cycle)
+        baker.make("AirwaySegment", airway=airway, sequence_number=iter(range(3)), _quantity=3)
+        annotated = Airway.objects.annotate(segments_count=Count("segments")).get()
+
+        assert AirwaySerializer(airway).data["segments_count"] == 3
+        with django_assert_num_queries(0):
+            assert AirwaySerializer(annotated).data["segments_count"] == 3
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_airway_segments(self, api_client, cycle, django_assert_num_queries, size):
+        airway = baker.make("Airway", cycle=cycle)
+        baker.make("AirwaySegment", airway=airway, sequence_number=iter(range(size)), _quantity=size)
+
+        with django_assert_num_queries(2):
+            response = api_client.get(f"/navigation/airways/{airway.id}/segments/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == size
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_airport_procedures(self, api_client, cycle, django_assert_num_queries, size):
+        airport = baker.make("Airport", cycle=cycle)
+        baker.make("Procedure", cycle=cycle, airport=airport, _quantity=size)
+
+        with django_assert_num_queries(2):
+            response = api_client.get(f"/navigation/airports/{airport.id}/procedures/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == size
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_procedure_legs_are_prefetched(self, api_client, cycle, django_assert_num_queries, size):
+        procedure = baker.make("Procedure", cycle=cycle, airport__cycle=cycle)
+        for transition in baker.make("ProcedureTransition", procedure=procedure, _quantity=size):
+            baker.make("ProcedureLeg", transition=transition, sequence_number=iter(range(size)), _quantity=size)
+
+        with django_assert_num_queries(2):
+            response = api_client.get(f"/navigation/procedures/{procedure.id}/legs/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [len(transition["legs"]) for transition in response.json()] == [size] * size
@@ -0,0 +1,108 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+
+from ..cycles import get_active_cycle
+from ..resolver import resolve_fixes
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make(
+        "DataCycle", cycle_id="2601", effective_date=date(2026, 1, 22), expiry_date=date(2026, 2, 19), status="READY"
+    )
+    baker.make("Airport", cycle=cycle, airport_id="LFPG", latitude=Decimal("49.0097"), longitude=Decimal("2.5479"))
+    # "PON" is both a navaid near Paris and a waypoint near New York.
+    baker.make("Navaid", cycle=cycle, navaid_id="PON", latitude=Decimal("49.0967"), longitude=Decimal("2.0372"))
+    baker.make("Waypoint", cycle=cycle, waypoint_id="PON", latitude=Decimal("40.7"), longitude=Decimal("-73.9"))
+    for index in range(10):
+        baker.make("Waypoint", cycle=cycle, waypoint_id=f"WPT{index}", latitude=Decimal("48"), longitude=Decimal("2"))
+    # Same identifiers in another cycle.
+    other = baker.make(
+        "DataCycle", cycle_id="2512", effective_date=date(2025, 12, 25), expiry_date=date(2026, 1, 22), status="READY"
+    )
+    baker.make("Airport", cycle=other, airport_id="LFPG", latitude=Decimal("49"), longitude=Decimal("2.5"))
+    get_active_cycle()
+    return cycle
+
+
+@pytest.mark.django_db
+class TestResolve:
+    def test_resolves_identifiers_in_order(self, api_client, cycle):
+        response = api_client.post(
+            "/navigation/resolve/", {"fixes": ["WPT3", "lfpg", {"identifier": "XXXXX"}]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["cycle"] == "2601"
+        results = response.data["results"]
+        assert [(result["identifier"], result["status"], result["type"]) for result in results] == [
+            ("WPT3", "resolved", "WAYPOINT"),
+            ("LFPG", "resolved", "AIRPORT"),
+            ("XXXXX", "not_found", None),
+        ]
+        assert results[1]["fix"]["cycle"] == "2601"
+        assert results[1]["fix"]["airport_id"] == "LFPG"
+        assert results[2]["fix"] is None
+
+    def test_one_query_per_table(self, api_client, cycle, django_assert_num_queries):
+        fixes = [f"WPT{index}" for index in range(10)] + ["LFPG", "PON"]
+
+        with django_assert_num_queries(3):
+            response = api_client.post("/navigation/resolve/", {"fixes": fixes}, format="json")
+
+        assert [result["status"] for result in response.data["results"]] == ["resolved"] * 11 + ["ambiguous"]
+
+    def test_ambiguous_without_reference_point(self, api_client, cycle):
+        response = api_client.post("/navigation/resolve/", {"fixes": ["PON"]}, format="json")
+
+        (result,) = response.data["results"]
+        assert result["status"] == "ambiguous"
+        assert result["fix"] is None
+        assert [candidate["type"] for candidate in result["candidates"]] == ["NAVAID", "WAYPOINT"]
+
+    @pytest.mark.parametrize("lat, lon, fix_type", [(48.8, 2.3, "NAVAID"), (40.6, -73.8, "WAYPOINT")])
+    def test_reference_point_picks_the_closest(self, api_client, cycle, lat, lon, fix_type):
+        response = api_client.post("/navigation/resolve/", {"fixes": ["PON"], "lat": lat, "lon": lon}, format="json")
+
+        (result,) = response.data["results"]
+        assert result["status"] == "resolved"
+        assert result["type"] == fix_type
+        assert result["distance_nm"] < 30
+        assert [candidate["type"] for candidate in result["candidates"]][0] == fix_type
+        assert len(result["candidates"]) == 2
+
+    def test_type_hint(self, api_client, cycle):
+        response = api_client.post(
+            "/navigation/resolve/", {"fixes": [{"identifier": "PON", "type": "waypoint"}]}, format="json"
+        )
+
+        (result,) = response.data["results"]
+        assert result["status"] == "resolved"
+        assert result["type"] == "WAYPOINT"
+        assert result["candidates"] == []
+
+    def test_type_hint_not_found(self, cycle):
+        assert resolve_fixes(cycle, [("LFPG", "NAVAID")])[0]["status"] == "not_found"
+
+    @pytest.mark.parametrize(
+        "body, field",
+        [
+            ({"fixes": []}, "fixes"),
+            ({"fixes": [{"identifier": "PON", "type": "RUNWAY"}]}, "fixes"),
+            ({"fixes": ["PON"], "lat": 48}, "non_field_errors"),
+        ],
+    )
+    def test_invalid_request(self, api_client, cycle, body, field):
+        response = api_client.post("/navigation/resolve/", body, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert field in response.data
+
+    def test_no_cycle(self, api_client):
+        response = api_client.post("/navigation/resolve/", {"fixes": ["PON"]}, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
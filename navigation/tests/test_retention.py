@@ -0,0 +1,189 @@
+import gzip
+import json
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from ..models import Airport, Airway, AirwaySegment, DataCycle, ProcedureLeg, ProcedureTransition, Waypoint
+from ..retention import PRUNE_ORDER, cycles_to_prune, prune_cycle
+from ..routing import GRAPH_CACHE_KEY
+from ..snapshots import write_snapshot
+from .test_exports import make_cycle
+
+RECORDS = {
+    "ProcedureLeg": 8,
+    "ProcedureTransition": 4,
+    "Procedure": 3,
+    "AirwaySegment": 6,
+    "Airway": 2,
+    "Airport": 2,
+    "Navaid": 2,
+    "Waypoint": 2,
+}
+
+
+@pytest.fixture
+def cycles():
+    cycles = {}
+    for index, cycle_id in enumerate(["2511", "2512", "2601", "2602"]):
+        cycle = make_cycle(cycle_id)
+        cycle.effective_date = date(2025, 11, 27) + timedelta(days=28 * index)
+        cycle.expiry_date = cycle.effective_date + timedelta(days=28)
+        cycle.save()
+        cycles[cycle_id] = cycle
+    return cycles
+
+
+def count_records(cycle_id):
+    return {model.__name__: model.objects.filter(**{lookup: cycle_id}).count() for model, lookup in PRUNE_ORDER}
+
+
+@pytest.mark.django_db
+class TestCyclesToPrune:
+    def test_keeps_active_upcoming_and_previous(self, cycles, settings):
+        settings.NAVIGATION_RETAINED_PREVIOUS_CYCLES = 1
+
+        assert cycles_to_prune(on=date(2026, 2, 1)) == [cycles["2511"]]
+
+    def test_keep_previous(self, cycles):
+        assert cycles_to_prune(on=date(2026, 2, 1), keep_previous=0) == [cycles["2511"], cycles["2512"]]
+        assert cycles_to_prune(on=date(2026, 2, 1), keep_previous=2) == []
+        assert cycles_to_prune(on=date(2026, 3, 1), keep_previous=0) == [cycles["2511"], cycles["2512"], cycles["2601"]]
+
+    @pytest.mark.parametrize("status", ["FAILED", "LOADING"])
+    def test_cycles_not_ready_do_not_take_the_place_of_previous(self, cycles, status):
+        # 2512 failed to load between the previous READY cycle, 2511, and the active one.
+        cycles["2512"].status = status
+        cycles["2512"].save()
+
+        assert cycles_to_prune(on=date(2026, 2, 1), keep_previous=1) == [cycles["2512"]]
+        assert cycles_to_prune(on=date(2026, 2, 1), keep_previous=0) == [cycles["2511"], cycles["2512"]]
+
+    def test_no_cycles(self):
+        assert cycles_to_prune(on=date(2026, 2, 1)) == []
+
+    def test_skips_cycles_being_loaded(self, cycles):
+        baker.make("data_processor.ArincFile", cycle=cycles["2511"], status="PROCESSING")
+
+        assert cycles_to_prune(on=date(2026, 2, 1), keep_previous=0) == [cycles["2512"]]
+
+
+@pytest.mark.django_db
+class TestPruneCycle:
+    def test_deletes_records_in_chunks(self, cycles):
+        arinc_file = baker.make("data_processor.ArincFile", cycle=cycles["2511"], status="COMPLETED")
+
+        result = prune_cycle(cycles["2511"], archive_dir="", chunk_size=2)
+
+        assert result == RECORDS
+        assert count_records("2511") == dict.fromkeys(RECORDS, 0)
+        assert count_records("2512") == RECORDS
+        assert not DataCycle.objects.filter(pk="2511").exists()
+        arinc_file.refresh_from_db()
+        assert arinc_file.cycle is None
+
+    def test_one_statement_per_chunk(self, cycles):
+        with CaptureQueriesContext(connection) as context:
+            prune_cycle(cycles["2511"], archive_dir="", chunk_size=3)
+
+        table = connection.ops.quote_name(ProcedureLeg._meta.db_table)
+        deletes = [
+            query["sql"] for query in context.captured_queries if query["sql"].startswith(f"DELETE FROM {table}")
+        ]
+        # 8 legs: 3, 3, then 2 and done.
+        assert len(deletes) == 3
+
+    def test_keeps_the_fix_references_of_other_cycles(self, cycles):
+        # Thousands of segments and legs of a retained cycle reference its fixes; deleting the pruned cycle's
+        # fixes checks them through the fix indexes (see benchmarks.bench_prune for the timings).
+        waypoint = Waypoint.objects.filter(cycle=cycles["2512"]).first()
+        airway = Airway.objects.filter(cycle=cycles["2512"]).first()
+        transition = ProcedureTransition.objects.filter(procedure__cycle=cycles["2512"]).first()
+        AirwaySegment.objects.bulk_create(
+            AirwaySegment(
+                airway=airway,
+                sequence_number=1000 + index,
+                fix_identifier=waypoint.waypoint_id,
+                fix_type="WAYPOINT",
+                fix_waypoint=waypoint,
+                next_fix_waypoint=waypoint,
+            )
+            for index in range(5000)
+        )
+        ProcedureLeg.objects.bulk_create(
+            ProcedureLeg(
+                transition=transition,
+                sequence_number=1000 + index,
+                waypoint_identifier=waypoint.waypoint_id,
+                waypoint_type="WAYPOINT",
+                latitude=waypoint.latitude,
+                longitude=waypoint.longitude,
+                fix_waypoint=waypoint,
+            )
+            for index in range(5000)
+        )
+
+        prune_cycle(cycles["2511"], archive_dir="", chunk_size=1)
+
+        assert count_records("2511") == dict.fromkeys(RECORDS, 0)
+        assert AirwaySegment.objects.filter(fix_waypoint=waypoint, next_fix_waypoint=waypoint).count() == 5000
+        assert ProcedureLeg.objects.filter(fix_waypoint=waypoint).count() == 5000
+
+    def test_archives_before_deleting(self, cycles, tmp_path):
+        result = prune_cycle(cycles["2511"], archive_dir=tmp_path / "archive")
+
+        assert result["archive"] == str(tmp_path / "archive" / "2511.ndjson.gz")
+        with gzip.open(result["archive"], "rt") as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0]["record"] == "cycle"
+        assert lines[0]["cycle_id"] == "2511"
+        assert [line["record"] for line in lines[1:]].count("procedure") == 3
+        assert len(lines) == 1 + 2 + 2 + 2 + 2 + 3
+        assert [path.name for path in (tmp_path / "archive").iterdir()] == ["2511.ndjson.gz"]
+
+    def test_archive_dir_setting(self, cycles, settings, tmp_path):
+        settings.NAVIGATION_ARCHIVE_DIR = str(tmp_path)
+
+        prune_cycle(cycles["2511"])
+
+        assert (tmp_path / "2511.ndjson.gz").exists()
+
+    def test_drops_derived_data(self, cycles, settings, tmp_path):
+        settings.NAVIGATION_SNAPSHOT_DIR = str(tmp_path / "snapshots")
+        write_snapshot(cycles["2511"])
+        cache.set(GRAPH_CACHE_KEY.format(cycle_id="2511"), "graph")
+
+        prune_cycle(cycles["2511"], archive_dir="")
+
+        assert not (tmp_path / "snapshots" / "2511").exists()
+        assert cache.get(GRAPH_CACHE_KEY.format(cycle_id="2511")) is None
+
+
+@pytest.mark.django_db
+class TestPruneCyclesCommand:
+    def test_dry_run(self, cycles, mocker):
+        mocker.patch("django.utils.timezone.localdate", return_value=date(2026, 2, 1))
+        out = StringIO()
+
+        call_command("prune_cycles", "--dry-run", "--keep-previous", "0", stdout=out)
+
+        assert "Would prune cycle 2511" in out.getvalue()
+        assert "Would prune cycle 2512" in out.getvalue()
+        assert DataCycle.objects.count() == 4
+
+    def test_prunes(self, cycles, mocker, tmp_path):
+        mocker.patch("django.utils.timezone.localdate", return_value=date(2026, 2, 1))
+        out = StringIO()
+
+        call_command("prune_cycles", "--archive-dir", str(tmp_path), stdout=out)
+
+        assert "Pruned cycle 2511" in out.getvalue()
+        assert f"Archived to {tmp_path / '2511.ndjson.gz'}" in out.getvalue()
+        assert sorted(DataCycle.objects.values_list("pk", flat=True)) == ["2512", "2601", "2602"]
+        assert Airport.objects.filter(cycle="2512").exists()
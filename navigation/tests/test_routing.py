@@ -0,0 +1,107 @@
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+
+from data_processor.parsers import BulkARINCParser
+from data_processor.tests.test_data import cycle_xml
+
+from ..routing import ALLOWED_MASKS, NO_MAXIMUM_ALTITUDE, ROUTE_TYPES, AirwayGraph, get_airway_graph
+
+JET, RNAV = ROUTE_TYPES.index("JETWAY"), ROUTE_TYPES.index("RNAV")
+
+
+@pytest.fixture
+def diamond():
+    """A to D either through B (shorter, low-level RNAV route R1) or C (jet route J1), plus an island E."""
+    keys = [("WAYPOINT", name) for name in "ABCDE"]
+    latitudes = [0.0, 0.0, 1.0, 0.0, 30.0]
+    longitudes = [0.0, 1.0, 1.0, 2.0, 30.0]
+    edges = [(0, 1, 0, 18000, RNAV, 1), (1, 3, 0, 18000, RNAV, 1), (0, 2, 0, NO_MAXIMUM_ALTITUDE, JET, 0)]
+    edges += [(2, 3, 0, NO_MAXIMUM_ALTITUDE, JET, 0)]
+    edges += [(target, source, *rest) for source, target, *rest in edges]
+    columns = list(zip(*edges, strict=True))
+    return AirwayGraph("TEST", keys, latitudes, longitudes, *columns, ["J1", "R1"])
+
+
+def identifiers(route):
+    return [fix["identifier"] for fix in route["fixes"]]
+
+
+class TestAirwayGraph:
+    def test_csr_layout(self, diamond):
+        assert diamond.indptr.tolist() == [0, 2, 4, 6, 8, 8]
+        assert sorted(diamond.targets[diamond.indptr[0] : diamond.indptr[1]].tolist()) == [1, 2]
+
+    def test_shortest_route(self, diamond):
+        route = diamond.find_route("A", "D")
+
+        assert identifiers(route) == ["A", "B", "D"]
+        assert [fix["airway"] for fix in route["fixes"]] == [None, "R1", "R1"]
+        assert route["distance_nm"] == pytest.approx(120.08, abs=0.01)
+
+    def test_altitude_limits(self, diamond):
+        assert identifiers(diamond.find_route("A", "D", altitude=35000)) == ["A", "C", "D"]
+
+    def test_route_type_filter(self, diamond):
+        assert identifiers(diamond.find_route("A", "D", route_types=["JETWAY"])) == ["A", "C", "D"]
+        assert diamond.find_route("A", "D", route_types=["VICTOR"]) is None
+
+    def test_unknown_or_unreachable_fix(self, diamond):
+        assert diamond.find_route("A", "NOWHERE") is None
+        assert diamond.find_route("A", "E") is None
+
+    def test_concurrent_searches_share_masks(self, diamond):
+        # Switching threads as often as possible interleaves the mask cache lookups and evictions.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                routes = list(pool.map(lambda altitude: diamond.find_route("A", "D", altitude=altitude), range(10000)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert all(identifiers(route) == ["A", "B", "D"] for route in routes)
+        assert len(diamond._allowed_masks) <= ALLOWED_MASKS
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make("DataCycle", status="READY")
+    BulkARINCParser(data_cycle=cycle).parse_file(ET.fromstring(cycle_xml))
+    return cycle
+
+
+@pytest.mark.django_db
+class TestRouteEndpoint:
+    def test_route_between_fixes(self, api_client, cycle):
+        response = api_client.get("/navigation/route/?origin=JFK&destination=KBOS")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert identifiers(response.data) == ["JFK", "MERIT", "KBOS"]
+        assert response.data["fixes"][1]["airway"] == "J75"
+
+    def test_airport_off_the_network_joins_at_closest_fix(self, api_client, cycle):
+        response = api_client.get("/navigation/route/?origin=KJFK&destination=KBOS")
+
+        assert identifiers(response.data) == ["KJFK", "JFK", "MERIT", "KBOS"]
+        assert response.data["fixes"][1]["distance_nm"] == pytest.approx(0.5, abs=0.1)
+
+    def test_altitude_below_airway_minimum(self, api_client, cycle):
+        response = api_client.get("/navigation/route/?origin=JFK&destination=KBOS&altitude=10000")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_rejects_unknown_route_type(self, api_client, cycle):
+        response = api_client.get("/navigation/route/?origin=JFK&destination=KBOS&route_types=JETWAY,TUBE")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_graph_is_built_once(self, cycle, django_assert_num_queries):
+        graph = get_airway_graph(cycle)
+
+        with django_assert_num_queries(0):
+            assert get_airway_graph(cycle) is graph
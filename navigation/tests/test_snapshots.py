@@ -0,0 +1,120 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+
+from data_processor.parsers import BulkARINCParser
+from data_processor.tests.test_data import cycle_xml
+
+from ..cycles import get_active_cycle
+from ..models import Airport, Airway, Procedure
+from ..snapshots import get_snapshot, write_snapshot
+
+
+@pytest.fixture
+def cycle():
+    cycle = baker.make("DataCycle", status="READY")
+    BulkARINCParser(data_cycle=cycle).parse_file(ET.fromstring(cycle_xml))
+    get_active_cycle()
+    return cycle
+
+
+@pytest.fixture
+def snapshot_dir(settings, tmp_path):
+    settings.NAVIGATION_SNAPSHOT_DIR = str(tmp_path / "snapshots")
+    settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT = 0
+    return tmp_path / "snapshots"
+
+
+def detail_urls(cycle):
+    airport = Airport.objects.get(cycle=cycle, airport_id="KJFK")
+    procedure = Procedure.objects.filter(cycle=cycle).first()
+    airway = Airway.objects.filter(cycle=cycle).first()
+    return [
+        f"/navigation/airports/{airport.pk}/",
+        f"/navigation/airports/{airport.pk}/procedures/",
+        f"/navigation/navaids/{cycle.navaid_set.first().pk}/",
+        f"/navigation/waypoints/{cycle.waypoint_set.first().pk}/",
+        f"/navigation/procedures/{procedure.pk}/",
+        f"/navigation/procedures/{procedure.pk}/legs/",
+        f"/navigation/airways/{airway.pk}/",
+        f"/navigation/airways/{airway.pk}/segments/",
+    ]
+
+
+@pytest.mark.django_db
+class TestSnapshots:
+    def test_disabled_without_directory(self, cycle, settings):
+        settings.NAVIGATION_SNAPSHOT_DIR = ""
+
+        assert get_snapshot(cycle) is None
+
+    def test_missing_snapshot(self, cycle, snapshot_dir):
+        assert get_snapshot(cycle) is None
+
+    def test_responses_match_database(self, api_client, cycle, snapshot_dir):
+        urls = detail_urls(cycle)
+        expected = [api_client.get(url).content for url in urls]
+
+        write_snapshot(cycle)
+
+        assert [api_client.get(url).content for url in urls] == expected
+
+    def test_served_without_queries(self, api_client, cycle, snapshot_dir, django_assert_num_queries):
+        urls = detail_urls(cycle)
+        write_snapshot(cycle)
+
+        with django_assert_num_queries(0):
+            for url in urls:
+                assert api_client.get(url).status_code == status.HTTP_200_OK
+
+    def test_unknown_record_falls_back_to_database(self, api_client, cycle, snapshot_dir):
+        write_snapshot(cycle)
+
+        response = api_client.get("/navigation/airports/999999/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_rewritten_snapshot_is_reopened(self, cycle, snapshot_dir):
+        write_snapshot(cycle)
+        airport = Airport.objects.get(cycle=cycle, airport_id="KJFK")
+        assert get_snapshot(cycle).get("airports", airport.pk)["name"] == airport.name
+
+        Airport.objects.filter(pk=airport.pk).update(name="RENAMED")
+        write_snapshot(cycle)
+
+        assert get_snapshot(cycle).get("airports", airport.pk)["name"] == "RENAMED"
+        assert [path.name for path in snapshot_dir.iterdir()] == [cycle.cycle_id]
+
+    def test_children_of_parents_stored_out_of_id_order(self, api_client, snapshot_dir, django_assert_num_queries):
+        # Transitions are stored grouped by procedure; with ids interleaved across procedures, their legs are not.
+        cycle = baker.make("DataCycle", status="READY")
+        airport = baker.make("Airport", cycle=cycle)
+        first, second = baker.make("Procedure", cycle=cycle, airport=airport, _quantity=2)
+        for procedure, transition_id in ((first, "T1"), (second, "T2"), (first, "T3")):
+            transition = baker.make("ProcedureTransition", procedure=procedure, transition_id=transition_id)
+            for sequence_number in (10, 20):
+                baker.make(
+                    "ProcedureLeg",
+                    transition=transition,
+                    sequence_number=sequence_number,
+                    waypoint_identifier=f"{transition_id}{sequence_number}",
+                )
+        assert get_active_cycle() == cycle
+        urls = [f"/navigation/procedures/{procedure.pk}/legs/" for procedure in (first, second)]
+        expected = [api_client.get(url).content for url in urls]
+
+        write_snapshot(cycle)
+
+        with django_assert_num_queries(0):
+            assert [api_client.get(url).content for url in urls] == expected
+        legs = get_snapshot(cycle).related("procedures", first.pk, "transitions")[1]["legs"]
+        assert [leg["waypoint_identifier"] for leg in legs] == ["T310", "T320"]
+
+    def test_empty_cycle(self, snapshot_dir):
+        cycle = baker.make("DataCycle", status="READY")
+
+        write_snapshot(cycle)
+
+        assert get_snapshot(cycle).get("airports", 1) is None
@@ -0,0 +1,127 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from model_bakery import baker
+from rest_framework import status
+
+from ..models import Waypoint
+from ..spatial import bbox_q, great_circle_distance, grid_cell, radius_q
+
+
+@pytest.fixture
+def cycle():
+    return baker.make("DataCycle", effective_date=date(2025, 1, 23), status="READY")
+
+
+def make_waypoint(cycle, waypoint_id, latitude, longitude):
+    return baker.make(
+        "Waypoint", cycle=cycle, waypoint_id=waypoint_id, latitude=Decimal(latitude), longitude=Decimal(longitude)
+    )
+
+
+class TestGrid:
+    def test_grid_cell(self):
+        assert grid_cell(-90, -180) == 0
+        assert grid_cell(Decimal("40.6398"), Decimal("-73.7789")) == 130 * 360 + 106
+        assert grid_cell(90, 180) == 179 * 360
+
+    def test_great_circle_distance(self):
+        # JFK to LHR on the spherical earth.
+        assert great_circle_distance(40.6398, -73.7789, 51.4700, -0.4543) == pytest.approx(2991.5, abs=0.5)
+
+    def test_distance_across_antimeridian(self):
+        assert great_circle_distance(0, 179.5, 0, -179.5) == pytest.approx(60.04, abs=0.01)
+
+
+@pytest.mark.django_db
+class TestSpatialQueries:
+    def test_bbox_crossing_antimeridian(self, cycle):
+        make_waypoint(cycle, "EAST", "-17.0", "179.5")
+        make_waypoint(cycle, "WEST", "-17.0", "-179.5")
+        make_waypoint(cycle, "AWAY", "-17.0", "0.0")
+
+        found = Waypoint.objects.filter(bbox_q(-18, 179, -16, -179))
+
+        assert sorted(found.values_list("waypoint_id", flat=True)) == ["EAST", "WEST"]
+
+    def test_bbox_to_antimeridian(self, cycle):
+        make_waypoint(cycle, "EDGE", "5.0", "180.0")
+        make_waypoint(cycle, "ANTI", "5.0", "-180.0")
+        make_waypoint(cycle, "EAST", "5.0", "179.5")
+        make_waypoint(cycle, "WEST", "5.0", "-179.5")
+
+        found = Waypoint.objects.filter(bbox_q(0, 170, 10, 180))
+
+        assert sorted(found.values_list("waypoint_id", flat=True)) == ["ANTI", "EAST", "EDGE"]
+
+    def test_radius_near_pole_covers_all_longitudes(self, cycle):
+        make_waypoint(cycle, "POLE", "89.9", "-170.0")
+
+        assert Waypoint.objects.filter(radius_q(89.9, 10.0, 30)).exists()
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Query plans are asserted for SQLite")
+    def test_bbox_searches_grid_index(self, cycle):
+        plan = Waypoint.objects.filter(cycle=cycle).filter(bbox_q(40, -75, 42, -72)).explain()
+
+        assert "waypoint_grid_cell_idx" in plan
+        assert "SCAN" not in plan
+
+
+@pytest.mark.django_db
+class TestSpatialEndpoints:
+    def test_nearest_sorted_by_distance(self, api_client, cycle):
+        make_waypoint(cycle, "FAR", "40.9", "-73.7789")
+        make_waypoint(cycle, "NEAR", "40.7", "-73.7789")
+        make_waypoint(cycle, "OUT", "45.0", "-73.7789")
+
+        response = api_client.get("/navigation/waypoints/nearest/?lat=40.6398&lon=-73.7789&radius=50")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["waypoint_id"] for row in response.data] == ["NEAR", "FAR"]
+        assert response.data[0]["distance_nm"] == pytest.approx(3.61, abs=0.01)
+
+    def test_nearest_across_antimeridian(self, api_client, cycle):
+        make_waypoint(cycle, "WEST", "-17.0", "-179.9")
+
+        response = api_client.get("/navigation/waypoints/nearest/?lat=-17.0&lon=179.9&radius=20")
+
+        assert [row["waypoint_id"] for row in response.data] == ["WEST"]
+
+    def test_nearest_limit(self, api_client, cycle):
+        for i in range(5):
+            make_waypoint(cycle, f"WP{i}", f"10.{i}", "10.0")
+
+        response = api_client.get("/navigation/waypoints/nearest/?lat=10&lon=10&radius=100&limit=2")
+
+        assert [row["waypoint_id"] for row in response.data] == ["WP0", "WP1"]
+
+    def test_nearest_requires_coordinates(self, api_client, cycle):
+        response = api_client.get("/navigation/airports/nearest/?lat=91")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data) == {"lat", "lon"}
+
+    def test_bbox_is_paginated(self, api_client, cycle):
+        for i in range(3):
+            baker.make("Navaid", cycle=cycle, navaid_id=f"NAV{i}", latitude=Decimal("50.5"), longitude=Decimal("8.5"))
+
+        response = api_client.get("/navigation/navaids/bbox/?min_lat=50&min_lon=8&max_lat=51&max_lon=9&page_size=2")
+
+        assert [row["navaid_id"] for row in response.json()["results"]] == ["NAV0", "NAV1"]
+        assert response.json()["next"] is not None
+
+    def test_bbox_of_eastern_hemisphere(self, api_client, cycle):
+        make_waypoint(cycle, "EDGE", "5.0", "180.0")
+        make_waypoint(cycle, "EAST", "5.0", "90.0")
+        make_waypoint(cycle, "WEST", "5.0", "-90.0")
+
+        response = api_client.get("/navigation/waypoints/bbox/?min_lat=0&min_lon=0&max_lat=10&max_lon=180")
+
+        assert sorted(row["waypoint_id"] for row in response.json()["results"]) == ["EAST", "EDGE"]
+
+    def test_bbox_rejects_inverted_latitudes(self, api_client, cycle):
+        response = api_client.get("/navigation/airports/bbox/?min_lat=51&min_lon=8&max_lat=50&max_lon=9")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
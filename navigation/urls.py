@@ -1,6 +1,7 @@
+from django.urls import path
 from rest_framework import routers
 
-from . import views
+from . import async_views, views
 
 
 router = routers.DefaultRouter()
@@ -9,5 +10,20 @@ router.register("navaids", views.NavaidViewSet, basename="navaid")
 router.register("procedures", views.ProcedureViewSet, basename="procedure")
 router.register("waypoints", views.WaypointViewSet, basename="waypoint")
 router.register("airways", views.AirwayViewSet, basename="airway")
+router.register("route", views.RouteViewSet, basename="route")
+router.register("resolve", views.ResolveViewSet, basename="resolve")
+router.register("export", views.ExportViewSet, basename="export")
 
 urlpatterns = router.urls
+
+# Async read views of the same records, for serving under ASGI.
+for prefix, viewset in [
+    ("airports", views.AirportViewSet),
+    ("navaids", views.NavaidViewSet),
+    ("waypoints", views.WaypointViewSet),
+]:
+    urlpatterns += [
+        path(f"async/{prefix}/", async_views.AsyncRecordListView.as_view(viewset_class=viewset)),
+        path(f"async/{prefix}/nearest/", async_views.AsyncNearestView.as_view(viewset_class=viewset)),
+        path(f"async/{prefix}/<int:pk>/", async_views.AsyncRecordDetailView.as_view(viewset_class=viewset)),
+    ]
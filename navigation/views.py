@@ -1,9 +1,26 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Count, Prefetch
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.negotiation import BaseContentNegotiation
 from rest_framework.response import Response
-from rest_framework.viewsets import ReadOnlyModelViewSet
+from rest_framework.viewsets import GenericViewSet, ReadOnlyModelViewSet
 
+from navigation import spatial
+from navigation.caching import cache_response, conditional_response, response_cache_key
+from navigation.cycles import aget_active_cycle, get_active_cycle
+from navigation.encoders import JSON_MEDIA_TYPE, RowEncoder, encode_procedure_transitions
+from navigation.exports import CONTENT_TYPES, astream_export, stream_export
 from navigation.models import Airport, DataCycle, Navaid, Procedure, ProcedureTransition, ProcedureLeg, Waypoint, Airway
+from navigation.pagination import NaturalKeyCursorPagination
+from navigation.resolver import resolve_fixes
+from navigation.routing import get_airway_graph
+from navigation.snapshots import get_snapshot
 from navigation.serializers import (
     AirportSerializer,
     ProcedureSerializer,
@@ -12,73 +29,355 @@ from navigation.serializers import (
     WaypointSerializer,
     AirwaySerializer,
     AirwaySegmentSerializer,
+    BoundingBoxQuerySerializer,
+    ExportQuerySerializer,
+    NearestQuerySerializer,
+    ResolveRequestSerializer,
+    RouteQuerySerializer,
 )
 
 
 class LatestCycleQueryMixin:
+    pagination_class = NaturalKeyCursorPagination
+    paginated_actions = ("list", "bbox")
+
     def get_latest_cycle(self):
-        return DataCycle.objects.order_by("-effective_date").first()
+        # Resolved once per request; the active cycle itself is cached across requests.
+        if not hasattr(self, "_latest_cycle"):
+            self._latest_cycle = get_active_cycle()
+            cursor_cycle_id = self.get_cursor_cycle_id()
+            if cursor_cycle_id is not None and cursor_cycle_id != getattr(self._latest_cycle, "pk", None):
+                # Keep paging through the cycle the first page was read from.
+                self._latest_cycle = DataCycle.objects.filter(pk=cursor_cycle_id, status="READY").first()
+                if self._latest_cycle is None:
+                    raise NotFound("The data cycle of this cursor is no longer available.")
+        return self._latest_cycle
+
+    async def aget_latest_cycle(self):
+        """Async version of ``get_latest_cycle``; the cached active cycle is read without leaving the event loop."""
+        if not hasattr(self, "_latest_cycle"):
+            cycle = await aget_active_cycle()
+            if self.get_cursor_cycle_id() in (None, getattr(cycle, "pk", None)):
+                self._latest_cycle = cycle
+            else:
+                await sync_to_async(self.get_latest_cycle)()
+        return self._latest_cycle
+
+    def get_cursor_cycle_id(self):
+        if getattr(self, "action", None) not in self.paginated_actions:
+            return None
+        if not isinstance(self.paginator, NaturalKeyCursorPagination):
+            return None
+        return self.paginator.get_cursor_cycle_id(self.request)
 
     def filter_by_latest_cycle(self, queryset):
         return queryset.filter(cycle=self.get_latest_cycle())
 
 
-class AirportViewSet(LatestCycleQueryMixin, ReadOnlyModelViewSet):
+class CachedResponseMixin:
+    """
+    Caches the rendered GET responses of a viewset per data cycle, see ``navigation.caching``.
+
+    Responses carry a strong ``ETag`` and ``Cache-Control``. A cached response, or a 304 when the client's
+    ``If-None-Match`` matches it, is returned without running the action. Only successful responses are cached.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.response_cache_key = self.get_response_cache_key(request)
+        entry = cache.get(self.response_cache_key) if self.response_cache_key is not None else None
+        if entry is not None:
+            self.response_cache_key = None
+            # DRF looks the handler up after ``initial``, so this answers the request instead of the action.
+            setattr(self, request.method.lower(), lambda *args, **kwargs: conditional_response(request, entry))
+
+    def get_response_cache_key(self, request):
+        """Return the cache key of the response to a request, or ``None`` when it is not cached."""
+        if request.method not in ("GET", "HEAD") or settings.NAVIGATION_RESPONSE_CACHE_TIMEOUT <= 0:
+            return None
+        cycle = self.get_latest_cycle()
+        if cycle is None:
+            return None
+        return response_cache_key(cycle.pk, request.accepted_media_type, request.path, request.query_params)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "response_cache_key", None) is None or response.status_code != status.HTTP_200_OK:
+            return response
+        if isinstance(response, Response):
+            response.render()
+        entry = cache_response(self.response_cache_key, response.content, response["Content-Type"])
+        return conditional_response(request, entry, response)
+
+
+class SnapshotQueryMixin:
+    """
+    Serves lookups by id from the memory-mapped snapshot of the cycle when there is one.
+
+    Records the snapshot doesn't have fall through to the database, which answers them as before.
+    """
+
+    snapshot_table = None
+
+    def get_snapshot(self):
+        return get_snapshot(self.get_latest_cycle())
+
+    def retrieve(self, request, *args, **kwargs):
+        row = self.get_snapshot_row(kwargs["pk"])
+        if row is None:
+            return super().retrieve(request, *args, **kwargs)
+        return Response(row, status=status.HTTP_200_OK)
+
+    def get_snapshot_row(self, pk):
+        snapshot = self.get_snapshot()
+        return snapshot.get(self.snapshot_table, pk) if snapshot is not None else None
+
+    def get_snapshot_related(self, relation):
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None
+        return snapshot.related(self.snapshot_table, self.kwargs["pk"], relation)
+
+
+class EncodedListMixin:
+    """
+    Renders JSON list pages from ``values_list`` rows with a ``RowEncoder`` instead of the serializer.
+
+    The output is the same as the serializer's; other media types (e.g. the browsable API) use the serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.get_list_response(self.get_queryset())
+
+    def get_list_response(self, queryset):
+        if self.request.accepted_media_type != JSON_MEDIA_TYPE:
+            page = self.paginate_queryset(queryset)
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        encoder = self.get_row_encoder()
+        page = self.paginate_queryset(queryset.values_list(*encoder.columns, named=True))
+        return self.paginator.get_encoded_paginated_response(encoder.encode(page))
+
+    @classmethod
+    def get_row_encoder(cls):
+        if "_row_encoder" not in cls.__dict__:
+            cls._row_encoder = RowEncoder(cls.serializer_class)
+        return cls._row_encoder
+
+
+class SpatialQueryMixin:
+    """
+    Adds ``nearest`` and ``bbox`` list actions to viewsets of ``GridIndexed`` models.
+
+    ``bbox`` pages are rendered by ``EncodedListMixin.get_list_response``.
+    """
+
+    @action(detail=False, methods=["get"])
+    def nearest(self, request):
+        params = NearestQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        found = spatial.nearest(
+            self.get_queryset(),
+            params.validated_data["lat"],
+            params.validated_data["lon"],
+            params.validated_data["radius"],
+            params.validated_data["limit"],
+        )
+        data = self.get_serializer([record for record, _ in found], many=True).data
+        for row, (_, distance) in zip(data, found, strict=True):
+            row["distance_nm"] = round(distance, 3)
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def bbox(self, request):
+        params = BoundingBoxQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return self.get_list_response(self.get_queryset().filter(spatial.bbox_q(**params.validated_data)))
+
+
+class AirportViewSet(
+    CachedResponseMixin,
+    LatestCycleQueryMixin,
+    SnapshotQueryMixin,
+    EncodedListMixin,
+    SpatialQueryMixin,
+    ReadOnlyModelViewSet,
+):
     serializer_class = AirportSerializer
+    snapshot_table = "airports"
+    ordering = "airport_id"
 
     def get_queryset(self):
         return self.filter_by_latest_cycle(Airport.objects.all())
 
     @action(detail=True, methods=["get"])
     def procedures(self, request, pk=None):
-        airport = self.get_object()
-        procedures = airport.procedures
-        if not procedures.exists():
+        data = self.get_snapshot_related("procedures")
+        if data is None:
+            airport = self.get_object()
+            data = ProcedureSerializer(airport.procedures.all(), many=True).data
+        if not data:
             return Response({"detail": "No procedures found for this airport."}, status=status.HTTP_404_NOT_FOUND)
-        serializer = ProcedureSerializer(procedures, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
 
 
-class NavaidViewSet(LatestCycleQueryMixin, ReadOnlyModelViewSet):
+class NavaidViewSet(
+    CachedResponseMixin,
+    LatestCycleQueryMixin,
+    SnapshotQueryMixin,
+    EncodedListMixin,
+    SpatialQueryMixin,
+    ReadOnlyModelViewSet,
+):
     serializer_class = NavaidSerializer
+    snapshot_table = "navaids"
+    ordering = "navaid_id"
 
     def get_queryset(self):
         return self.filter_by_latest_cycle(Navaid.objects.all())
 
 
-class ProcedureViewSet(LatestCycleQueryMixin, ReadOnlyModelViewSet):
+class ProcedureViewSet(CachedResponseMixin, LatestCycleQueryMixin, SnapshotQueryMixin, ReadOnlyModelViewSet):
     serializer_class = ProcedureSerializer
+    snapshot_table = "procedures"
+    ordering = ("airport_id", "procedure_id")
 
     def get_queryset(self):
         return self.filter_by_latest_cycle(Procedure.objects.all())
 
     @action(detail=True, methods=["get"])
     def legs(self, request, pk=None):
-        transitions = ProcedureTransition.objects.filter(procedure__id=pk)
-        if not transitions.exists():
+        data = self.get_snapshot_related("transitions")
+        if data is None and request.accepted_media_type == JSON_MEDIA_TYPE:
+            content = encode_procedure_transitions(self.get_latest_cycle(), pk)
+            if content is not None:
+                return HttpResponse(content, content_type=JSON_MEDIA_TYPE)
+            data = []
+        if data is None:
+            transitions = (
+                ProcedureTransition.objects.filter(procedure__cycle=self.get_latest_cycle(), procedure__id=pk)
+                .order_by("id")
+                .prefetch_related(Prefetch("legs", queryset=ProcedureLeg.objects.order_by("sequence_number")))
+            )
+            data = ProcedureTransitionSerializer(transitions, many=True).data
+        if not data:
             return Response({"detail": "No transitions found for this procedure."}, status=status.HTTP_404_NOT_FOUND)
-        serializer = ProcedureTransitionSerializer(transitions, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
 
 
-class WaypointViewSet(LatestCycleQueryMixin, ReadOnlyModelViewSet):
+class WaypointViewSet(
+    CachedResponseMixin,
+    LatestCycleQueryMixin,
+    SnapshotQueryMixin,
+    EncodedListMixin,
+    SpatialQueryMixin,
+    ReadOnlyModelViewSet,
+):
     serializer_class = WaypointSerializer
+    snapshot_table = "waypoints"
+    ordering = "waypoint_id"
 
     def get_queryset(self):
         return self.filter_by_latest_cycle(Waypoint.objects.all())
 
 
-class AirwayViewSet(LatestCycleQueryMixin, ReadOnlyModelViewSet):
+class AirwayViewSet(CachedResponseMixin, LatestCycleQueryMixin, SnapshotQueryMixin, ReadOnlyModelViewSet):
     serializer_class = AirwaySerializer
+    snapshot_table = "airways"
+    ordering = "airway_id"
 
     def get_queryset(self):
-        return self.filter_by_latest_cycle(Airway.objects.all())
+        return self.filter_by_latest_cycle(Airway.objects.annotate(segments_count=Count("segments")))
 
     @action(detail=True, methods=["get"])
     def segments(self, request, pk=None):
-        airway = self.get_object()
-        segments = airway.segments
-        if not segments.exists():
+        data = self.get_snapshot_related("segments")
+        if data is None:
+            airway = self.get_object()
+            data = AirwaySegmentSerializer(airway.segments.all(), many=True).data
+        if not data:
             return Response({"detail": "No segments found for this airway."}, status=status.HTTP_404_NOT_FOUND)
-        serializer = AirwaySegmentSerializer(segments, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class RouteViewSet(CachedResponseMixin, LatestCycleQueryMixin, GenericViewSet):
+    pagination_class = None
+
+    def list(self, request):
+        params = RouteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        cycle = self.get_latest_cycle()
+        if cycle is None:
+            return Response({"detail": "No data cycle loaded."}, status=status.HTTP_404_NOT_FOUND)
+        route = get_airway_graph(cycle).find_route(
+            params.validated_data["origin"],
+            params.validated_data["destination"],
+            altitude=params.validated_data.get("altitude"),
+            route_types=params.validated_data.get("route_types"),
+        )
+        if route is None:
+            return Response({"detail": "No route found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {
+                "cycle": cycle.pk,
+                "origin": params.validated_data["origin"],
+                "destination": params.validated_data["destination"],
+                **route,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class ResolveViewSet(LatestCycleQueryMixin, GenericViewSet):
+    pagination_class = None
+
+    def create(self, request):
+        params = ResolveRequestSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        cycle = self.get_latest_cycle()
+        if cycle is None:
+            return Response({"detail": "No data cycle loaded."}, status=status.HTTP_404_NOT_FOUND)
+        reference = None
+        if "lat" in params.validated_data:
+            reference = (params.validated_data["lat"], params.validated_data["lon"])
+        fixes = [(fix["identifier"], fix.get("type")) for fix in params.validated_data["fixes"]]
+        return Response(
+            {"cycle": cycle.pk, "results": resolve_fixes(cycle, fixes, reference)},
+            status=status.HTTP_200_OK,
+        )
+
+
+class ExportContentNegotiation(BaseContentNegotiation):
+    """Ignore the ``Accept`` header: the export format is picked by the ``output`` parameter."""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class ExportViewSet(LatestCycleQueryMixin, GenericViewSet):
+    # Not cached: the export is streamed from the database and can be far larger than a cache entry.
+    pagination_class = None
+    content_negotiation_class = ExportContentNegotiation
+
+    def list(self, request):
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        if "cycle" in params.validated_data:
+            cycle = DataCycle.objects.filter(cycle_id=params.validated_data["cycle"], status="READY").first()
+        else:
+            cycle = self.get_latest_cycle()
+        if cycle is None:
+            return Response({"detail": "No data cycle loaded."}, status=status.HTTP_404_NOT_FOUND)
+
+        output, records, compress = (params.validated_data[name] for name in ("output", "records", "gzip"))
+        filename = f"{cycle.cycle_id}-{'-'.join(records) if len(records) < len(params.RECORDS) else 'all'}.{output}"
+        # Each server streams only the matching kind of iterator; it would read the other one whole first.
+        export = astream_export if isinstance(request._request, ASGIRequest) else stream_export
+        response = StreamingHttpResponse(
+            export(cycle, records, output=output, compress=compress),
+            content_type="application/gzip" if compress else CONTENT_TYPES[output],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}{".gz" if compress else ""}"'
+        return response